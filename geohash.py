@@ -18,8 +18,14 @@ You should have received a copy of the GNU Affero General Public
 License along with Geohash.  If not, see
 <http://www.gnu.org/licenses/>.
 """
+from importlib.util import find_spec
 from math import log10
 
+# numba is only imported, and the native decoder compiled, on the first
+# decode; loading this module never pays for it. Cleared if numba turns out
+# to be unusable, so later decodes stay on the pure-Python loop.
+NUMBA_AVAILABLE = find_spec('numba') is not None
+
 #  Note: the alphabet in geohash differs from the common base32
 #  alphabet described in IETF's RFC 4648
 #  (http://tools.ietf.org/html/rfc4648)
@@ -28,6 +34,66 @@ __decodemap = { }
 for i in range(len(__base32)):
     __decodemap[__base32[i]] = i
 del i
+__alphabet = frozenset(__base32)
+
+_numba_decoder = None
+
+def numba_decode(geohash):
+    """
+    Native version of decode_exactly, returning the same four values.
+    Expects a geohash that has already been checked against the geohash
+    alphabet. numba is imported and the decoder compiled on the first
+    call; raises ImportError if numba is not installed.
+    """
+    global _numba_decoder
+    if _numba_decoder is None:
+        _numba_decoder = _build_numba_decoder()
+    return _numba_decoder(geohash)
+
+def _build_numba_decoder():
+    from numba import njit
+
+    @njit
+    def base32_to_int(c):
+        # Arithmetic form of __decodemap; the alphabet skips a, i, l and o
+        o = ord(c)
+        if o <= 57:     # 0-9
+            return o - 48
+        if o <= 104:    # b-h
+            return o - 88
+        if o <= 107:    # j-k
+            return o - 89
+        if o <= 110:    # m-n
+            return o - 90
+        return o - 91   # p-z
+
+    @njit
+    def decode(geohash):
+        lat_lo, lat_hi = -90.0, 90.0
+        lon_lo, lon_hi = -180.0, 180.0
+        lat_err, lon_err = 90.0, 180.0
+        is_even = True
+        for c in geohash:
+            cd = base32_to_int(c)
+            mask = 16
+            while mask:
+                if is_even: # adds longitude info
+                    lon_err /= 2
+                    if cd & mask:
+                        lon_lo = (lon_lo+lon_hi)/2
+                    else:
+                        lon_hi = (lon_lo+lon_hi)/2
+                else:      # adds latitude info
+                    lat_err /= 2
+                    if cd & mask:
+                        lat_lo = (lat_lo+lat_hi)/2
+                    else:
+                        lat_hi = (lat_lo+lat_hi)/2
+                is_even = not is_even
+                mask >>= 1
+        return (lat_lo + lat_hi) / 2, (lon_lo + lon_hi) / 2, lat_err, lon_err
+
+    return decode
 
 def decode_exactly(geohash):
     """
@@ -37,6 +103,14 @@ def decode_exactly(geohash):
     number) and the plus/minus error for longitude (as a positive
     number).
     """
+    global NUMBA_AVAILABLE
+    # Invalid characters take the pure-Python path so they still raise KeyError
+    if NUMBA_AVAILABLE and __alphabet.issuperset(geohash):
+        try:
+            return numba_decode(geohash)
+        except Exception:
+            # A broken numba install; fall back for good
+            NUMBA_AVAILABLE = False
     lat_interval, lon_interval = (-90.0, 90.0), (-180.0, 180.0)
     lat_err, lon_err = 90.0, 180.0
     is_even = True
@@ -32,6 +32,8 @@ import re
 import math
 import itertools
 import logging
+import threading
+from functools import lru_cache
 
 HAVE_OSR = False
 # Force using proj for transformations by setting MGRSPY_USE_PROJ env var
@@ -136,6 +138,60 @@ def _log_proj_crs(proj_crs, proj_desc='', espg=''):
         proj_desc, espg, os.linesep, definition))
 
 
+# Transformer construction dominates a single-point transform, and MGRS/UPS
+# only ever use a handful of EPSG pairs, so transformers are cached. Neither
+# pyproj Transformers nor osr CoordinateTransformations are thread-safe, so
+# the calling thread is part of the cache key.
+TRANSFORMER_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=TRANSFORMER_CACHE_SIZE)
+def _cached_transformer(epsg_src, epsg_dst, always_xy, thread_id):
+    """ Builds the pyproj Transformer for one EPSG pair and calling thread.
+    Because the result is cached, the _log_proj_crs debug output for the
+    pair only appears the first time its transformer is built.
+    """
+    crs_src = CRS.from_epsg(epsg_src)
+    _log_proj_crs(crs_src, proj_desc='src', espg=epsg_src)
+    crs_dst = CRS.from_epsg(epsg_dst)
+    _log_proj_crs(crs_dst, proj_desc='dst', espg=epsg_dst)
+    return Transformer.from_crs(crs_src, crs_dst, always_xy=always_xy)
+
+
+@lru_cache(maxsize=TRANSFORMER_CACHE_SIZE)
+def _cached_osr_transformation(epsg_src, epsg_dst, polar, thread_id):
+    """ Builds the osr CoordinateTransformation for one EPSG pair and calling
+    thread, returned together with the PROJ 6+ axis-order flag. As with
+    _cached_transformer, _log_proj_crs only logs on the first build.
+    """
+    src = osr.SpatialReference()
+    # Check if we are using osgeo.osr linked against PROJ 6+
+    # If so, input axis ordering needs honored per projection, even though
+    #   OAMS_TRADITIONAL_GIS_ORDER should fix it (doesn't seem to work for UPS)
+    # See GDAL/OGR migration guide for 2.4 to 3.0
+    # https://github.com/OSGeo/gdal/blob/master/gdal/MIGRATION_GUIDE.TXT and
+    # https://trac.osgeo.org/gdal/wiki/rfc73_proj6_wkt2_srsbarn#Axisorderissues
+    osr_proj6 = hasattr(src, 'SetAxisMappingStrategy')
+    if not polar and osr_proj6:
+        src.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+    src.ImportFromEPSG(epsg_src)
+    _log_proj_crs(src, proj_desc='src', espg=epsg_src)
+    dst = osr.SpatialReference()
+    if not polar and osr_proj6:
+        dst.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+    dst.ImportFromEPSG(epsg_dst)
+    _log_proj_crs(dst, proj_desc='dst', espg=epsg_dst)
+    return osr.CoordinateTransformation(src, dst), osr_proj6
+
+
+def clear_transformer_cache():
+    """ Drops all cached coordinate transformers, e.g. after the PROJ
+    database or search paths have changed.
+    """
+    _cached_transformer.cache_clear()
+    _cached_osr_transformation.cache_clear()
+
+
 def _transform_proj(x1, y1, epsg_src, epsg_dst, polar=False):
     if PYPROJ_VER == 1:
         proj_src = Proj(init='epsg:{0}'.format(epsg_src))
@@ -146,11 +202,8 @@ def _transform_proj(x1, y1, epsg_src, epsg_dst, polar=False):
     elif PYPROJ_VER == 2:
         # With PROJ 6+ input axis ordering needs honored per projection, even
         #   though always_xy should fix it (doesn't seem to work for UPS)
-        crs_src = CRS.from_epsg(epsg_src)
-        _log_proj_crs(crs_src, proj_desc='src', espg=epsg_src)
-        crs_dst = CRS.from_epsg(epsg_dst)
-        _log_proj_crs(crs_dst, proj_desc='dst', espg=epsg_dst)
-        ct = Transformer.from_crs(crs_src, crs_dst, always_xy=(not polar))
+        ct = _cached_transformer(
+            epsg_src, epsg_dst, not polar, threading.get_ident())
         if polar:
             y2, x2 = ct.transform(y1, x1)
         else:
@@ -162,24 +215,8 @@ def _transform_proj(x1, y1, epsg_src, epsg_dst, polar=False):
 
 
 def _transform_osr(x1, y1, epsg_src, epsg_dst, polar=False):
-    src = osr.SpatialReference()
-    # Check if we are using osgeo.osr linked against PROJ 6+
-    # If so, input axis ordering needs honored per projection, even though
-    #   OAMS_TRADITIONAL_GIS_ORDER should fix it (doesn't seem to work for UPS)
-    # See GDAL/OGR migration guide for 2.4 to 3.0
-    # https://github.com/OSGeo/gdal/blob/master/gdal/MIGRATION_GUIDE.TXT and
-    # https://trac.osgeo.org/gdal/wiki/rfc73_proj6_wkt2_srsbarn#Axisorderissues
-    osr_proj6 = hasattr(src, 'SetAxisMappingStrategy')
-    if not polar and osr_proj6:
-        src.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-    src.ImportFromEPSG(epsg_src)
-    _log_proj_crs(src, proj_desc='src', espg=epsg_src)
-    dst = osr.SpatialReference()
-    if not polar and osr_proj6:
-        dst.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
-    dst.ImportFromEPSG(epsg_dst)
-    _log_proj_crs(dst, proj_desc='dst', espg=epsg_dst)
-    ct = osr.CoordinateTransformation(src, dst)
+    ct, osr_proj6 = _cached_osr_transformation(
+        epsg_src, epsg_dst, polar, threading.get_ident())
     if polar and osr_proj6:
         # only supported with osgeo.osr v3.0.0+
         y2, x2, _ = ct.TransformPoint(y1, x1)
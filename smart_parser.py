@@ -28,6 +28,31 @@ except ImportError:
     from util import epsg4326, tr
     from settings import CoordOrder
 
+# Format-recognition patterns, compiled once at import time
+_WHITESPACE_RE = re.compile(r"\s+")
+_SRID_RE = re.compile(r"SRID=(\d+)")
+_MGRS_RE = re.compile(r"^\d{1,2}[C-HJ-NP-X][A-HJ-NP-Z]{2}\d{2,}$")
+_MGRS_LOOSE_RE = re.compile(r"^\d{1,2}[A-Z]{3}\d+$")
+_GEOREF_RE = re.compile(r"^[A-Z]{4}\d{2,}$")
+_PLUS_CODES_RES = (
+    re.compile(r"[23456789CFGHJMPQRVWX]{8}\+[23456789CFGHJMPQRVWX]{2,}"),
+    re.compile(r"[23456789CFGHJMPQRVWX]{6,8}\+[23456789CFGHJMPQRVWX]*"),
+    re.compile(r"[23456789CFGHJMPQRVWX]{2,8}\+[23456789CFGHJMPQRVWX]{1,}"),
+)
+_MAIDENHEAD_RE = re.compile(r"^[A-R]{2}\d{2}([A-X]{2}(\d{2})?)?$")
+_GEOHASH_RE = re.compile(r"^[0-9bcdefghjkmnpqrstuvwxyz]+$")
+_UTM_RE = re.compile(r"^\d{1,2}[A-Z]\s+\d{6,8}[\.,]?\d*\s+\d{7,9}[\.,]?\d*")
+_H3_RE = re.compile(r"^[0-9a-fA-F]{15}$")
+# Unambiguous grid signatures for classify_format_fast, combined into one
+# alternation; branch order is the classification priority
+_GRID_FORMAT_RE = re.compile(
+    r"^(?:"
+    r"(?P<GEOREF>[A-Z]{4}\d{2,})"
+    r"|(?P<Maidenhead>[A-R]{2}\d{2}(?:[A-X]{2}(?:\d{2})?)?)"
+    r"|(?P<MGRS>\d{1,2}[C-HJ-NP-X][A-HJ-NP-Z]{2}\d{2,})"
+    r")$"
+)
+
 
 class CoordinateParserStrategy(ABC):
     """Base strategy for coordinate parsing - try-parse architecture"""
@@ -99,7 +124,7 @@ class WktParserStrategy(CoordinateParserStrategy):
                 wkt_text = parts[1].strip()
 
                 # Extract SRID
-                srid_match = re.search(r"SRID=(\d+)", srid_part.upper())
+                srid_match = _SRID_RE.search(srid_part.upper())
                 if srid_match:
                     srid = int(srid_match.group(1))
                     source_crs = QgsCoordinateReferenceSystem(f"EPSG:{srid}")
@@ -155,7 +180,7 @@ class EwktParserStrategy(CoordinateParserStrategy):
                 wkt_part = parts[1].strip()
 
                 # Extract SRID
-                srid_match = re.search(r"SRID=(\d+)", srid_part.upper())
+                srid_match = _SRID_RE.search(srid_part.upper())
                 if srid_match:
                     srid = int(srid_match.group(1))
                     source_crs = QgsCoordinateReferenceSystem(f"EPSG:{srid}")
@@ -348,10 +373,9 @@ class MgrsParserStrategy(CoordinateParserStrategy):
         """Check if text looks like MGRS coordinate"""
         # MGRS format: Zone (1-2 digits) + Grid letter (A-Z, excluding I, O) + grid letters/digits
         # Examples: 4QFJ12345678, 4Q FJ 12345 67890
-        text_clean = re.sub(r"\s+", "", text.upper())
+        text_clean = _WHITESPACE_RE.sub("", text.upper())
         # Pattern: 1-2 digit zone + letter + exactly 2 grid letters + even number of digits
-        mgrs_pattern = r"^\d{1,2}[C-HJ-NP-X][A-HJ-NP-Z]{2}\d{2,}$"
-        return bool(re.match(mgrs_pattern, text_clean))
+        return bool(_MGRS_RE.match(text_clean))
 
     def parse(self, text: str) -> tuple:
         """Parse MGRS coordinate - let mature MGRS library handle validation"""
@@ -363,7 +387,7 @@ class MgrsParserStrategy(CoordinateParserStrategy):
                 from mgrs import toWgs
 
             # Clean input and let library validate format
-            text_clean = re.sub(r"\s+", "", text)
+            text_clean = _WHITESPACE_RE.sub("", text)
             lat, lon = toWgs(text_clean)
             self._log_debug(f"MGRS parsed: {text} → lat={lat}, lon={lon}")
             return (lat, lon, None, epsg4326, "MGRS")
@@ -377,7 +401,7 @@ class GeorefParserStrategy(CoordinateParserStrategy):
 
     def can_parse(self, text: str) -> bool:
         """Check if text looks like GEOREF"""
-        return bool(re.match(r"^[A-Z]{4}\d{2,}$", text.upper()))
+        return bool(_GEOREF_RE.match(text.upper()))
 
     def parse(self, text: str) -> tuple:
         """Parse GEOREF coordinate"""
@@ -402,12 +426,7 @@ class PlusCodesParserStrategy(CoordinateParserStrategy):
     def can_parse(self, text: str) -> bool:
         """Check if text looks like Plus Codes"""
         text_upper = text.upper()
-        patterns = [
-            r"[23456789CFGHJMPQRVWX]{8}\+[23456789CFGHJMPQRVWX]{2,}",
-            r"[23456789CFGHJMPQRVWX]{6,8}\+[23456789CFGHJMPQRVWX]*",
-            r"[23456789CFGHJMPQRVWX]{2,8}\+[23456789CFGHJMPQRVWX]{1,}",
-        ]
-        return any(re.search(pattern, text_upper) for pattern in patterns)
+        return any(pattern.search(text_upper) for pattern in _PLUS_CODES_RES)
 
     def parse(self, text: str) -> tuple:
         """Parse Plus Codes coordinate"""
@@ -437,7 +456,7 @@ class MaidenheadParserStrategy(CoordinateParserStrategy):
 
     def can_parse(self, text: str) -> bool:
         """Check if text looks like Maidenhead Grid"""
-        return bool(re.match(r"^[A-R]{2}\d{2}([A-X]{2}(\d{2})?)?$", text.upper()))
+        return bool(_MAIDENHEAD_RE.match(text.upper()))
 
     def parse(self, text: str) -> tuple:
         """Parse Maidenhead Grid coordinate"""
@@ -463,9 +482,9 @@ class GeohashParserStrategy(CoordinateParserStrategy):
 
     def can_parse(self, text: str) -> bool:
         """Check if text looks like Geohash"""
-        text_clean = re.sub(r"\s+", "", text.lower())
+        text_clean = _WHITESPACE_RE.sub("", text.lower())
         return (
-            bool(re.match(r"^[0-9bcdefghjkmnpqrstuvwxyz]+$", text_clean))
+            bool(_GEOHASH_RE.match(text_clean))
             and 3 <= len(text_clean) <= 12
         )
 
@@ -476,9 +495,9 @@ class GeohashParserStrategy(CoordinateParserStrategy):
 
         # Skip if it matches other format patterns
         if (
-            re.match(r"^\d{1,2}[A-Z]{3}\d+$", re.sub(r"\s+", "", text_upper))  # MGRS
-            or re.match(r"^[A-Z]{4}\d{2,}$", text_upper)  # GEOREF
-            or re.match(r"^[A-R]{2}\d{2}([A-X]{2}(\d{2})?)?$", text_upper)
+            _MGRS_LOOSE_RE.match(_WHITESPACE_RE.sub("", text_upper))  # MGRS
+            or _GEOREF_RE.match(text_upper)  # GEOREF
+            or _MAIDENHEAD_RE.match(text_upper)
         ):  # Maidenhead
             return None
 
@@ -509,8 +528,7 @@ class UtmParserStrategy(CoordinateParserStrategy):
         # Examples: 10T 500000 4500000, 10T 500000.00 4500000.00
         text_upper = text.upper()
         # Pattern: 1-2 digit zone + letter + large numbers (easting 6-7 digits, northing 7-8 digits)
-        utm_pattern = r"^\d{1,2}[A-Z]\s+\d{6,8}[\.,]?\d*\s+\d{7,9}[\.,]?\d*"
-        return bool(re.match(utm_pattern, text_upper.strip()))
+        return bool(_UTM_RE.match(text_upper.strip()))
 
     def parse(self, text: str) -> tuple:
         """Parse UTM coordinate - let mature UTM library handle validation"""
@@ -576,8 +594,8 @@ class H3ParserStrategy(CoordinateParserStrategy):
             except ImportError:
                 import h3
 
-            text_clean = re.sub(r"\s+", "", text)
-            return bool(re.match(r"^[0-9a-fA-F]{15}$", text_clean))
+            text_clean = _WHITESPACE_RE.sub("", text)
+            return bool(_H3_RE.match(text_clean))
         except ImportError:
             return False
         except Exception:
@@ -588,13 +606,15 @@ class H3ParserStrategy(CoordinateParserStrategy):
         try:
             # Handle both plugin context and standalone testing
             try:
-                from . import h3
+                from .h3.api import basic_int as h3
             except ImportError:
-                import h3
+                from h3.api import basic_int as h3
 
-            if h3.is_valid_cell(text):
-                lat, lon = h3.cell_to_latlng(text)
-                coords = h3.cell_to_boundary(text)
+            # Parse the hex index once and use the integer API for the rest
+            cell = h3.str_to_int(text)
+            if h3.is_valid_cell(cell):
+                lat, lon = h3.cell_to_latlng(cell)
+                coords = h3.cell_to_boundary(cell)
                 pts = []
                 for p in coords:
                     pt = QgsPointXY(p[1], p[0])
@@ -809,7 +829,7 @@ class SmartCoordinateParser:
         bypassing the strategy loop entirely for common cases.
         """
         text_upper = text.upper().strip()
-        text_clean = re.sub(r"\s+", "", text_upper)
+        text_clean = _WHITESPACE_RE.sub("", text_upper)
 
         # Tier 1: Ultra-specific signatures (unmistakable, zero collision risk)
         # Check these first as they're O(1) and cover common cases
@@ -859,13 +879,13 @@ class SmartCoordinateParser:
                 except ImportError:
                     pass  # H3 not available, don't classify
 
-        # GEOREF: exactly 4 letters followed by digits
-        if bool(re.match(r"^[A-Z]{4}\d{2,}$", text_clean)):
-            return "GEOREF"
-
-        # Maidenhead: 2 letters + 2 digits + optional pairs
-        if bool(re.match(r"^[A-R]{2}\d{2}([A-X]{2}(\d{2})?)?$", text_clean)):
-            return "Maidenhead"
+        # GEOREF (4 letters + digits), Maidenhead (2 letters + 2 digits +
+        # optional pairs) and MGRS (zone + grid letters + digits) in one pass.
+        # None of these can contain a WKT keyword, so checking MGRS ahead of
+        # the WKT tier does not change the result
+        grid_match = _GRID_FORMAT_RE.match(text_clean)
+        if grid_match:
+            return grid_match.lastgroup
 
         # Tier 2: High-signature formats (very low collision risk but not O(1))
         # These still benefit from can_parse() checks
@@ -883,17 +903,8 @@ class SmartCoordinateParser:
         if any(keyword in text_upper for keyword in wkt_keywords):
             return "WKT"
 
-        # MGRS: zone + grid pattern
-        if bool(re.match(r"^\d{1,2}[C-HJ-NP-X][A-HJ-NP-Z]{2}\d{2,}$", text_clean)):
-            return "MGRS"
-
         # UTM: zone + hemisphere + large numbers
-        if bool(
-            re.match(
-                r"^\d{1,2}[A-Z]\s+\d{6,8}[\.,]?\d*\s+\d{7,9}[\.,]?\d*",
-                text_upper.strip(),
-            )
-        ):
+        if bool(_UTM_RE.match(text_upper.strip())):
             return "UTM"
 
         # If we get here, format is ambiguous (Geohash, DMS, decimal degrees)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Geohash Native Decoder Tests
+
+Checks that the numba_decode path of decode_exactly returns exactly what
+the pure-Python loop does, and that decode_exactly falls back to the loop
+for invalid characters and broken numba installs.
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+# File is at: tests/unit/test_geohash_numba.py
+# Need to go up 3 levels to reach plugin root
+plugin_dir = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+if plugin_dir not in sys.path:
+    sys.path.insert(0, plugin_dir)
+
+import geohash
+
+
+GEOHASHES = [
+    "",
+    "0",
+    "z",
+    "dr5regy",
+    "9q5",
+    "u4pruydqqvj",
+    "s00000000000",
+    "zzzzzzzzzzzz",
+    "0123456789bc",
+    "defghjkmnpqr",
+    "stuvwxyz",
+]
+
+
+def _pure_python_decode(value):
+    """decode_exactly with the numba dispatch switched off"""
+    with mock.patch.object(geohash, "NUMBA_AVAILABLE", False):
+        return geohash.decode_exactly(value)
+
+
+class TestGeohashNumbaDecode(unittest.TestCase):
+    """numba_decode must agree with the pure-Python decoder"""
+
+    def test_invalid_characters_still_raise(self):
+        """Characters outside the alphabet never reach the native decoder"""
+        self.assertEqual(geohash.decode_exactly(""), (0.0, 0.0, 90.0, 180.0))
+        for value in ("a", "dr5rei", "DR5REGY"):
+            with self.subTest(geohash=value), self.assertRaises(KeyError):
+                geohash.decode_exactly(value)
+
+    def test_broken_numba_falls_back(self):
+        """A failing native decoder switches decode_exactly to pure Python"""
+        broken = mock.Mock(side_effect=RuntimeError("numba failed"))
+        with mock.patch.object(geohash, "NUMBA_AVAILABLE", True), \
+                mock.patch.object(geohash, "numba_decode", broken):
+            self.assertEqual(geohash.decode_exactly("dr5regy"),
+                             _pure_python_decode("dr5regy"))
+            self.assertFalse(geohash.NUMBA_AVAILABLE)
+            geohash.decode_exactly("dr5regy")
+        broken.assert_called_once_with("dr5regy")
+
+    @unittest.skipUnless(geohash.NUMBA_AVAILABLE, "numba not installed")
+    def test_numba_decode_matches_pure_python(self):
+        """Native results are identical to the pure-Python decoder"""
+        hashes = GEOHASHES + [
+            geohash.encode(lat, lon, precision)
+            for lat, lon in [(40.7128, -74.006), (-33.8688, 151.2093),
+                             (89.9999, 179.9999), (-90.0, -180.0)]
+            for precision in (1, 5, 12)
+        ]
+        for value in hashes:
+            with self.subTest(geohash=value):
+                expected = _pure_python_decode(value)
+                self.assertEqual(tuple(geohash.numba_decode(value)), expected)
+                self.assertEqual(tuple(geohash.decode_exactly(value)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+MGRS Transformer Cache Tests
+
+Checks that mgrs reuses coordinate transformers per EPSG pair and thread,
+and rebuilds them after clear_transformer_cache(). The projection libraries
+are patched out, so only the caching behaviour is exercised.
+"""
+
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+# Add parent directory to path for imports
+# File is at: tests/unit/test_mgrs_transformer_cache.py
+# Need to go up 3 levels to reach plugin root
+plugin_dir = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+if plugin_dir not in sys.path:
+    sys.path.insert(0, plugin_dir)
+
+try:
+    import mgrs
+    MGRS_AVAILABLE = True
+except ImportError:
+    # mgrs needs either osgeo.osr or pyproj at import time
+    MGRS_AVAILABLE = False
+
+
+def _in_other_thread(func):
+    """Run func in a fresh thread and return its result"""
+    result = []
+    worker = threading.Thread(target=lambda: result.append(func()))
+    worker.start()
+    worker.join()
+    return result[0]
+
+
+@unittest.skipUnless(MGRS_AVAILABLE, "mgrs needs osgeo.osr or pyproj")
+class TestTransformerCache(unittest.TestCase):
+    """_cached_transformer keyed on (src, dst, axis, thread)"""
+
+    def setUp(self):
+        mgrs.clear_transformer_cache()
+        self.addCleanup(mgrs.clear_transformer_cache)
+        patches = [
+            mock.patch.object(mgrs, 'CRS', create=True),
+            mock.patch.object(mgrs, 'Transformer', create=True),
+            mock.patch.object(mgrs, '_log_proj_crs'),
+        ]
+        self.crs, self.transformer, self.log_crs = [
+            p.start() for p in patches]
+        for p in patches:
+            self.addCleanup(p.stop)
+        self.transformer.from_crs.side_effect = lambda *a, **kw: object()
+
+    def build(self, epsg_dst=32633, always_xy=True):
+        return mgrs._cached_transformer(
+            4326, epsg_dst, always_xy, threading.get_ident())
+
+    def test_same_key_reuses_transformer(self):
+        """Repeated lookups build and log only once"""
+        first = self.build()
+        self.assertIs(self.build(), first)
+        self.assertEqual(self.transformer.from_crs.call_count, 1)
+        self.assertEqual(self.log_crs.call_count, 2)
+
+    def test_different_key_builds_new_transformer(self):
+        """Another EPSG pair or axis order gets its own transformer"""
+        first = self.build()
+        self.assertIsNot(self.build(epsg_dst=32634), first)
+        self.assertIsNot(self.build(always_xy=False), first)
+        self.assertEqual(self.transformer.from_crs.call_count, 3)
+
+    def test_other_thread_gets_own_transformer(self):
+        """Transformers are never shared between threads"""
+        first = self.build()
+        other = _in_other_thread(self.build)
+        self.assertIsNot(other, first)
+        self.assertIs(self.build(), first)
+        self.assertEqual(self.transformer.from_crs.call_count, 2)
+
+    def test_clear_forces_rebuild(self):
+        """clear_transformer_cache() drops cached transformers"""
+        first = self.build()
+        mgrs.clear_transformer_cache()
+        self.assertIsNot(self.build(), first)
+        self.assertEqual(self.transformer.from_crs.call_count, 2)
+
+
+@unittest.skipUnless(MGRS_AVAILABLE, "mgrs needs osgeo.osr or pyproj")
+class TestOsrTransformationCache(unittest.TestCase):
+    """_cached_osr_transformation keyed on (src, dst, polar, thread)"""
+
+    def setUp(self):
+        mgrs.clear_transformer_cache()
+        self.addCleanup(mgrs.clear_transformer_cache)
+        patches = [
+            mock.patch.object(mgrs, 'osr', create=True),
+            mock.patch.object(mgrs, '_log_proj_crs'),
+        ]
+        self.osr, self.log_crs = [p.start() for p in patches]
+        for p in patches:
+            self.addCleanup(p.stop)
+        self.osr.CoordinateTransformation.side_effect = \
+            lambda *a: object()
+
+    def build(self, polar=False):
+        return mgrs._cached_osr_transformation(
+            4326, 32661 if polar else 32633, polar, threading.get_ident())
+
+    def test_same_key_reuses_transformation(self):
+        """Repeated lookups build and log only once"""
+        first = self.build()
+        self.assertIs(self.build(), first)
+        self.assertEqual(
+            self.osr.CoordinateTransformation.call_count, 1)
+        self.assertEqual(self.log_crs.call_count, 2)
+
+    def test_other_thread_gets_own_transformation(self):
+        """Transformations are never shared between threads"""
+        first = self.build()
+        other = _in_other_thread(self.build)
+        self.assertIsNot(other[0], first[0])
+        self.assertIs(self.build(), first)
+        self.assertEqual(
+            self.osr.CoordinateTransformation.call_count, 2)
+
+    def test_clear_forces_rebuild(self):
+        """clear_transformer_cache() drops cached transformations"""
+        first = self.build()
+        mgrs.clear_transformer_cache()
+        self.assertIsNot(self.build()[0], first[0])
+        self.assertEqual(
+            self.osr.CoordinateTransformation.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,8 +4,616 @@ Comprehensive edge case testing for Smart Coordinate Parser
 Tests all the tricky cases that could break the parser in real-world usage
 """
 
+import os
 import re
+import sys
 import math
+import unittest
+from functools import lru_cache, singledispatch
+
+# Per-case diagnostics are only printed with VERBOSE=1
+VERBOSE = os.environ.get('VERBOSE', '0') == '1'
+
+# NumPy is optional - only the batch validation kernel needs it
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Numba is optional - fall back to plain Python for the scalar decision core
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# Batch validation result flags
+FLAG_INVALID = 0
+FLAG_LAT_LON = 1
+FLAG_SWAPPED = 2
+FLAG_AMBIGUOUS_LAT_LON = 3
+FLAG_AMBIGUOUS_LON_LAT = 4
+
+# Hex digits accepted in WKB input
+_HEX_CHARS = frozenset('0123456789ABCDEFabcdef')
+
+
+def _looks_like_wkb(text):
+    """Hex-encoded WKB: only hex digits and whitespace, with at least 20
+    characters other than spaces (tabs and newlines count, as they always
+    have)
+    """
+    if len(text) - text.count(' ') < 20:
+        return False
+    return _HEX_CHARS.issuperset(''.join(text.split()))
+
+
+# Phase 1 master pattern: explicit geometry prefixes, matched case-insensitively
+_EXPLICIT_RE = re.compile(
+    r'(?P<EWKT>SRID=\d+;)'
+    r'|(?P<WKT>POINT[ZM]*\s*\()'
+    r'|(?P<MULTIPOINT>MULTIPOINT\s*\()'
+    r'|(?P<POLYGON>POLYGON\s*\()',  # Will use centroid
+    re.IGNORECASE,
+)
+_EWKT_RE = re.compile(r'SRID=\d+;', re.IGNORECASE)
+
+# Phase 2 patterns are case-insensitive so the input is never upper-cased.
+# Letters are matched ASCII-only, via re.ASCII or a scoped (?a:...) group, so
+# IGNORECASE cannot map the Kelvin sign or long s onto K and S; \s and \d
+# stay Unicode-aware, as they were on the upper-cased text.
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Master pattern for compact grid references, alternatives in precedence order
+_CANONICAL_RE = re.compile(
+    r'(?P<MGRS>\d{1,2}(?a:[A-Z]{3})\d+)'
+    r'|(?P<GEOREF>(?a:[A-Z]{4})\d{2,})'
+    r'|(?P<Maidenhead>(?a:[A-R]{2})\d{2}(?a:[A-X]{2}(?:[A-X]{2})?)?)'
+    r'|(?P<Geohash>(?a:[0-9BCDEFGHJKMNPQRSTUVWXYZ]{4,12}))',
+    re.IGNORECASE,
+)
+_UTM_LABEL_RE = re.compile(r'(?a:UTM)|(?a:ZONE)\s*\d{1,2}', re.IGNORECASE)
+_UTM_ZONE_RE = re.compile(r'\d{1,2}[A-Z]\s+\d+\s+\d+')
+_UPS_RE = re.compile(r'(?a:UPS)|(?a:[A-B][A-Z])\s+\d+\s+\d+', re.IGNORECASE)
+_UPS_LABEL_RE = re.compile(r'UPS', re.IGNORECASE | re.ASCII)
+
+# Signed decimal/scientific number. On Python 3.11+ the possessive form
+# matches the same tokens without ever backtracking into digit runs.
+if sys.version_info >= (3, 11):
+    _NUMBER_RE = re.compile(r'[-+]?(?:\d++(?:\.\d++)?+|\.\d++)(?:[eE][-+]?\d++)?+')
+else:
+    _NUMBER_RE = re.compile(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?')
+
+# Phase 3 cardinal/symbol markers and the H3 cell index
+_H3_RE = re.compile(r'[0-9a-fA-F]{15}')
+_CARDINAL_RE = re.compile(r'[NSEW]')
+_CARDINAL_SYMBOL_RE = re.compile(r'[NSEW°′″]')
+
+# Bound pattern methods, resolved once instead of on every detection call
+_explicit_search = _EXPLICIT_RE.search
+_ewkt_search = _EWKT_RE.search
+_whitespace_sub = _WHITESPACE_RE.sub
+_canonical_fullmatch = _CANONICAL_RE.fullmatch
+_utm_label_search = _UTM_LABEL_RE.search
+_utm_zone_search = _UTM_ZONE_RE.search
+_ups_search = _UPS_RE.search
+_ups_label_search = _UPS_LABEL_RE.search
+_number_findall = _NUMBER_RE.findall
+_h3_fullmatch = _H3_RE.fullmatch
+_cardinal_search = _CARDINAL_RE.search
+_cardinal_symbol_search = _CARDINAL_SYMBOL_RE.search
+
+
+# Open Location Code digits, in both cases
+_PLUS_ALPHABET = frozenset('23456789CFGHJMPQRVWXcfghjmpqrvwx')
+
+
+def _has_plus_code(text):
+    """True if some '+' has 4+ code digits before it and 2+ after it"""
+    i = text.find('+')
+    while i >= 0:
+        if (i >= 4 and len(text) >= i + 3 and
+                _PLUS_ALPHABET.issuperset(text[i - 4:i]) and
+                _PLUS_ALPHABET.issuperset(text[i + 1:i + 3])):
+            return True
+        i = text.find('+', i + 1)
+    return False
+
+
+def _detect_explicit_format(text):
+    """Return "EWKT"/"WKT" for explicit geometry text, otherwise None"""
+    m = _explicit_search(text)
+    if not m:
+        return None
+    # EWKT takes precedence wherever the SRID prefix appears
+    if m.lastgroup == "EWKT" or _ewkt_search(text, m.end()):
+        return "EWKT"
+    return "WKT"
+
+
+def _detect_canonical_format(text_clean, text):
+    """Match the anchored grid formats against the whitespace-free text
+
+    Only MGRS tolerates embedded whitespace; the other grid formats must
+    already be compact in the input.
+    """
+    m = _canonical_fullmatch(text_clean)
+    if m and (m.lastgroup == "MGRS" or len(text_clean) == len(text)):
+        return m.lastgroup
+    return None
+
+
+@singledispatch
+def detect_format(text):
+    """Enhanced format detection with better edge case handling
+
+    String results are memoized, so repeated detection of the same input
+    (keypress, validate, apply) skips the regex cascade.
+    """
+    return "Invalid"
+
+
+@detect_format.register(str)
+@lru_cache(maxsize=1024)
+def _detect_format_str(text):
+    if not text:
+        return "Invalid"
+        
+    text = text.strip()
+    if not text:
+        return "Empty"
+        
+    # Phase 1: Explicit formats (order matters for precedence)
+    explicit = _detect_explicit_format(text)
+    if explicit:
+        return explicit
+    if _looks_like_wkb(text):
+        return "WKB"
+        
+    # Phase 2: Existing formats (refined order to avoid conflicts)
+    text_clean = _whitespace_sub('', text)
+    
+    # MGRS, GEOREF, Maidenhead and Geohash in precedence order
+    canonical = _detect_canonical_format(text_clean, text)
+    if canonical:
+        return canonical
+        
+    # Plus Codes pattern  
+    if _has_plus_code(text):
+        return "Plus Codes"
+        
+    # UTM patterns
+    if _utm_label_search(text) or _utm_zone_search(text):
+        return "UTM"
+        
+    # UPS pattern
+    if _ups_search(text):
+        return "UPS"
+        
+    # GeoJSON pattern
+    if (text.strip().startswith('{') and 
+        '"type"' in text and 
+        ('"Point"' in text or '"coordinates"' in text)):
+        return "GeoJSON"
+        
+    # H3 pattern (hexagonal grid)
+    if _h3_fullmatch(text_clean):
+        return "H3"
+        
+    # Phase 3: Basic coordinates
+    # DMS with cardinal directions (before decimal to catch N/S/E/W)
+    if _cardinal_search(text):
+        return "DMS"
+        
+    # Decimal coordinates
+    numbers = _number_findall(text)
+    if len(numbers) >= 2:
+        try:
+            a1, a2 = abs(float(numbers[0])), abs(float(numbers[1]))
+            # Reasonable geographic coordinate ranges (including projected coordinates)
+            if a1 <= 180 and a2 <= 180 and (a1 <= 90 or a2 <= 90):
+                return "Decimal"
+            elif a1 <= 90000000 and a2 <= 90000000:  # Projected coordinates
+                return "Projected"
+        except (ValueError, OverflowError):
+            pass
+            
+    return "Unknown"
+
+
+@singledispatch
+def detect_format_enhanced(text):
+    """Enhanced format detection for real-world cases"""
+    return "Invalid"
+
+
+@detect_format_enhanced.register(str)
+@lru_cache(maxsize=1024)
+def _detect_format_enhanced_str(text):
+    if not text:
+        return "Invalid"
+        
+    text = text.strip()
+    if not text:
+        return "Empty"
+        
+    # Phase 1: Explicit formats
+    explicit = _detect_explicit_format(text)
+    if explicit:
+        return explicit
+    if _looks_like_wkb(text):
+        return "WKB"
+        
+    # Phase 2: Existing formats
+    text_clean = _whitespace_sub('', text)
+    
+    # MGRS, GEOREF, Maidenhead and Geohash in precedence order
+    canonical = _detect_canonical_format(text_clean, text)
+    if canonical:
+        return canonical
+        
+    # Plus Codes pattern  
+    if _has_plus_code(text):
+        return "Plus Codes"
+        
+    # UTM patterns
+    if _utm_label_search(text) or _utm_zone_search(text):
+        return "UTM"
+        
+    # UPS pattern
+    if _ups_label_search(text):
+        return "UPS"
+        
+    # GeoJSON pattern
+    if (text.strip().startswith('{') and 
+        ('"type"' in text or '"lat"' in text or '"lng"' in text or '"coordinates"' in text)):
+        return "GeoJSON"
+        
+    # H3 pattern
+    if _h3_fullmatch(text_clean):
+        return "H3"
+        
+    # Phase 3: Basic coordinates
+    # DMS with cardinal directions
+    if _cardinal_symbol_search(text):
+        return "DMS"
+        
+    # Decimal coordinates
+    numbers = _number_findall(text)
+    if len(numbers) >= 2:
+        try:
+            a1, a2 = abs(float(numbers[0])), abs(float(numbers[1]))
+            if a1 <= 180 and a2 <= 180 and (a1 <= 90 or a2 <= 90):
+                return "Decimal"
+            elif a1 <= 90000000 and a2 <= 90000000:
+                return "Projected"
+        except (ValueError, OverflowError):
+            pass
+            
+    return "Unknown"
+
+
+# Exact boundary positions; -0.0 and integer keys hash equal to these floats
+_LAT_SPECIAL = {90.0: "North Pole", -90.0: "South Pole", 0.0: "Equator"}
+_LON_SPECIAL = {180.0: "Date Line", -180.0: "Date Line", 0.0: "Prime Meridian"}
+
+
+def describe_position(lat, lon):
+    """Name the exact boundary cases a coordinate sits on, if any"""
+    special_cases = []
+    special = _LAT_SPECIAL.get(lat)
+    if special:
+        special_cases.append(special)
+    special = _LON_SPECIAL.get(lon)
+    if special:
+        special_cases.append(special)
+    return " & ".join(special_cases) if special_cases else None
+
+
+@njit(cache=True)
+def _decide_coordinate_order(coord1, coord2, prefer_lon_lat):
+    """Numeric core of validate_coordinates_advanced, returns a FLAG_* code"""
+    if not (math.isfinite(coord1) and math.isfinite(coord2)):
+        return FLAG_INVALID
+    a1 = abs(coord1)
+    a2 = abs(coord2)
+    lat_lon_valid = a1 <= 90.0 and a2 <= 180.0
+    lon_lat_valid = a2 <= 90.0 and a1 <= 180.0
+    if lat_lon_valid and lon_lat_valid:
+        # Equal and symmetric pairs keep their input order regardless of preference
+        if prefer_lon_lat and a1 != a2:
+            return FLAG_AMBIGUOUS_LON_LAT
+        return FLAG_AMBIGUOUS_LAT_LON
+    if lat_lon_valid:
+        return FLAG_LAT_LON
+    if lon_lat_valid:
+        return FLAG_SWAPPED
+    return FLAG_INVALID
+
+
+def validate_coordinates_advanced(coord1, coord2, user_preference="lat_lon"):
+    """Advanced coordinate validation with edge case handling"""
+    
+    # Handle special cases
+    if coord1 is None or coord2 is None:
+        return None, None, "Null coordinates"
+    if not isinstance(coord1, (int, float)) or not isinstance(coord2, (int, float)):
+        return None, None, "Non-numeric coordinates"
+        
+    code = _decide_coordinate_order(float(coord1), float(coord2), user_preference == "lon_lat")
+    
+    # Map the numeric decision to a description
+    if code == FLAG_AMBIGUOUS_LON_LAT:
+        special = describe_position(coord2, coord1)
+        desc = f"Ambiguous - used Lon/Lat preference" + (f" ({special})" if special else "")
+        return coord2, coord1, desc
+        
+    elif code == FLAG_AMBIGUOUS_LAT_LON:
+        # Both orders valid - check for edge cases
+        if coord1 == coord2:
+            return coord1, coord2, "Equal coordinates - ambiguous"
+        elif abs(coord1) == abs(coord2):
+            return coord1, coord2, "Symmetric coordinates - ambiguous"
+        special = describe_position(coord1, coord2)
+        desc = f"Ambiguous - used Lat/Lon preference" + (f" ({special})" if special else "")
+        return coord1, coord2, desc
+                
+    elif code == FLAG_LAT_LON:
+        special = describe_position(coord1, coord2)
+        desc = f"Valid Lat/Lon order" + (f" ({special})" if special else "")
+        return coord1, coord2, desc
+        
+    elif code == FLAG_SWAPPED:
+        special = describe_position(coord2, coord1)
+        desc = f"Auto-corrected to Lat/Lon" + (f" ({special})" if special else "")
+        return coord2, coord1, desc
+        
+    if not (math.isfinite(coord1) and math.isfinite(coord2)):
+        return None, None, "Invalid numeric values"
+        
+    # Neither order valid - provide detailed error
+    def is_valid_lat(lat):
+        return -90 <= lat <= 90
+    def is_valid_lon(lon):
+        return -180 <= lon <= 180
+        
+    lat1_err = "✓" if is_valid_lat(coord1) else f"✗ ({coord1} ∉ [-90,90])"
+    lon1_err = "✓" if is_valid_lon(coord2) else f"✗ ({coord2} ∉ [-180,180])"
+    lat2_err = "✓" if is_valid_lat(coord2) else f"✗ ({coord2} ∉ [-90,90])"  
+    lon2_err = "✓" if is_valid_lon(coord1) else f"✗ ({coord1} ∉ [-180,180])"
+    
+    desc = f"Invalid both ways: As Lat/Lon: lat{lat1_err} lon{lon1_err}, As Lon/Lat: lat{lat2_err} lon{lon2_err}"
+    return None, None, desc
+
+
+def validate_coordinates_batch(coord1, coord2, user_preference="lat_lon"):
+    """Vectorized counterpart of validate_coordinates_advanced for numeric arrays
+
+    Returns (lat, lon, flag) arrays. Rows that are invalid both ways get NaN
+    coordinates and FLAG_INVALID. user_preference is either a single
+    preference string or a boolean array that is True where Lon/Lat is preferred.
+    """
+    c1 = np.asarray(coord1, dtype=np.float64)
+    c2 = np.asarray(coord2, dtype=np.float64)
+    if isinstance(user_preference, str):
+        prefer_lon_lat = user_preference == "lon_lat"
+    else:
+        prefer_lon_lat = np.asarray(user_preference, dtype=bool)
+
+    a1 = np.abs(c1)
+    a2 = np.abs(c2)
+    finite = np.isfinite(c1) & np.isfinite(c2)
+    lat_lon_valid = finite & (a1 <= 90) & (a2 <= 180)
+    lon_lat_valid = finite & (a2 <= 90) & (a1 <= 180)
+    ambiguous = lat_lon_valid & lon_lat_valid
+
+    # Equal and symmetric pairs keep their input order regardless of preference
+    swap_mask = (~lat_lon_valid & lon_lat_valid) | (ambiguous & prefer_lon_lat & (a1 != a2))
+    valid_mask = lat_lon_valid | lon_lat_valid
+
+    lat = np.where(valid_mask, np.where(swap_mask, c2, c1), np.nan)
+    lon = np.where(valid_mask, np.where(swap_mask, c1, c2), np.nan)
+    flag = np.select(
+        [ambiguous & swap_mask, ambiguous, swap_mask, valid_mask],
+        [FLAG_AMBIGUOUS_LON_LAT, FLAG_AMBIGUOUS_LAT_LON, FLAG_SWAPPED, FLAG_LAT_LON],
+        default=FLAG_INVALID,
+    ).astype(np.int8)
+    return lat, lon, flag
+
+
+VALIDATION_EDGE_CASES = (
+    # Boundary coordinates
+    (90.0, 180.0, "lat_lon", "Maximum valid coordinates"),
+    (-90.0, -180.0, "lat_lon", "Minimum valid coordinates"), 
+    (90.0, -180.0, "lat_lon", "North Pole at Date Line"),
+    (-90.0, 180.0, "lat_lon", "South Pole at Date Line"),
+    (0.0, 0.0, "lat_lon", "Origin (Null Island)"),
+    (0.0, 180.0, "lat_lon", "Equator at Date Line"),
+    (90.0, 0.0, "lat_lon", "North Pole at Prime Meridian"),
+    
+    # Just over boundaries
+    (90.0000001, 0.0, "lat_lon", "Just over North Pole"),
+    (-90.0000001, 0.0, "lat_lon", "Just under South Pole"),
+    (0.0, 180.0000001, "lat_lon", "Just over Date Line positive"),
+    (0.0, -180.0000001, "lat_lon", "Just under Date Line negative"),
+    (91.0, 0.0, "lat_lon", "Clearly invalid latitude"),
+    (0.0, 181.0, "lat_lon", "Clearly invalid longitude"),
+    
+    # Ambiguous cases
+    (45.0, 45.0, "lat_lon", "Equal coordinates - Lat/Lon preference"),
+    (45.0, 45.0, "lon_lat", "Equal coordinates - Lon/Lat preference"), 
+    (-45.0, -45.0, "lat_lon", "Equal negative coordinates"),
+    (30.0, -30.0, "lat_lon", "Symmetric coordinates"),
+    (89.0, 179.0, "lat_lon", "Near boundaries - both valid"),
+    
+    # Precision edge cases
+    (40.712812345678901234, -74.006012345678901234, "lat_lon", "High precision coordinates"),
+    (40, -74, "lat_lon", "Integer coordinates"),
+    (40.0, -74.0, "lat_lon", "Float coordinates"),
+    
+    # Scientific notation
+    (4.07128e1, -7.40060e1, "lat_lon", "Scientific notation"),
+    (1.23e-10, 5.67e-11, "lat_lon", "Very small coordinates"),
+    
+    # Special numeric values
+    (float('nan'), 40.0, "lat_lon", "NaN latitude"),
+    (40.0, float('nan'), "lat_lon", "NaN longitude"),
+    (float('inf'), 40.0, "lat_lon", "Infinite latitude"),
+    (40.0, float('-inf'), "lat_lon", "Negative infinite longitude"),
+    (None, 40.0, "lat_lon", "None latitude"),
+    (40.0, None, "lat_lon", "None longitude"),
+    ("40.0", "-74.0", "lat_lon", "String coordinates"),
+    
+    # Large projected coordinates
+    (585398.0, 4511518.0, "lat_lon", "UTM coordinates (invalid as WGS84)"),
+    (1000000.0, 2000000.0, "lat_lon", "Large projected coordinates"),
+    
+    # Zero and near-zero
+    (0.0, 0.0, "lat_lon", "Exact origin"),
+    (0.000001, 0.000001, "lat_lon", "Very small coordinates"),
+    (-0.0, -0.0, "lat_lon", "Negative zero"),
+)
+
+
+def _is_finite_number(value):
+    return isinstance(value, (int, float)) and math.isfinite(value)
+
+
+# Structure-of-arrays view of VALIDATION_EDGE_CASES for the batch kernel.
+# Rows with None, strings or non-finite values need the scalar validator
+# to produce their specific error description.
+_BATCH_ROWS = tuple(
+    case for case in VALIDATION_EDGE_CASES
+    if _is_finite_number(case[0]) and _is_finite_number(case[1])
+)
+_SCALAR_ROWS = tuple(
+    case for case in VALIDATION_EDGE_CASES
+    if not (_is_finite_number(case[0]) and _is_finite_number(case[1]))
+)
+VALIDATION_DESC = [case[3] for case in _BATCH_ROWS]
+if NUMPY_AVAILABLE:
+    VALIDATION_C1 = np.fromiter((case[0] for case in _BATCH_ROWS), dtype=np.float64, count=len(_BATCH_ROWS))
+    VALIDATION_C2 = np.fromiter((case[1] for case in _BATCH_ROWS), dtype=np.float64, count=len(_BATCH_ROWS))
+    VALIDATION_LON_LAT = np.fromiter((case[2] == "lon_lat" for case in _BATCH_ROWS), dtype=bool, count=len(_BATCH_ROWS))
+
+
+PATTERN_EDGE_CASES = (
+    # Pattern precedence conflicts  
+    ("GJPJ0615", "GEOREF", "Should be GEOREF, not Geohash"),
+    ("dr5regy", "Geohash", "Should be Geohash"),
+    ("AB12cd34ef", "Maidenhead", "Case insensitive Maidenhead"),
+    ("ab12CD34EF", "Maidenhead", "Mixed case Maidenhead"),
+    
+    # EWKT edge cases
+    ("SRID=4326;POINT(-74.0 40.7)", "EWKT", "Standard EWKT"),
+    ("srid=4326;point(-74.0 40.7)", "EWKT", "Lowercase EWKT"),
+    ("SRID=99999;POINT(-74.0 40.7)", "EWKT", "Unknown SRID"),
+    ("SRID=;POINT(-74.0 40.7)", "WKT", "Empty SRID should fall back to WKT"),
+    
+    # WKT variations
+    ("POINT(-74.0 40.7)", "WKT", "Standard WKT"),
+    ("POINTZ(-74.0 40.7 100)", "WKT", "3D Point"),
+    ("POINTM(-74.0 40.7 100)", "WKT", "Point with measure"),
+    ("POINTZM(-74.0 40.7 100 200)", "WKT", "4D Point"),
+    ("MULTIPOINT((-74.0 40.7))", "WKT", "MultiPoint"),
+    ("POLYGON((-74 40, -74 41, -73 41, -73 40, -74 40))", "WKT", "Polygon"),
+    
+    # MGRS variations
+    ("18TWN8540011518", "MGRS", "Standard MGRS"),
+    ("18T WN 85400 11518", "MGRS", "MGRS with spaces (should clean)"),
+    ("18t wn 85400 11518", "MGRS", "Lowercase MGRS"),
+    
+    # Plus Codes variations
+    ("87G7X2VV+2V", "Plus Codes", "Standard Plus Code"),
+    ("87G7X2VV+", "Plus Codes", "Short Plus Code"),
+    ("X2VV+2V New York", "Plus Codes", "Local Plus Code with area"),
+    
+    # Geohash variations
+    ("dr5regy", "Geohash", "Standard geohash"),
+    ("DR5REGY", "Geohash", "Uppercase geohash"),
+    ("dr5", "Geohash", "Short geohash"),
+    ("dr5regydr5regy", "Geohash", "Too long geohash should fail"),
+    ("dr5reg0", "Geohash", "Geohash with 0 (invalid character)"),
+    
+    # UTM variations
+    ("18T 585398 4511518", "UTM", "Standard UTM"),
+    ("UTM 18T 585398 4511518", "UTM", "UTM with prefix"),
+    ("Zone 18T 585398 4511518", "UTM", "Zone notation"),
+    ("18 T 585398 4511518", "UTM", "Space between zone and letter"),
+    
+    # Coordinate edge cases
+    ("0, 0", "Decimal", "Origin coordinates"),
+    ("0.0, 0.0", "Decimal", "Origin with decimals"),
+    ("90, 180", "Decimal", "Maximum valid coordinates"),
+    ("-90, -180", "Decimal", "Minimum valid coordinates"),
+    ("90.0000001, 180", "Projected", "Just over lat limit"),
+    ("40.7128, 180.0000001", "Projected", "Just over lon limit"),
+    
+    # Scientific notation
+    ("4.07128e1, -7.40060e1", "Decimal", "Scientific notation"),
+    ("1.23e-4, 5.67e-5", "Decimal", "Small scientific notation"),
+    
+    # Precision edge cases
+    ("40.712812345678901234567890, -74.006", "Decimal", "High precision"),
+    ("40, -74", "Decimal", "Integer coordinates"),
+    ("40., -74.", "Decimal", "Trailing decimal points"),
+    ("+40.7128, -74.0060", "Decimal", "Explicit positive sign"),
+    
+    # Whitespace variations
+    ("  40.7128  ,  -74.0060  ", "Decimal", "Extra whitespace"),
+    ("40.7128,-74.0060", "Decimal", "No spaces"),
+    ("40.7128; -74.0060", "Decimal", "Semicolon separator"),
+    ("40.7128\t-74.0060", "Decimal", "Tab separator"),
+    ("40.7128\n-74.0060", "Decimal", "Newline separator"),
+    
+    # WKB hex: any Unicode whitespace inside, odd digit counts, and
+    # non-space whitespace counting towards the 20-character minimum
+    ("0101000000000000000000F03F000000000000F03F", "WKB", "WKB hex point"),
+    ("01010000\xa00101000000000000", "WKB", "WKB hex with non-breaking space"),
+    ("0101000000" + "\t" * 10 + "0101", "WKB", "WKB hex padded with tabs"),
+    ("0" * 21, "WKB", "Odd-length WKB hex"),
+    ("0101 0000 0001 0100 00", "Decimal", "Spaced hex under 20 digits"),
+    ("0101000000000000000G", "Unknown", "Non-hex character"),
+    
+    # DMS variations
+    ("N40.7128 W74.0060", "DMS", "Cardinal with decimals"),
+    ("40°42'46.1\"N 74°00'21.6\"W", "DMS", "Degrees minutes seconds"),
+    ("40N 74W", "DMS", "Simple cardinal"),
+    ("N 40 W 74", "DMS", "Spaced cardinal"),
+    
+    # Edge case failures
+    ("", "Empty", "Empty string"),
+    ("   ", "Empty", "Whitespace only"),
+    ("invalid", "Unknown", "Invalid text"),
+    ("123", "Unknown", "Single number"),
+    ("abc def ghi", "Unknown", "Random text"),
+    ("100, 200", "Projected", "Coordinates out of WGS84 range"),
+    ("1000000, 2000000", "Projected", "Large projected coordinates"),
+    
+    # Unicode and special characters
+    ("40°7128′ 74°0060′", "DMS", "Unicode degree/minute symbols"),
+    ("40.7128° -74.0060°", "DMS", "Degree symbols"),
+    
+    # Malformed cases
+    ("{\"type\": \"Point\"}", "Unknown", "Incomplete GeoJSON"),
+    ("POINT(", "Unknown", "Incomplete WKT"),
+    ("SRID=4326;", "Unknown", "EWKT without geometry"),
+    ("18TWN", "Unknown", "Incomplete MGRS"),
+    
+    # None/null cases
+    (None, "Invalid", "None input"),
+    (123, "Invalid", "Non-string input"),
+)
+
 
 def test_pattern_detection_edge_cases():
     """Test edge cases in pattern detection"""
@@ -14,211 +622,29 @@ def test_pattern_detection_edge_cases():
     print("PATTERN DETECTION EDGE CASES")
     print("=" * 80)
     
-    def detect_format(text):
-        """Enhanced format detection with better edge case handling"""
-        if not text or not isinstance(text, str):
-            return "Invalid"
-            
-        text = text.strip()
-        if not text:
-            return "Empty"
-            
-        # Phase 1: Explicit formats (order matters for precedence)
-        if re.search(r'SRID=\d+;', text, re.IGNORECASE):
-            return "EWKT"
-        if re.search(r'POINT[ZM]*\s*\(', text, re.IGNORECASE):
-            return "WKT"  
-        if re.search(r'MULTIPOINT\s*\(', text, re.IGNORECASE):
-            return "WKT"
-        if re.search(r'POLYGON\s*\(', text, re.IGNORECASE):
-            return "WKT"  # Will use centroid
-        if re.match(r'^[0-9A-Fa-f\s]+$', text) and len(text.replace(' ', '')) >= 20:
-            return "WKB"
-            
-        # Phase 2: Existing formats (refined order to avoid conflicts)
-        text_upper = text.upper().strip()
-        text_clean = re.sub(r'\s+', '', text_upper)
-        
-        # MGRS pattern (most specific first)
-        if re.match(r'^\d{1,2}[A-Z]{3}\d+$', text_clean):
-            return "MGRS"
-            
-        # GEOREF pattern (before geohash to avoid conflict)
-        if re.match(r'^[A-Z]{4}\d{2,}$', text_upper):
-            return "GEOREF"
-            
-        # Plus Codes pattern  
-        if '+' in text and re.search(r'[23456789CFGHJMPQRVWX]{4,8}\+[23456789CFGHJMPQRVWX]{2,}', text_upper):
-            return "Plus Codes"
-            
-        # Maidenhead grid pattern (case insensitive)
-        if re.match(r'^[A-R]{2}\d{2}([A-X]{2}([A-X]{2})?)?$', text_upper):
-            return "Maidenhead"
-            
-        # Geohash pattern (after GEOREF and Maidenhead to avoid conflicts)
-        if (re.match(r'^[0-9BCDEFGHJKMNPQRSTUVWXYZ]+$', text_upper) and 
-            4 <= len(text_clean) <= 12 and
-            not re.match(r'^[A-Z]{4}\d{2,}$', text_upper)):  # Not GEOREF
-            return "Geohash"
-            
-        # UTM patterns
-        if ('UTM' in text_upper or 
-            re.search(r'\d{1,2}[A-Z]\s+\d+\s+\d+', text) or
-            re.search(r'ZONE\s*\d{1,2}', text_upper)):
-            return "UTM"
-            
-        # UPS pattern
-        if 'UPS' in text_upper or re.search(r'[A-B][A-Z]\s+\d+\s+\d+', text_upper):
-            return "UPS"
-            
-        # GeoJSON pattern
-        if (text.strip().startswith('{') and 
-            '"type"' in text and 
-            ('"Point"' in text or '"coordinates"' in text)):
-            return "GeoJSON"
-            
-        # H3 pattern (hexagonal grid)
-        if re.match(r'^[0-9a-fA-F]{15}$', text_clean):
-            return "H3"
-            
-        # Phase 3: Basic coordinates
-        # DMS with cardinal directions (before decimal to catch N/S/E/W)
-        if re.search(r'[NSEW]', text):
-            return "DMS"
-            
-        # Decimal coordinates
-        numbers = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', text)
-        if len(numbers) >= 2:
-            try:
-                coord1, coord2 = float(numbers[0]), float(numbers[1])
-                # Reasonable geographic coordinate ranges (including projected coordinates)
-                if (abs(coord1) <= 90 and abs(coord2) <= 180) or (abs(coord2) <= 90 and abs(coord1) <= 180):
-                    return "Decimal"
-                elif abs(coord1) <= 90000000 and abs(coord2) <= 90000000:  # Projected coordinates
-                    return "Projected"
-            except (ValueError, OverflowError):
-                pass
-                
-        return "Unknown"
-    
-    edge_cases = [
-        # Pattern precedence conflicts  
-        ("GJPJ0615", "GEOREF", "Should be GEOREF, not Geohash"),
-        ("dr5regy", "Geohash", "Should be Geohash"),
-        ("AB12cd34ef", "Maidenhead", "Case insensitive Maidenhead"),
-        ("ab12CD34EF", "Maidenhead", "Mixed case Maidenhead"),
-        
-        # EWKT edge cases
-        ("SRID=4326;POINT(-74.0 40.7)", "EWKT", "Standard EWKT"),
-        ("srid=4326;point(-74.0 40.7)", "EWKT", "Lowercase EWKT"),
-        ("SRID=99999;POINT(-74.0 40.7)", "EWKT", "Unknown SRID"),
-        ("SRID=;POINT(-74.0 40.7)", "WKT", "Empty SRID should fall back to WKT"),
-        
-        # WKT variations
-        ("POINT(-74.0 40.7)", "WKT", "Standard WKT"),
-        ("POINTZ(-74.0 40.7 100)", "WKT", "3D Point"),
-        ("POINTM(-74.0 40.7 100)", "WKT", "Point with measure"),
-        ("POINTZM(-74.0 40.7 100 200)", "WKT", "4D Point"),
-        ("MULTIPOINT((-74.0 40.7))", "WKT", "MultiPoint"),
-        ("POLYGON((-74 40, -74 41, -73 41, -73 40, -74 40))", "WKT", "Polygon"),
-        
-        # MGRS variations
-        ("18TWN8540011518", "MGRS", "Standard MGRS"),
-        ("18T WN 85400 11518", "MGRS", "MGRS with spaces (should clean)"),
-        ("18t wn 85400 11518", "MGRS", "Lowercase MGRS"),
-        
-        # Plus Codes variations
-        ("87G7X2VV+2V", "Plus Codes", "Standard Plus Code"),
-        ("87G7X2VV+", "Plus Codes", "Short Plus Code"),
-        ("X2VV+2V New York", "Plus Codes", "Local Plus Code with area"),
-        
-        # Geohash variations
-        ("dr5regy", "Geohash", "Standard geohash"),
-        ("DR5REGY", "Geohash", "Uppercase geohash"),
-        ("dr5", "Geohash", "Short geohash"),
-        ("dr5regydr5regy", "Geohash", "Too long geohash should fail"),
-        ("dr5reg0", "Geohash", "Geohash with 0 (invalid character)"),
-        
-        # UTM variations
-        ("18T 585398 4511518", "UTM", "Standard UTM"),
-        ("UTM 18T 585398 4511518", "UTM", "UTM with prefix"),
-        ("Zone 18T 585398 4511518", "UTM", "Zone notation"),
-        ("18 T 585398 4511518", "UTM", "Space between zone and letter"),
-        
-        # Coordinate edge cases
-        ("0, 0", "Decimal", "Origin coordinates"),
-        ("0.0, 0.0", "Decimal", "Origin with decimals"),
-        ("90, 180", "Decimal", "Maximum valid coordinates"),
-        ("-90, -180", "Decimal", "Minimum valid coordinates"),
-        ("90.0000001, 180", "Projected", "Just over lat limit"),
-        ("40.7128, 180.0000001", "Projected", "Just over lon limit"),
-        
-        # Scientific notation
-        ("4.07128e1, -7.40060e1", "Decimal", "Scientific notation"),
-        ("1.23e-4, 5.67e-5", "Decimal", "Small scientific notation"),
-        
-        # Precision edge cases
-        ("40.712812345678901234567890, -74.006", "Decimal", "High precision"),
-        ("40, -74", "Decimal", "Integer coordinates"),
-        ("40., -74.", "Decimal", "Trailing decimal points"),
-        ("+40.7128, -74.0060", "Decimal", "Explicit positive sign"),
-        
-        # Whitespace variations
-        ("  40.7128  ,  -74.0060  ", "Decimal", "Extra whitespace"),
-        ("40.7128,-74.0060", "Decimal", "No spaces"),
-        ("40.7128; -74.0060", "Decimal", "Semicolon separator"),
-        ("40.7128\t-74.0060", "Decimal", "Tab separator"),
-        ("40.7128\n-74.0060", "Decimal", "Newline separator"),
-        
-        # DMS variations
-        ("N40.7128 W74.0060", "DMS", "Cardinal with decimals"),
-        ("40°42'46.1\"N 74°00'21.6\"W", "DMS", "Degrees minutes seconds"),
-        ("40N 74W", "DMS", "Simple cardinal"),
-        ("N 40 W 74", "DMS", "Spaced cardinal"),
-        
-        # Edge case failures
-        ("", "Empty", "Empty string"),
-        ("   ", "Empty", "Whitespace only"),
-        ("invalid", "Unknown", "Invalid text"),
-        ("123", "Unknown", "Single number"),
-        ("abc def ghi", "Unknown", "Random text"),
-        ("100, 200", "Projected", "Coordinates out of WGS84 range"),
-        ("1000000, 2000000", "Projected", "Large projected coordinates"),
-        
-        # Unicode and special characters
-        ("40°7128′ 74°0060′", "DMS", "Unicode degree/minute symbols"),
-        ("40.7128° -74.0060°", "DMS", "Degree symbols"),
-        
-        # Malformed cases
-        ("{\"type\": \"Point\"}", "Unknown", "Incomplete GeoJSON"),
-        ("POINT(", "Unknown", "Incomplete WKT"),
-        ("SRID=4326;", "Unknown", "EWKT without geometry"),
-        ("18TWN", "Unknown", "Incomplete MGRS"),
-        
-        # None/null cases
-        (None, "Invalid", "None input"),
-        (123, "Invalid", "Non-string input"),
-    ]
-    
     success_count = 0
-    total_count = len(edge_cases)
+    total_count = len(PATTERN_EDGE_CASES)
+    failures = []
     
-    for i, (input_val, expected, description) in enumerate(edge_cases, 1):
-        print(f"\nTest {i}: {description}")
-        print(f"Input: {repr(input_val)}")
-        print("-" * 60)
-        
+    for i, (input_val, expected, description) in enumerate(PATTERN_EDGE_CASES, 1):
         detected = detect_format(input_val)
-        print(f"Expected: {expected}")
-        print(f"Detected: {detected}")
-        
-        if detected == expected:
-            print("✓ PASS")
+        passed = detected == expected
+        if passed:
             success_count += 1
         else:
-            print("✗ FAIL")
+            failures.append(f"Test {i}: {description} - {input_val!r} expected {expected}, detected {detected}")
+        
+        if VERBOSE:
+            print(f"\nTest {i}: {description}")
+            print(f"Input: {repr(input_val)}")
+            print("-" * 60)
+            print(f"Expected: {expected}")
+            print(f"Detected: {detected}")
+            print("✓ PASS" if passed else "✗ FAIL")
     
     print("\n" + "=" * 80)
+    for failure in failures:
+        print(f"✗ {failure}")
     print(f"EDGE CASE RESULTS: {success_count}/{total_count} passed ({success_count/total_count*100:.1f}%)")
     print("=" * 80)
     
@@ -231,155 +657,162 @@ def test_coordinate_validation_edge_cases():
     print("COORDINATE VALIDATION EDGE CASES")  
     print("=" * 80)
     
-    def validate_coordinates_advanced(coord1, coord2, user_preference="lat_lon"):
-        """Advanced coordinate validation with edge case handling"""
-        
-        # Handle special cases
-        if coord1 is None or coord2 is None:
-            return None, None, "Null coordinates"
-        if not isinstance(coord1, (int, float)) or not isinstance(coord2, (int, float)):
-            return None, None, "Non-numeric coordinates"
-        if math.isnan(coord1) or math.isnan(coord2) or math.isinf(coord1) or math.isinf(coord2):
-            return None, None, "Invalid numeric values"
-            
-        # Define validation ranges
-        def is_valid_lat(lat):
-            return -90 <= lat <= 90
-        def is_valid_lon(lon):
-            return -180 <= lon <= 180
-            
-        # Check both possible orders
-        lat_lon_valid = is_valid_lat(coord1) and is_valid_lon(coord2)
-        lon_lat_valid = is_valid_lat(coord2) and is_valid_lon(coord1)
-        
-        # Handle exact boundary cases
-        def describe_position(lat, lon):
-            special_cases = []
-            if lat == 90: special_cases.append("North Pole")
-            elif lat == -90: special_cases.append("South Pole")
-            elif lat == 0: special_cases.append("Equator")
-            
-            if lon == 180 or lon == -180: special_cases.append("Date Line")
-            elif lon == 0: special_cases.append("Prime Meridian")
-            
-            return " & ".join(special_cases) if special_cases else None
-            
-        # Decision logic
-        if lat_lon_valid and lon_lat_valid:
-            # Both orders valid - check for edge cases
-            if coord1 == coord2:
-                return coord1, coord2, "Equal coordinates - ambiguous"
-            elif abs(coord1) == abs(coord2):
-                return coord1, coord2, "Symmetric coordinates - ambiguous"
-            else:
-                # Use user preference for truly ambiguous cases
-                if user_preference == "lon_lat":
-                    final_lat, final_lon = coord2, coord1
-                    special = describe_position(final_lat, final_lon)
-                    desc = f"Ambiguous - used Lon/Lat preference" + (f" ({special})" if special else "")
-                    return final_lat, final_lon, desc
-                else:
-                    final_lat, final_lon = coord1, coord2
-                    special = describe_position(final_lat, final_lon)
-                    desc = f"Ambiguous - used Lat/Lon preference" + (f" ({special})" if special else "")
-                    return final_lat, final_lon, desc
-                    
-        elif lat_lon_valid:
-            special = describe_position(coord1, coord2)
-            desc = f"Valid Lat/Lon order" + (f" ({special})" if special else "")
-            return coord1, coord2, desc
-            
-        elif lon_lat_valid:
-            special = describe_position(coord2, coord1)
-            desc = f"Auto-corrected to Lat/Lon" + (f" ({special})" if special else "")
-            return coord2, coord1, desc
-            
-        else:
-            # Neither order valid - provide detailed error
-            lat1_err = "✓" if is_valid_lat(coord1) else f"✗ ({coord1} ∉ [-90,90])"
-            lon1_err = "✓" if is_valid_lon(coord2) else f"✗ ({coord2} ∉ [-180,180])"
-            lat2_err = "✓" if is_valid_lat(coord2) else f"✗ ({coord2} ∉ [-90,90])"  
-            lon2_err = "✓" if is_valid_lon(coord1) else f"✗ ({coord1} ∉ [-180,180])"
-            
-            desc = f"Invalid both ways: As Lat/Lon: lat{lat1_err} lon{lon1_err}, As Lon/Lat: lat{lat2_err} lon{lon2_err}"
-            return None, None, desc
-    
-    edge_cases = [
-        # Boundary coordinates
-        (90.0, 180.0, "lat_lon", "Maximum valid coordinates"),
-        (-90.0, -180.0, "lat_lon", "Minimum valid coordinates"), 
-        (90.0, -180.0, "lat_lon", "North Pole at Date Line"),
-        (-90.0, 180.0, "lat_lon", "South Pole at Date Line"),
-        (0.0, 0.0, "lat_lon", "Origin (Null Island)"),
-        (0.0, 180.0, "lat_lon", "Equator at Date Line"),
-        (90.0, 0.0, "lat_lon", "North Pole at Prime Meridian"),
-        
-        # Just over boundaries
-        (90.0000001, 0.0, "lat_lon", "Just over North Pole"),
-        (-90.0000001, 0.0, "lat_lon", "Just under South Pole"),
-        (0.0, 180.0000001, "lat_lon", "Just over Date Line positive"),
-        (0.0, -180.0000001, "lat_lon", "Just under Date Line negative"),
-        (91.0, 0.0, "lat_lon", "Clearly invalid latitude"),
-        (0.0, 181.0, "lat_lon", "Clearly invalid longitude"),
-        
-        # Ambiguous cases
-        (45.0, 45.0, "lat_lon", "Equal coordinates - Lat/Lon preference"),
-        (45.0, 45.0, "lon_lat", "Equal coordinates - Lon/Lat preference"), 
-        (-45.0, -45.0, "lat_lon", "Equal negative coordinates"),
-        (30.0, -30.0, "lat_lon", "Symmetric coordinates"),
-        (89.0, 179.0, "lat_lon", "Near boundaries - both valid"),
-        
-        # Precision edge cases
-        (40.712812345678901234, -74.006012345678901234, "lat_lon", "High precision coordinates"),
-        (40, -74, "lat_lon", "Integer coordinates"),
-        (40.0, -74.0, "lat_lon", "Float coordinates"),
-        
-        # Scientific notation
-        (4.07128e1, -7.40060e1, "lat_lon", "Scientific notation"),
-        (1.23e-10, 5.67e-11, "lat_lon", "Very small coordinates"),
-        
-        # Special numeric values
-        (float('nan'), 40.0, "lat_lon", "NaN latitude"),
-        (40.0, float('nan'), "lat_lon", "NaN longitude"),
-        (float('inf'), 40.0, "lat_lon", "Infinite latitude"),
-        (40.0, float('-inf'), "lat_lon", "Negative infinite longitude"),
-        (None, 40.0, "lat_lon", "None latitude"),
-        (40.0, None, "lat_lon", "None longitude"),
-        ("40.0", "-74.0", "lat_lon", "String coordinates"),
-        
-        # Large projected coordinates
-        (585398.0, 4511518.0, "lat_lon", "UTM coordinates (invalid as WGS84)"),
-        (1000000.0, 2000000.0, "lat_lon", "Large projected coordinates"),
-        
-        # Zero and near-zero
-        (0.0, 0.0, "lat_lon", "Exact origin"),
-        (0.000001, 0.000001, "lat_lon", "Very small coordinates"),
-        (-0.0, -0.0, "lat_lon", "Negative zero"),
-    ]
-    
     success_count = 0
+    scalar_rows = VALIDATION_EDGE_CASES
     
-    for coord1, coord2, preference, description in edge_cases:
-        print(f"\nTest: {description}")
-        print(f"Input: ({coord1}, {coord2}) with {preference} preference")
-        print("-" * 70)
+    if NUMPY_AVAILABLE:
+        # Numeric rows go through the batch kernel in a single sweep
+        lats, lons, flags = validate_coordinates_batch(VALIDATION_C1, VALIDATION_C2, VALIDATION_LON_LAT)
+        success_count += int((flags != FLAG_INVALID).sum())
+        if VERBOSE:
+            for description, result_lat, result_lon, flag in zip(VALIDATION_DESC, lats, lons, flags):
+                print(f"\nTest: {description}")
+                print("-" * 70)
+                if flag != FLAG_INVALID:
+                    print(f"✓ Result: lat={result_lat:.10f}, lon={result_lon:.10f}")
+                else:
+                    print("✗ Failed: Invalid both ways")
+        scalar_rows = _SCALAR_ROWS
+    
+    for coord1, coord2, preference, description in scalar_rows:
+        if VERBOSE:
+            print(f"\nTest: {description}")
+            print(f"Input: ({coord1}, {coord2}) with {preference} preference")
+            print("-" * 70)
         
         try:
             result_lat, result_lon, analysis = validate_coordinates_advanced(coord1, coord2, preference)
             
             if result_lat is not None and result_lon is not None:
-                print(f"✓ Result: lat={result_lat:.10f}, lon={result_lon:.10f}")
-                print(f"  Analysis: {analysis}")
                 success_count += 1
-            else:
+                if VERBOSE:
+                    print(f"✓ Result: lat={result_lat:.10f}, lon={result_lon:.10f}")
+                    print(f"  Analysis: {analysis}")
+            elif VERBOSE:
                 print(f"✗ Failed: {analysis}")
                 
         except Exception as e:
-            print(f"✗ Exception: {str(e)}")
+            print(f"✗ Exception in '{description}': {str(e)}")
     
     print(f"\nValidation tests completed: {success_count} valid results")
     return success_count
 
+
+def test_coordinate_validation_batch_kernel():
+    """Batch kernel must agree with the scalar validator on numeric input"""
+    if not NUMPY_AVAILABLE:
+        raise unittest.SkipTest("NumPy not available")
+
+    pairs = [
+        (40.7128, -74.0060, "lat_lon"),
+        (-74.0060, 40.7128, "lat_lon"),
+        (45.0, 45.0, "lon_lat"),
+        (30.0, -30.0, "lon_lat"),
+        (10.0, 20.0, "lon_lat"),
+        (90.0, 180.0, "lat_lon"),
+        (91.0, 181.0, "lat_lon"),
+        (float('nan'), 40.0, "lat_lon"),
+        (float('inf'), 40.0, "lat_lon"),
+    ]
+    c1 = [p[0] for p in pairs]
+    c2 = [p[1] for p in pairs]
+    prefs = [p[2] == "lon_lat" for p in pairs]
+
+    lat, lon, flag = validate_coordinates_batch(c1, c2, prefs)
+
+    for i, (coord1, coord2, preference) in enumerate(pairs):
+        exp_lat, exp_lon, _ = validate_coordinates_advanced(coord1, coord2, preference)
+        if exp_lat is None:
+            assert flag[i] == FLAG_INVALID, f"Row {i} should be invalid"
+            assert math.isnan(lat[i]) and math.isnan(lon[i])
+        else:
+            assert flag[i] != FLAG_INVALID, f"Row {i} should be valid"
+            assert (lat[i], lon[i]) == (exp_lat, exp_lon), f"Row {i}: {(lat[i], lon[i])} != {(exp_lat, exp_lon)}"
+
+
+# Copy-paste cleanup patterns; each label pattern is paired with a
+# lowercase substring that must be present for it to possibly match
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+_LABEL_PATTERNS = (
+    ('coordinate', re.compile(r'Coordinates?:?\s*', re.IGNORECASE)),
+    ('lat', re.compile(r'Lat(itude)?:?\s*', re.IGNORECASE)),
+    ('lon', re.compile(r'Lon(gitude)?:?\s*', re.IGNORECASE)),
+    ('location', re.compile(r'Location:?\s*', re.IGNORECASE)),
+)
+_TRAILING_PARENS_RE = re.compile(r'\([^)]*\)$')
+
+
+def detect_with_cleanup(text):
+    """Detect format with input cleanup"""
+    if not text or not isinstance(text, str):
+        return "Invalid"
+        
+    # Clean common copy-paste artifacts
+    cleaned = text.strip()
+    cleaned = _NON_ASCII_RE.sub('', cleaned)  # Remove non-ASCII
+    cleaned = _WHITESPACE_RE.sub(' ', cleaned)  # Normalize whitespace
+    
+    # Strip labels, skipping the regex when its keyword is absent
+    lower = cleaned.lower()
+    for keyword, pattern in _LABEL_PATTERNS:
+        if keyword in lower:
+            stripped = pattern.sub('', cleaned)
+            if stripped != cleaned:
+                cleaned = stripped
+                lower = cleaned.lower()
+    
+    cleaned = _TRAILING_PARENS_RE.sub('', cleaned)  # Remove trailing parentheses
+    
+    # Apply standard detection
+    return detect_format_enhanced(cleaned)
+
+
+SCENARIO_EDGE_CASES = (
+    # Google Maps copy-paste
+    ("40.7128° N, 74.0060° W", "DMS", "Google Maps format"),
+    ("40.7128, -74.0060", "Decimal", "Google Maps coordinates"),
+    
+    # Wikipedia copy-paste  
+    ("40°42′46″N 74°00′22″W﻿", "DMS", "Wikipedia with Unicode"),
+    ("Coordinates: 40.7128°N 74.0060°W", "DMS", "Wikipedia with label"),
+    
+    # GPS device outputs
+    ("N40°42.768' W074°00.360'", "DMS", "GPS decimal minutes"),
+    ("40° 42' 46.1\" N, 74° 0' 21.6\" W", "DMS", "GPS full DMS"),
+    
+    # Survey data
+    ("UTM Zone 18T: 585398 4511518", "UTM", "Survey UTM format"),
+    ("18T 0585398 4511518", "UTM", "Zero-padded UTM"),
+    
+    # Military coordinates
+    ("18T WN 85400 11518", "MGRS", "Military grid with spaces"),
+    ("18TWN8540011518", "MGRS", "Compact military grid"),
+    
+    # Scientific papers  
+    ("Lat: 40.7128, Lon: -74.0060", "Decimal", "Scientific paper format"),
+    ("40.7128N, 74.0060W", "DMS", "Paper without degree symbols"),
+    
+    # Aviation
+    ("N40424600 W0740021600", "DMS", "Aviation format"),
+    ("404246N 0740216W", "DMS", "Compact aviation"),
+    
+    # Programming/APIs
+    ('[40.7128, -74.0060]', "Decimal", "JSON array format"),
+    ('{"lat": 40.7128, "lng": -74.0060}', "GeoJSON", "JSON object"),
+    ('Point(-74.0060 40.7128)', "WKT", "PostGIS format"),
+    
+    # Messy real-world input
+    ("  Latitude: 40.7128,   Longitude: -74.0060  ", "Decimal", "Messy spacing"),
+    ("40.7128° -74.0060°", "DMS", "Mixed format"),
+    ("Location: 40.7128, -74.0060 (New York)", "Decimal", "With description"),
+    
+    # Copy errors
+    ("40.7128,", "Unknown", "Missing longitude"),
+    ("40.7128, -74.0060, 10", "Decimal", "Extra elevation"),
+    ("40.7128 N -74.0060", "DMS", "Missing cardinal for longitude"),
+)
+
+
 def test_real_world_scenarios():
     """Test real-world copy-paste scenarios"""
     
@@ -387,175 +820,34 @@ def test_real_world_scenarios():
     print("REAL-WORLD COPY-PASTE SCENARIOS")
     print("=" * 80)
     
-    scenarios = [
-        # Google Maps copy-paste
-        ("40.7128° N, 74.0060° W", "DMS", "Google Maps format"),
-        ("40.7128, -74.0060", "Decimal", "Google Maps coordinates"),
-        
-        # Wikipedia copy-paste  
-        ("40°42′46″N 74°00′22″W﻿", "DMS", "Wikipedia with Unicode"),
-        ("Coordinates: 40.7128°N 74.0060°W", "DMS", "Wikipedia with label"),
-        
-        # GPS device outputs
-        ("N40°42.768' W074°00.360'", "DMS", "GPS decimal minutes"),
-        ("40° 42' 46.1\" N, 74° 0' 21.6\" W", "DMS", "GPS full DMS"),
-        
-        # Survey data
-        ("UTM Zone 18T: 585398 4511518", "UTM", "Survey UTM format"),
-        ("18T 0585398 4511518", "UTM", "Zero-padded UTM"),
-        
-        # Military coordinates
-        ("18T WN 85400 11518", "MGRS", "Military grid with spaces"),
-        ("18TWN8540011518", "MGRS", "Compact military grid"),
-        
-        # Scientific papers  
-        ("Lat: 40.7128, Lon: -74.0060", "Decimal", "Scientific paper format"),
-        ("40.7128N, 74.0060W", "DMS", "Paper without degree symbols"),
-        
-        # Aviation
-        ("N40424600 W0740021600", "DMS", "Aviation format"),
-        ("404246N 0740216W", "DMS", "Compact aviation"),
-        
-        # Programming/APIs
-        ('[40.7128, -74.0060]', "Decimal", "JSON array format"),
-        ('{"lat": 40.7128, "lng": -74.0060}', "GeoJSON", "JSON object"),
-        ('Point(-74.0060 40.7128)', "WKT", "PostGIS format"),
-        
-        # Messy real-world input
-        ("  Latitude: 40.7128,   Longitude: -74.0060  ", "Decimal", "Messy spacing"),
-        ("40.7128° -74.0060°", "DMS", "Mixed format"),
-        ("Location: 40.7128, -74.0060 (New York)", "Decimal", "With description"),
-        
-        # Copy errors
-        ("40.7128,", "Unknown", "Missing longitude"),
-        ("40.7128, -74.0060, 10", "Decimal", "Extra elevation"),
-        ("40.7128 N -74.0060", "DMS", "Missing cardinal for longitude"),
-    ]
-    
-    def detect_with_cleanup(text):
-        """Detect format with input cleanup"""
-        if not text or not isinstance(text, str):
-            return "Invalid"
-            
-        # Clean common copy-paste artifacts
-        cleaned = text.strip()
-        cleaned = re.sub(r'[^\x00-\x7F]+', '', cleaned)  # Remove non-ASCII
-        cleaned = re.sub(r'\s+', ' ', cleaned)  # Normalize whitespace
-        cleaned = re.sub(r'Coordinates?:?\s*', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'Lat(itude)?:?\s*', '', cleaned, flags=re.IGNORECASE) 
-        cleaned = re.sub(r'Lon(gitude)?:?\s*', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'Location:?\s*', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\([^)]*\)$', '', cleaned)  # Remove trailing parentheses
-        
-        # Apply standard detection
-        return detect_format_enhanced(cleaned)
-    
-    def detect_format_enhanced(text):
-        """Enhanced format detection for real-world cases"""
-        if not text or not isinstance(text, str):
-            return "Invalid"
-            
-        text = text.strip()
-        if not text:
-            return "Empty"
-            
-        # Phase 1: Explicit formats
-        if re.search(r'SRID=\d+;', text, re.IGNORECASE):
-            return "EWKT"
-        if re.search(r'POINT[ZM]*\s*\(', text, re.IGNORECASE):
-            return "WKT"
-        if re.search(r'MULTIPOINT\s*\(', text, re.IGNORECASE):
-            return "WKT"
-        if re.search(r'POLYGON\s*\(', text, re.IGNORECASE):
-            return "WKT"
-        if re.match(r'^[0-9A-Fa-f\s]+$', text) and len(text.replace(' ', '')) >= 20:
-            return "WKB"
-            
-        # Phase 2: Existing formats
-        text_upper = text.upper().strip()
-        text_clean = re.sub(r'\s+', '', text_upper)
-        
-        # MGRS pattern (most specific first)
-        if re.match(r'^\d{1,2}[A-Z]{3}\d+$', text_clean):
-            return "MGRS"
-            
-        # GEOREF pattern (before geohash)
-        if re.match(r'^[A-Z]{4}\d{2,}$', text_upper):
-            return "GEOREF"
-            
-        # Plus Codes pattern  
-        if '+' in text and re.search(r'[23456789CFGHJMPQRVWX]{4,8}\+[23456789CFGHJMPQRVWX]{2,}', text_upper):
-            return "Plus Codes"
-            
-        # Maidenhead grid (case insensitive)
-        if re.match(r'^[A-R]{2}\d{2}([A-X]{2}([A-X]{2})?)?$', text_upper):
-            return "Maidenhead"
-            
-        # Geohash (after GEOREF and Maidenhead)
-        if (re.match(r'^[0-9BCDEFGHJKMNPQRSTUVWXYZ]+$', text_upper) and 
-            4 <= len(text_clean) <= 12 and
-            not re.match(r'^[A-Z]{4}\d{2,}$', text_upper)):
-            return "Geohash"
-            
-        # UTM patterns
-        if ('UTM' in text_upper or 
-            re.search(r'\d{1,2}[A-Z]\s+\d+\s+\d+', text) or
-            re.search(r'ZONE\s*\d{1,2}', text_upper)):
-            return "UTM"
-            
-        # UPS pattern
-        if 'UPS' in text_upper:
-            return "UPS"
-            
-        # GeoJSON pattern
-        if (text.strip().startswith('{') and 
-            ('"type"' in text or '"lat"' in text or '"lng"' in text or '"coordinates"' in text)):
-            return "GeoJSON"
-            
-        # H3 pattern
-        if re.match(r'^[0-9a-fA-F]{15}$', text_clean):
-            return "H3"
-            
-        # Phase 3: Basic coordinates
-        # DMS with cardinal directions
-        if re.search(r'[NSEW°′″]', text):
-            return "DMS"
-            
-        # Decimal coordinates
-        numbers = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', text)
-        if len(numbers) >= 2:
-            try:
-                coord1, coord2 = float(numbers[0]), float(numbers[1])
-                if (abs(coord1) <= 90 and abs(coord2) <= 180) or (abs(coord2) <= 90 and abs(coord1) <= 180):
-                    return "Decimal"
-                elif abs(coord1) <= 90000000 and abs(coord2) <= 90000000:
-                    return "Projected"
-            except (ValueError, OverflowError):
-                pass
-                
-        return "Unknown"
-    
     success_count = 0
+    failures = []
     
-    for input_text, expected, description in scenarios:
-        print(f"\nScenario: {description}")
-        print(f"Input: {repr(input_text)}")
-        print("-" * 60)
-        
+    for input_text, expected, description in SCENARIO_EDGE_CASES:
         detected = detect_with_cleanup(input_text)
-        print(f"Expected: {expected}")
-        print(f"Detected: {detected}")
-        
-        if detected == expected or (detected != "Unknown" and expected != "Unknown"):
-            print("✓ PASS")
+        passed = detected == expected or (detected != "Unknown" and expected != "Unknown")
+        if passed:
             success_count += 1
         else:
-            print("✗ FAIL")
+            failures.append(f"Scenario: {description} - {input_text!r} expected {expected}, detected {detected}")
+        
+        if VERBOSE:
+            print(f"\nScenario: {description}")
+            print(f"Input: {repr(input_text)}")
+            print("-" * 60)
+            print(f"Expected: {expected}")
+            print(f"Detected: {detected}")
+            print("✓ PASS" if passed else "✗ FAIL")
     
-    print(f"\nReal-world scenarios: {success_count}/{len(scenarios)} handled correctly")
-    return success_count, len(scenarios)
+    for failure in failures:
+        print(f"\n✗ {failure}")
+    print(f"\nReal-world scenarios: {success_count}/{len(SCENARIO_EDGE_CASES)} handled correctly")
+    return success_count, len(SCENARIO_EDGE_CASES)
 
 if __name__ == "__main__":
+    # Let stdout batch writes instead of flushing on every line
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("COMPREHENSIVE SMART PARSER EDGE CASE TESTING")
     print("=" * 80)
     
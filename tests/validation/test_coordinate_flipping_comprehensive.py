@@ -15,57 +15,309 @@ Covers:
 
 import sys
 import os
+import re
 import unittest
+from dataclasses import dataclass
+from functools import lru_cache
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
+# Per-case diagnostics are only printed with COORD_TEST_VERBOSE=1
+_VERBOSE = os.environ.get('COORD_TEST_VERBOSE') == '1'
+
+# Pre-compiled patterns for the extraction helpers
+_NUM_RE = re.compile(r'[-+]?\d*\.?\d+')
+# Inputs made only of these characters can be tokenized with str.split
+_PLAIN_NUMBER_CHARS = frozenset('0123456789.+-, \t\n\r\f\v')
+# Case-sensitive so SRE can use its literal prefix scan; lowercase WKT is
+# upper-cased only after a miss
+_POINT_PATTERN = r'POINT\s*(?:Z\s*|M\s*)?\(\s*([-+]?\d*\.?\d+)\s+([-+]?\d*\.?\d+)(?:\s+[-+]?\d*\.?\d+)?\s*\)'
+_WKT_RE = re.compile(_POINT_PATTERN)
+_EWKT_RE = re.compile(r'SRID=(\d+);(.+)')
+# SRID prefix and POINT body in one pass for the common 'SRID=n;POINT(...)' form
+_EWKT_POINT_RE = re.compile(r'SRID=(\d+);' + _POINT_PATTERN)
+
+# Swap decisions indexed by (lat_lon_valid << 2 | lon_lat_valid << 1 | prefers_lon_lat).
+# Ambiguous pairs follow the user preference, a single valid order always
+# wins, and pairs invalid both ways are returned unchanged.
+_COORD_SWAP_BY_CODE = (
+    False, False,  # neither order valid
+    True, True,    # only Lon/Lat valid - auto-correct
+    False, False,  # only Lat/Lon valid
+    False, True,   # both valid - use preference
+)
+
+
+@lru_cache(maxsize=None)
+def _mock_coordinate_validation(coord1, coord2, user_order):
+    """Mock the coordinate validation logic"""
+    # Each bound is checked once per coordinate
+    lat1_ok = -90 <= coord1 <= 90
+    lon1_ok = -180 <= coord1 <= 180
+    lat2_ok = -90 <= coord2 <= 90
+    lon2_ok = -180 <= coord2 <= 180
+    
+    lat_lon_valid = lat1_ok & lon2_ok
+    lon_lat_valid = lat2_ok & lon1_ok
+    
+    code = (lat_lon_valid << 2) | (lon_lat_valid << 1) | (user_order != 0)
+    if _COORD_SWAP_BY_CODE[code]:
+        return (coord2, coord1)
+    return (coord1, coord2)
+
+# Optional NumPy batch validation and JIT-compiled number scanner; the
+# scalar helpers above are the fallback
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMPY_AVAILABLE:
+    def _mock_coordinate_validation_batch(coord1, coord2, user_order):
+        """Vectorized _mock_coordinate_validation over arrays of pairs"""
+        lat1_ok = (coord1 >= -90) & (coord1 <= 90)
+        lon1_ok = (coord1 >= -180) & (coord1 <= 180)
+        lat2_ok = (coord2 >= -90) & (coord2 <= 90)
+        lon2_ok = (coord2 >= -180) & (coord2 <= 180)
+
+        lat_lon_valid = lat1_ok & lon2_ok
+        lon_lat_valid = lat2_ok & lon1_ok
+
+        swap = lon_lat_valid & (~lat_lon_valid | (user_order != 0))
+        return np.where(swap, coord2, coord1), np.where(swap, coord1, coord2)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _scan_floats(buf):
+        """Scan ASCII bytes for the same tokens as _NUM_RE in a single pass
+
+        Returns (values, count, exact). exact is False if a token had more
+        than 15 significant digits, where the int/power-of-ten division is no
+        longer guaranteed to round like float().
+        """
+        n = buf.shape[0]
+        values = np.empty(n // 2 + 1, np.float64)
+        count = 0
+        exact = True
+        i = 0
+        while i < n:
+            j = i
+            negative = False
+            if buf[j] == 43 or buf[j] == 45:  # '+' or '-'
+                negative = buf[j] == 45
+                j += 1
+            mantissa = 0
+            digits = 0
+            frac_digits = 0
+            while j < n and 48 <= buf[j] <= 57:
+                if digits < 15:
+                    mantissa = mantissa * 10 + (buf[j] - 48)
+                digits += 1
+                j += 1
+            if j + 1 < n and buf[j] == 46 and 48 <= buf[j + 1] <= 57:  # '.' then digit
+                j += 1
+                while j < n and 48 <= buf[j] <= 57:
+                    if digits < 15:
+                        mantissa = mantissa * 10 + (buf[j] - 48)
+                    digits += 1
+                    frac_digits += 1
+                    j += 1
+            if digits == 0:
+                i += 1
+                continue
+            if digits > 15:
+                exact = False
+            value = mantissa / 10.0 ** frac_digits
+            values[count] = -value if negative else value
+            count += 1
+            i = j
+        return values, count, exact
+
+# Test cases, shared by every run of the suite
+_DECIMAL_CASES = (
+    # (input, user_order, expected_lat, expected_lon, description)
+    # Standard cases - should flip when user order is invalid
+    ("35.43833809, 139.39726213", 1, 35.43833809, 139.39726213, "Tokyo coordinates in Lon/Lat mode - should flip"),
+    ("139.39726213, 35.43833809", 0, 35.43833809, 139.39726213, "Tokyo coordinates in Lat/Lon mode - should flip"),
+    
+    # Valid in both orders (ambiguous) - respect user preference  
+    ("40.7128, -74.0060", 0, 40.7128, -74.0060, "NYC coordinates in Lat/Lon mode - ambiguous, use preference"),
+    ("40.7128, -74.0060", 1, -74.0060, 40.7128, "NYC coordinates in Lon/Lat mode - ambiguous, use preference"),
+    
+    # Edge cases
+    ("90.0, 180.0", 0, 90.0, 180.0, "Extreme coordinates in Lat/Lon mode"),
+    ("180.0, 90.0", 0, 90.0, 180.0, "Extreme coordinates flipped in Lat/Lon mode"),
+    ("-90.0, -180.0", 1, -90.0, -180.0, "Extreme negative coordinates in Lon/Lat mode"),
+    
+    # Origin and zero cases
+    ("0.0, 0.0", 0, 0.0, 0.0, "Origin coordinates - ambiguous"),
+    ("0.0, 0.0", 1, 0.0, 0.0, "Origin coordinates - ambiguous"),
+)
+
+_WKT_CASES = (
+    # (wkt_input, expected_lat, expected_lon, should_flip, description)
+    ("POINT(35.43833809 139.39726213)", 35.43833809, 139.39726213, True, "Tokyo WKT - should flip to standard"),
+    ("POINT(139.39726213 35.43833809)", 35.43833809, 139.39726213, False, "Tokyo WKT - already correct"),
+    ("POINT(-74.0060 40.7128)", 40.7128, -74.0060, False, "NYC WKT - correct standard order"),
+    ("POINT(40.7128 -74.0060)", -74.0060, 40.7128, True, "NYC WKT - should flip"),
+    
+    # Edge cases
+    ("POINT(180.0 90.0)", 90.0, 180.0, False, "Extreme coordinates - correct order"),
+    ("POINT(90.0 180.0)", 90.0, 180.0, True, "Extreme coordinates - should flip (90.0 is valid lat)"),
+    
+    # Ambiguous cases (both orders valid)
+    ("POINT(45.0 45.0)", 45.0, 45.0, False, "Ambiguous coordinates - keep standard"),
+    ("POINT(0.0 0.0)", 0.0, 0.0, False, "Origin - keep standard"),
+    
+    # 3D coordinates (ignore Z)
+    ("POINT(35.43833809 139.39726213 100.0)", 35.43833809, 139.39726213, True, "3D Tokyo WKT - flip XY only"),
+)
+
+_EWKT_CASES = (
+    # (ewkt_input, epsg, expected_lat, expected_lon, should_validate, description)
+    ("SRID=4326;POINT(35.43833809 139.39726213)", 4326, 35.43833809, 139.39726213, True, "Geographic CRS - should flip"),
+    ("SRID=4326;POINT(139.39726213 35.43833809)", 4326, 35.43833809, 139.39726213, True, "Geographic CRS - correct order"),
+    ("SRID=3857;POINT(15538711.096309 4235210.185150)", 3857, 15538711.096309, 4235210.185150, False, "Projected CRS - no validation"),
+    
+    # Invalid geographic coordinates  
+    ("SRID=4326;POINT(200.0 100.0)", 4326, 100.0, 200.0, True, "Invalid both ways - geographic CRS"),
+    
+    # Ambiguous geographic coordinates
+    ("SRID=4326;POINT(45.0 45.0)", 4326, 45.0, 45.0, True, "Ambiguous geographic - keep standard"),
+)
+
+_FORMAT_CASES = (
+    # Format examples that might benefit from coordinate order awareness
+    # (input, format_name, should_parse, notes)
+    ("35.43833809, 139.39726213", "Decimal", True, "Basic decimal - flipping logic applies"),
+    ("18TWN8540011518", "MGRS", True, "MGRS - no flipping needed (format is standardized)"),
+    ("87G7X2VV+2V", "Plus Codes", True, "Plus Codes - no flipping needed (encoded format)"),
+    ("JO65HA", "Maidenhead", True, "Maidenhead - no flipping needed (grid system)"),
+    ("dr5regy", "Geohash", True, "Geohash - no flipping needed (encoded format)"),
+    ("GJPJ0615", "GEOREF", True, "GEOREF - no flipping needed (grid system)"),
+    ("POINT(35.43833809 139.39726213)", "WKT", True, "WKT - flipping logic applies"),
+    ("SRID=4326;POINT(35.43833809 139.39726213)", "EWKT", True, "EWKT - flipping logic applies"),
+    ("40°42'46.1\"N 74°00'21.6\"W", "DMS", True, "DMS - inherent order (cardinal directions)"),
+    
+    # Edge cases
+    ("{\"type\":\"Point\",\"coordinates\":[139.39726213,35.43833809]}", "GeoJSON", True, "GeoJSON - standard lon,lat order"),
+)
+
+_EDGE_CASES = (
+    # (input, expected_behavior, description)
+    ("", "Should fail gracefully", "Empty input"),
+    ("abc, def", "Should fail gracefully", "Non-numeric input"),
+    ("1000.0, 2000.0", "Both invalid - should not flip", "Invalid in both orders"),
+    ("91.0, 181.0", "Both invalid - should not flip", "Both coordinates out of range"),
+    ("45.0", "Should fail - insufficient coordinates", "Single coordinate"),
+    ("45.0, 45.0, 45.0", "Should use first two and ignore third", "Three coordinates"),
+    ("POINT()", "Should fail gracefully", "Empty WKT"),
+    ("POINT(abc def)", "Should fail gracefully", "Invalid WKT coordinates"),
+    ("SRID=9999;POINT(45.0 45.0)", "Should handle unknown SRID", "Unknown SRID"),
+)
+
+# slots=True needs Python 3.10; CI still runs 3.9
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class _CRS:
+    """CRS proxy for the validation helpers, read as plain attributes"""
+    authid: str
+    is_geographic: bool
+    description: str
+    is_valid: bool = True
+
+def _qgis_crs_mock(crs):
+    """QgsCoordinateReferenceSystem-style Mock answering from a _CRS"""
+    mock_crs = Mock()
+    mock_crs.authid.return_value = crs.authid
+    mock_crs.isGeographic.return_value = crs.is_geographic
+    mock_crs.description.return_value = crs.description
+    mock_crs.isValid.return_value = crs.is_valid
+    return mock_crs
+
+class _QgisCoreNamespace(SimpleNamespace):
+    """Stand-in for qgis.core with plain attribute storage
+
+    Names that were not populated up front (e.g. QgsApplication, imported by
+    other suites sharing the process) resolve to a Mock on first access.
+    """
+    
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        value = Mock()
+        setattr(self, name, value)
+        return value
+
 class TestCoordinateFlippingComprehensive(unittest.TestCase):
     """Comprehensive coordinate flipping and validation test suite"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment with mocked QGIS components once per class"""
+        cls.setup_qgis_mocks()
+        cls.setup_smart_parser()
+        
     def setUp(self):
-        """Set up test environment with mocked QGIS components"""
-        self.setup_qgis_mocks()
-        self.setup_smart_parser()
+        """Reset the user coordinate order that tests mutate"""
+        self.settings.zoomToCoordOrder = 1  # Lon/Lat (X,Y) order
         
-    def setup_qgis_mocks(self):
+    @classmethod
+    def setup_qgis_mocks(cls):
         """Mock all QGIS components needed for testing"""
         # Mock QGIS core modules
         sys.modules['qgis'] = Mock()
-        sys.modules['qgis.core'] = Mock()
         sys.modules['qgis.PyQt'] = Mock()
         sys.modules['qgis.PyQt.QtCore'] = Mock()
         
-        # Mock specific QGIS classes
-        mock_crs_4326 = Mock()
-        mock_crs_4326.authid.return_value = 'EPSG:4326'
-        mock_crs_4326.isGeographic.return_value = True
-        mock_crs_4326.description.return_value = 'WGS 84'
-        mock_crs_4326.isValid.return_value = True
-        
-        mock_crs_3857 = Mock()
-        mock_crs_3857.authid.return_value = 'EPSG:3857'
-        mock_crs_3857.isGeographic.return_value = False
-        mock_crs_3857.description.return_value = 'WGS 84 / Pseudo-Mercator'
-        mock_crs_3857.isValid.return_value = True
+        # CRS proxies used by the tests themselves
+        mock_crs_4326 = _CRS('EPSG:4326', True, 'WGS 84')
+        mock_crs_3857 = _CRS('EPSG:3857', False, 'WGS 84 / Pseudo-Mercator')
+        crs_table = {4326: mock_crs_4326, 3857: mock_crs_3857}
         
         # Mock QGIS objects
-        sys.modules['qgis.core'].QgsCoordinateReferenceSystem = Mock()
-        sys.modules['qgis.core'].QgsCoordinateReferenceSystem.fromEpsgId = Mock(side_effect=lambda x: mock_crs_4326 if x == 4326 else mock_crs_3857)
-        sys.modules['qgis.core'].QgsMessageLog = Mock()
-        sys.modules['qgis.core'].Qgis = Mock()
-        sys.modules['qgis.core'].Qgis.Info = 0
-        sys.modules['qgis.core'].QgsGeometry = Mock()
-        sys.modules['qgis.core'].QgsPointXY = Mock()
-        sys.modules['qgis.core'].QgsWkbTypes = Mock()
-        sys.modules['qgis.core'].QgsWkbTypes.PointGeometry = 1
+        # Plain dict lookup: fromEpsgId is pure, so skip Mock call recording.
+        # Any EPSG code other than 4326 resolves to the projected CRS.
+        qgis_crs_table = {epsg: _qgis_crs_mock(crs) for epsg, crs in crs_table.items()}
+        crs_class = Mock()
+        crs_class.fromEpsgId = lambda epsg: qgis_crs_table.get(epsg, qgis_crs_table[3857])
+        
+        # qgis.core is a plain namespace populated in one go; only the
+        # classes the parser calls into remain Mocks
+        sys.modules['qgis.core'] = _QgisCoreNamespace(
+            QgsCoordinateReferenceSystem=crs_class,
+            QgsCoordinateTransform=Mock(),
+            QgsProject=Mock(),
+            QgsRectangle=Mock(),
+            QgsJsonUtils=Mock(),
+            QgsSettings=Mock(),
+            QgsMessageLog=Mock(),
+            Qgis=SimpleNamespace(Info=0, Warning=1, Critical=2),
+            QgsGeometry=Mock(),
+            QgsPointXY=Mock(),
+            QgsWkbTypes=SimpleNamespace(Point=1, PointGeometry=1),
+        )
         
         # Store mock CRS for testing
-        self.mock_crs_4326 = mock_crs_4326
-        self.mock_crs_3857 = mock_crs_3857
+        cls.mock_crs_4326 = mock_crs_4326
+        cls.mock_crs_3857 = mock_crs_3857
+        cls.crs_table = crs_table
         
-    def setup_smart_parser(self):
+    @classmethod
+    def setup_smart_parser(cls):
         """Initialize smart parser with mocked settings"""
         # Mock settings
         mock_settings = Mock()
@@ -81,279 +333,190 @@ class TestCoordinateFlippingComprehensive(unittest.TestCase):
         # Import and create smart parser (with import error handling)
         try:
             from smart_parser import SmartCoordinateParser
-            self.parser = SmartCoordinateParser(mock_settings, mock_iface)
+            cls.parser = SmartCoordinateParser(mock_settings, mock_iface)
         except ImportError:
             # For standalone testing, we'll mock the parser behavior
             print("  ⚠️ Smart parser import failed - using mock implementation")
-            self.parser = None
+            cls.parser = None
         
-        self.settings = mock_settings
+        cls.settings = mock_settings
         
     def test_decimal_coordinate_flipping_cases(self):
         """Test decimal coordinate flipping in various scenarios"""
-        print("\n=== DECIMAL COORDINATE FLIPPING TESTS ===")
-        
-        test_cases = [
-            # (input, user_order, expected_lat, expected_lon, description)
-            # Standard cases - should flip when user order is invalid
-            ("35.43833809, 139.39726213", 1, 35.43833809, 139.39726213, "Tokyo coordinates in Lon/Lat mode - should flip"),
-            ("139.39726213, 35.43833809", 0, 35.43833809, 139.39726213, "Tokyo coordinates in Lat/Lon mode - should flip"),
-            
-            # Valid in both orders (ambiguous) - respect user preference  
-            ("40.7128, -74.0060", 0, 40.7128, -74.0060, "NYC coordinates in Lat/Lon mode - ambiguous, use preference"),
-            ("40.7128, -74.0060", 1, -74.0060, 40.7128, "NYC coordinates in Lon/Lat mode - ambiguous, use preference"),
-            
-            # Edge cases
-            ("90.0, 180.0", 0, 90.0, 180.0, "Extreme coordinates in Lat/Lon mode"),
-            ("180.0, 90.0", 0, 90.0, 180.0, "Extreme coordinates flipped in Lat/Lon mode"),
-            ("-90.0, -180.0", 1, -90.0, -180.0, "Extreme negative coordinates in Lon/Lat mode"),
-            
-            # Origin and zero cases
-            ("0.0, 0.0", 0, 0.0, 0.0, "Origin coordinates - ambiguous"),
-            ("0.0, 0.0", 1, 0.0, 0.0, "Origin coordinates - ambiguous"),
-        ]
-        
-        passed = 0
-        total = len(test_cases)
-        
-        for i, (input_text, user_order, expected_lat, expected_lon, description) in enumerate(test_cases, 1):
-            print(f"\nTest {i}: {description}")
-            print(f"  Input: '{input_text}' with user order {user_order}")
-            
-            # Set user preference
-            self.settings.zoomToCoordOrder = user_order
-            
+        if _VERBOSE:
+            print("\n=== DECIMAL COORDINATE FLIPPING TESTS ===")
+        
+        # Extract every pair up front so validation can run as one batch
+        pairs = []
+        for input_text, user_order, _, _, _ in _DECIMAL_CASES:
             try:
-                # Extract and validate using the parser's logic
                 numbers = self._extract_test_numbers(input_text)
-                if len(numbers) >= 2:
-                    coord1, coord2 = numbers[0], numbers[1]
-                    
-                    # Mock the validation method call
-                    result_lat, result_lon = self._mock_coordinate_validation(coord1, coord2, user_order)
-                    
-                    if abs(result_lat - expected_lat) < 1e-6 and abs(result_lon - expected_lon) < 1e-6:
-                        print(f"  ✅ PASS: Got ({result_lat:.6f}, {result_lon:.6f})")
-                        passed += 1
-                    else:
-                        print(f"  ❌ FAIL: Expected ({expected_lat:.6f}, {expected_lon:.6f}), got ({result_lat:.6f}, {result_lon:.6f})")
-                else:
-                    print(f"  ❌ FAIL: Could not extract coordinates")
+                pairs.append((numbers[0], numbers[1]) if len(numbers) >= 2 else None)
             except Exception as e:
-                print(f"  ❌ FAIL: Exception: {str(e)}")
-        
-        print(f"\nDecimal Coordinates: {passed}/{total} passed ({passed/total*100:.1f}%)")
-        return passed == total
+                pairs.append(e)
+        
+        valid = [i for i, pair in enumerate(pairs) if isinstance(pair, tuple)]
+        results = {}
+        if NUMPY_AVAILABLE and valid:
+            coord1 = np.array([pairs[i][0] for i in valid], dtype=np.float64)
+            coord2 = np.array([pairs[i][1] for i in valid], dtype=np.float64)
+            orders = np.array([_DECIMAL_CASES[i][1] for i in valid])
+            lats, lons = _mock_coordinate_validation_batch(coord1, coord2, orders)
+            results = dict(zip(valid, zip(lats.tolist(), lons.tolist())))
+        else:
+            for i in valid:
+                results[i] = self._mock_coordinate_validation(*pairs[i], _DECIMAL_CASES[i][1])
+        
+        for i, (input_text, user_order, expected_lat, expected_lon, description) in enumerate(_DECIMAL_CASES, 1):
+            with self.subTest(input=input_text, user_order=user_order, description=description):
+                if _VERBOSE:
+                    print(f"\nTest {i}: {description}")
+                    print(f"  Input: '{input_text}' with user order {user_order}")
+                
+                # Set user preference
+                self.settings.zoomToCoordOrder = user_order
+                
+                pair = pairs[i - 1]
+                if isinstance(pair, Exception):
+                    self.fail(f"Exception: {str(pair)}")
+                self.assertIsNotNone(pair, "Could not extract coordinates")
+                
+                result_lat, result_lon = results[i - 1]
+                self.assertAlmostEqual(result_lat, expected_lat, delta=1e-6)
+                self.assertAlmostEqual(result_lon, expected_lon, delta=1e-6)
+                if _VERBOSE:
+                    print(f"  ✅ PASS: Got ({result_lat:.6f}, {result_lon:.6f})")
         
     def test_wkt_coordinate_flipping_cases(self):
         """Test WKT format coordinate flipping"""
-        print("\n=== WKT COORDINATE FLIPPING TESTS ===")
-        
-        test_cases = [
-            # (wkt_input, expected_lat, expected_lon, should_flip, description)
-            ("POINT(35.43833809 139.39726213)", 35.43833809, 139.39726213, True, "Tokyo WKT - should flip to standard"),
-            ("POINT(139.39726213 35.43833809)", 35.43833809, 139.39726213, False, "Tokyo WKT - already correct"),
-            ("POINT(-74.0060 40.7128)", 40.7128, -74.0060, False, "NYC WKT - correct standard order"),
-            ("POINT(40.7128 -74.0060)", -74.0060, 40.7128, True, "NYC WKT - should flip"),
-            
-            # Edge cases
-            ("POINT(180.0 90.0)", 90.0, 180.0, False, "Extreme coordinates - correct order"),
-            ("POINT(90.0 180.0)", 90.0, 180.0, True, "Extreme coordinates - should flip (90.0 is valid lat)"),
-            
-            # Ambiguous cases (both orders valid)
-            ("POINT(45.0 45.0)", 45.0, 45.0, False, "Ambiguous coordinates - keep standard"),
-            ("POINT(0.0 0.0)", 0.0, 0.0, False, "Origin - keep standard"),
-            
-            # 3D coordinates (ignore Z)
-            ("POINT(35.43833809 139.39726213 100.0)", 35.43833809, 139.39726213, True, "3D Tokyo WKT - flip XY only"),
-        ]
-        
-        passed = 0
-        total = len(test_cases)
-        
-        for i, (wkt_input, expected_lat, expected_lon, should_flip, description) in enumerate(test_cases, 1):
-            print(f"\nTest {i}: {description}")
-            print(f"  Input: '{wkt_input}'")
-            
-            try:
+        if _VERBOSE:
+            print("\n=== WKT COORDINATE FLIPPING TESTS ===")
+        
+        for i, (wkt_input, expected_lat, expected_lon, should_flip, description) in enumerate(_WKT_CASES, 1):
+            with self.subTest(input=wkt_input, description=description):
+                if _VERBOSE:
+                    print(f"\nTest {i}: {description}")
+                    print(f"  Input: '{wkt_input}'")
+                
                 # Extract coordinates from WKT
                 coords = self._extract_wkt_coordinates(wkt_input)
-                if coords:
-                    x, y = coords[0], coords[1]
-                    
-                    # Apply coordinate order validation logic
-                    corrected_x, corrected_y = self._mock_geometry_validation(x, y, self.mock_crs_4326)
-                    
-                    # WKT standard: X=lon, Y=lat, so result should be (Y=lat, X=lon)  
-                    result_lat, result_lon = corrected_y, corrected_x
-                    
-                    if abs(result_lat - expected_lat) < 1e-6 and abs(result_lon - expected_lon) < 1e-6:
-                        flip_occurred = (corrected_x != x or corrected_y != y)
-                        flip_status = "✓" if flip_occurred == should_flip else "⚠️"
-                        print(f"  ✅ PASS: Got ({result_lat:.6f}, {result_lon:.6f}) {flip_status}")
-                        passed += 1
-                    else:
-                        print(f"  ❌ FAIL: Expected ({expected_lat:.6f}, {expected_lon:.6f}), got ({result_lat:.6f}, {result_lon:.6f})")
-                else:
-                    print(f"  ❌ FAIL: Could not extract WKT coordinates")
-            except Exception as e:
-                print(f"  ❌ FAIL: Exception: {str(e)}")
-        
-        print(f"\nWKT Coordinates: {passed}/{total} passed ({passed/total*100:.1f}%)")
-        return passed == total
+                self.assertTrue(coords, "Could not extract WKT coordinates")
+                x, y = coords[0], coords[1]
+                
+                # Apply coordinate order validation logic
+                corrected_x, corrected_y, flip_occurred = self._mock_geometry_validation(x, y, self.mock_crs_4326)
+                
+                # WKT standard: X=lon, Y=lat, so result should be (Y=lat, X=lon)  
+                result_lat, result_lon = corrected_y, corrected_x
+                
+                self.assertAlmostEqual(result_lat, expected_lat, delta=1e-6)
+                self.assertAlmostEqual(result_lon, expected_lon, delta=1e-6)
+                if _VERBOSE:
+                    flip_status = "✓" if flip_occurred == should_flip else "⚠️"
+                    print(f"  ✅ PASS: Got ({result_lat:.6f}, {result_lon:.6f}) {flip_status}")
         
     def test_ewkt_coordinate_flipping_cases(self):
         """Test EWKT format coordinate flipping with different CRS"""
-        print("\n=== EWKT COORDINATE FLIPPING TESTS ===")
-        
-        test_cases = [
-            # (ewkt_input, crs, expected_lat, expected_lon, should_validate, description)
-            ("SRID=4326;POINT(35.43833809 139.39726213)", self.mock_crs_4326, 35.43833809, 139.39726213, True, "Geographic CRS - should flip"),
-            ("SRID=4326;POINT(139.39726213 35.43833809)", self.mock_crs_4326, 35.43833809, 139.39726213, True, "Geographic CRS - correct order"),
-            ("SRID=3857;POINT(15538711.096309 4235210.185150)", self.mock_crs_3857, 15538711.096309, 4235210.185150, False, "Projected CRS - no validation"),
-            
-            # Invalid geographic coordinates  
-            ("SRID=4326;POINT(200.0 100.0)", self.mock_crs_4326, 100.0, 200.0, True, "Invalid both ways - geographic CRS"),
-            
-            # Ambiguous geographic coordinates
-            ("SRID=4326;POINT(45.0 45.0)", self.mock_crs_4326, 45.0, 45.0, True, "Ambiguous geographic - keep standard"),
-        ]
-        
-        passed = 0
-        total = len(test_cases)
-        
-        for i, (ewkt_input, mock_crs, expected_result1, expected_result2, should_validate, description) in enumerate(test_cases, 1):
-            print(f"\nTest {i}: {description}")
-            print(f"  Input: '{ewkt_input}'")
-            
-            try:
+        if _VERBOSE:
+            print("\n=== EWKT COORDINATE FLIPPING TESTS ===")
+        
+        for i, (ewkt_input, epsg, expected_result1, expected_result2, should_validate, description) in enumerate(_EWKT_CASES, 1):
+            with self.subTest(input=ewkt_input, description=description):
+                if _VERBOSE:
+                    print(f"\nTest {i}: {description}")
+                    print(f"  Input: '{ewkt_input}'")
+                
                 # Extract SRID and coordinates
                 srid, coords = self._extract_ewkt_components(ewkt_input)
-                if coords and len(coords) >= 2:
-                    x, y = coords[0], coords[1]
-                    
-                    if should_validate and mock_crs.isGeographic():
-                        # Apply coordinate validation for geographic CRS
-                        corrected_x, corrected_y = self._mock_geometry_validation(x, y, mock_crs)
-                        result1, result2 = corrected_y, corrected_x  # lat, lon
-                    else:
-                        # No validation for projected CRS - keep as X, Y
-                        result1, result2 = x, y
-                    
-                    if abs(result1 - expected_result1) < 1e-6 and abs(result2 - expected_result2) < 1e-6:
-                        print(f"  ✅ PASS: Got ({result1:.6f}, {result2:.6f})")
-                        passed += 1
-                    else:
-                        print(f"  ❌ FAIL: Expected ({expected_result1:.6f}, {expected_result2:.6f}), got ({result1:.6f}, {result2:.6f})")
+                self.assertTrue(coords and len(coords) >= 2, "Could not extract EWKT coordinates")
+                x, y = coords[0], coords[1]
+                mock_crs = self.crs_table[epsg]
+                
+                if should_validate and mock_crs.is_geographic:
+                    # Apply coordinate validation for geographic CRS
+                    corrected_x, corrected_y, _ = self._mock_geometry_validation(x, y, mock_crs)
+                    result1, result2 = corrected_y, corrected_x  # lat, lon
                 else:
-                    print(f"  ❌ FAIL: Could not extract EWKT coordinates")
-            except Exception as e:
-                print(f"  ❌ FAIL: Exception: {str(e)}")
-        
-        print(f"\nEWKT Coordinates: {passed}/{total} passed ({passed/total*100:.1f}%)")
-        return passed == total
+                    # No validation for projected CRS - keep as X, Y
+                    result1, result2 = x, y
+                
+                self.assertAlmostEqual(result1, expected_result1, delta=1e-6)
+                self.assertAlmostEqual(result2, expected_result2, delta=1e-6)
+                if _VERBOSE:
+                    print(f"  ✅ PASS: Got ({result1:.6f}, {result2:.6f})")
         
     def test_all_coordinate_formats_with_flipping(self):
         """Test coordinate flipping awareness across all supported formats"""
-        print("\n=== ALL COORDINATE FORMATS FLIPPING AWARENESS ===")
-        
-        test_cases = [
-            # Format examples that might benefit from coordinate order awareness
-            # (input, format_name, should_parse, notes)
-            ("35.43833809, 139.39726213", "Decimal", True, "Basic decimal - flipping logic applies"),
-            ("18TWN8540011518", "MGRS", True, "MGRS - no flipping needed (format is standardized)"),
-            ("87G7X2VV+2V", "Plus Codes", True, "Plus Codes - no flipping needed (encoded format)"),
-            ("JO65HA", "Maidenhead", True, "Maidenhead - no flipping needed (grid system)"),
-            ("dr5regy", "Geohash", True, "Geohash - no flipping needed (encoded format)"),
-            ("GJPJ0615", "GEOREF", True, "GEOREF - no flipping needed (grid system)"),
-            ("POINT(35.43833809 139.39726213)", "WKT", True, "WKT - flipping logic applies"),
-            ("SRID=4326;POINT(35.43833809 139.39726213)", "EWKT", True, "EWKT - flipping logic applies"),
-            ("40°42'46.1\"N 74°00'21.6\"W", "DMS", True, "DMS - inherent order (cardinal directions)"),
-            
-            # Edge cases
-            ("{\"type\":\"Point\",\"coordinates\":[139.39726213,35.43833809]}", "GeoJSON", True, "GeoJSON - standard lon,lat order"),
-        ]
-        
-        passed = 0
-        total = len(test_cases)
-        
-        for i, (input_text, format_name, should_parse, notes) in enumerate(test_cases, 1):
-            print(f"\nTest {i}: {format_name} format")
-            print(f"  Input: '{input_text[:50]}{'...' if len(input_text) > 50 else ''}'")
-            print(f"  Notes: {notes}")
-            
-            try:
+        if _VERBOSE:
+            print("\n=== ALL COORDINATE FORMATS FLIPPING AWARENESS ===")
+        
+        for i, (input_text, format_name, should_parse, notes) in enumerate(_FORMAT_CASES, 1):
+            with self.subTest(input=input_text, format=format_name):
+                if _VERBOSE:
+                    print(f"\nTest {i}: {format_name} format")
+                    print(f"  Input: '{input_text[:50]}{'...' if len(input_text) > 50 else ''}'")
+                    print(f"  Notes: {notes}")
+                
                 # This is more of a conceptual test - in reality we'd need to mock
                 # the entire parsing pipeline. For now, just verify the test structure.
                 expected_behavior = "Should apply coordinate flipping logic" if format_name in ["Decimal", "WKT", "EWKT"] else "No flipping needed"
-                print(f"  Expected behavior: {expected_behavior}")
-                print(f"  ✅ PASS: Test structure validated")
-                passed += 1
-            except Exception as e:
-                print(f"  ❌ FAIL: Exception: {str(e)}")
-        
-        print(f"\nFormat Awareness: {passed}/{total} passed ({passed/total*100:.1f}%)")
-        return passed == total
+                if _VERBOSE:
+                    print(f"  Expected behavior: {expected_behavior}")
+                    print(f"  ✅ PASS: Test structure validated")
         
     def test_edge_cases_and_error_handling(self):
         """Test edge cases and error conditions for coordinate flipping"""
-        print("\n=== EDGE CASES AND ERROR HANDLING ===")
-        
-        test_cases = [
-            # (input, expected_behavior, description)
-            ("", "Should fail gracefully", "Empty input"),
-            ("abc, def", "Should fail gracefully", "Non-numeric input"),
-            ("1000.0, 2000.0", "Both invalid - should not flip", "Invalid in both orders"),
-            ("91.0, 181.0", "Both invalid - should not flip", "Both coordinates out of range"),
-            ("45.0", "Should fail - insufficient coordinates", "Single coordinate"),
-            ("45.0, 45.0, 45.0", "Should use first two and ignore third", "Three coordinates"),
-            ("POINT()", "Should fail gracefully", "Empty WKT"),
-            ("POINT(abc def)", "Should fail gracefully", "Invalid WKT coordinates"),
-            ("SRID=9999;POINT(45.0 45.0)", "Should handle unknown SRID", "Unknown SRID"),
-        ]
-        
-        passed = 0
-        total = len(test_cases)
-        
-        for i, (input_text, expected_behavior, description) in enumerate(test_cases, 1):
-            print(f"\nTest {i}: {description}")
-            print(f"  Input: '{input_text}'")
-            print(f"  Expected: {expected_behavior}")
-            
-            try:
-                # Test basic number extraction for invalid inputs
-                if input_text and not input_text.startswith("POINT") and not input_text.startswith("SRID"):
-                    numbers = self._extract_test_numbers(input_text)
-                    if len(numbers) < 2:
-                        print(f"  ✅ PASS: Correctly identified insufficient coordinates")
-                        passed += 1
-                    elif len(numbers) >= 2:
-                        coord1, coord2 = numbers[0], numbers[1]
-                        is_valid_lat_lon = (-90 <= coord1 <= 90 and -180 <= coord2 <= 180)
-                        is_valid_lon_lat = (-90 <= coord2 <= 90 and -180 <= coord1 <= 180)
-                        
-                        if not is_valid_lat_lon and not is_valid_lon_lat:
-                            print(f"  ✅ PASS: Correctly identified invalid coordinates in both orders")
-                            passed += 1
+        if _VERBOSE:
+            print("\n=== EDGE CASES AND ERROR HANDLING ===")
+        
+        for i, (input_text, expected_behavior, description) in enumerate(_EDGE_CASES, 1):
+            with self.subTest(input=input_text, description=description):
+                if _VERBOSE:
+                    print(f"\nTest {i}: {description}")
+                    print(f"  Input: '{input_text}'")
+                    print(f"  Expected: {expected_behavior}")
+                
+                try:
+                    # Test basic number extraction for invalid inputs
+                    if input_text and not input_text.startswith("POINT") and not input_text.startswith("SRID"):
+                        numbers = self._extract_test_numbers(input_text)
+                        if len(numbers) < 2:
+                            outcome = "Correctly identified insufficient coordinates"
                         else:
-                            print(f"  ✅ PASS: Found valid coordinates, flipping logic would apply")
-                            passed += 1
-                else:
-                    print(f"  ✅ PASS: Complex format test - would be handled by full parser")
-                    passed += 1
-            except Exception as e:
-                print(f"  ✅ PASS: Exception properly handled: {str(e)}")
-                passed += 1
-        
-        print(f"\nEdge Cases: {passed}/{total} passed ({passed/total*100:.1f}%)")
-        return passed == total
+                            coord1, coord2 = numbers[0], numbers[1]
+                            is_valid_lat_lon = (-90 <= coord1 <= 90 and -180 <= coord2 <= 180)
+                            is_valid_lon_lat = (-90 <= coord2 <= 90 and -180 <= coord1 <= 180)
+                            
+                            if not is_valid_lat_lon and not is_valid_lon_lat:
+                                outcome = "Correctly identified invalid coordinates in both orders"
+                            else:
+                                outcome = "Found valid coordinates, flipping logic would apply"
+                    else:
+                        outcome = "Complex format test - would be handled by full parser"
+                except Exception as e:
+                    outcome = f"Exception properly handled: {str(e)}"
+                
+                if _VERBOSE:
+                    print(f"  ✅ PASS: {outcome}")
         
     # Helper methods for testing
     def _extract_test_numbers(self, text):
         """Extract numbers from text for testing"""
-        import re
-        pattern = r'[-+]?\d*\.?\d+'
-        matches = re.findall(pattern, text)
+        # Plain "num, num" input: let str.split tokenize. Restricting the
+        # characters keeps float() from accepting 'nan', '1e5' or '1_0',
+        # which the regex would read differently.
+        if _PLAIN_NUMBER_CHARS.issuperset(text):
+            try:
+                return [float(t) for t in text.replace(',', ' ').split()]
+            except ValueError:
+                pass
+        
+        if NUMBA_AVAILABLE and text.isascii():
+            values, count, exact = _scan_floats(np.frombuffer(text.encode('ascii'), dtype=np.uint8))
+            if exact:
+                return values[:count].tolist()
+        
+        matches = _NUM_RE.findall(text)
         numbers = []
         for match in matches:
             if match and match not in ['.', '-', '+', '']:
@@ -363,78 +526,49 @@ class TestCoordinateFlippingComprehensive(unittest.TestCase):
                     continue
         return numbers
         
-    def _mock_coordinate_validation(self, coord1, coord2, user_order):
-        """Mock the coordinate validation logic"""
-        def is_valid_geographic(lat, lon):
-            return -90 <= lat <= 90 and -180 <= lon <= 180
-        
-        lat_lon_valid = is_valid_geographic(coord1, coord2)
-        lon_lat_valid = is_valid_geographic(coord2, coord1)
-        
-        # Ambiguous case - both valid
-        if lat_lon_valid and lon_lat_valid:
-            if user_order == 0:  # Lat/Lon preference
-                return (coord1, coord2)
-            else:  # Lon/Lat preference  
-                return (coord2, coord1)
-        
-        # Try user's preferred order first
-        if user_order == 0:  # User expects Lat/Lon
-            if lat_lon_valid:
-                return (coord1, coord2)
-            elif lon_lat_valid:
-                return (coord2, coord1)  # Auto-correct
-        else:  # User expects Lon/Lat
-            if lon_lat_valid:
-                return (coord2, coord1)
-            elif lat_lon_valid:
-                return (coord1, coord2)  # Auto-correct
-        
-        # Both invalid - return original
-        return (coord1, coord2)
+    # Pure function of its arguments, shared (and cached) across test methods
+    _mock_coordinate_validation = staticmethod(_mock_coordinate_validation)
         
     def _mock_geometry_validation(self, x, y, crs):
-        """Mock the geometry coordinate validation logic"""
-        if not crs.isGeographic():
-            return x, y  # No validation for projected CRS
-        
-        # For geographic CRS, validate coordinate ranges
-        def is_valid_geographic(lat, lon):
-            return -90 <= lat <= 90 and -180 <= lon <= 180
+        """Mock the geometry coordinate validation logic
+
+        Returns (x, y, flipped), where flipped tells whether X and Y were swapped.
+        """
+        if not crs.is_geographic:
+            return x, y, False  # No validation for projected CRS
         
         # Standard WKT: X=lon, Y=lat
-        standard_valid = is_valid_geographic(y, x)  # Y=lat, X=lon  
-        flipped_valid = is_valid_geographic(x, y)   # X=lat, Y=lon
-        
-        # Both valid - keep standard
-        if standard_valid and flipped_valid:
-            return x, y
-        
-        # Only standard valid
-        if standard_valid and not flipped_valid:
-            return x, y
+        x_lat_ok = -90 <= x <= 90
+        x_lon_ok = -180 <= x <= 180
+        y_lat_ok = -90 <= y <= 90
+        y_lon_ok = -180 <= y <= 180
         
-        # Only flipped valid - flip coordinates
-        if not standard_valid and flipped_valid:
-            return y, x
+        standard_valid = y_lat_ok & x_lon_ok  # Y=lat, X=lon
+        flipped_valid = x_lat_ok & y_lon_ok   # X=lat, Y=lon
         
-        # Both invalid - return original
-        return x, y
+        # Flip only when the standard reading is invalid and the flipped one is valid
+        if flipped_valid and not standard_valid:
+            return y, x, True
+        return x, y, False
         
     def _extract_wkt_coordinates(self, wkt):
         """Extract coordinates from WKT string"""
-        import re
         # Simple regex to extract coordinates from POINT
-        match = re.search(r'POINT\s*(?:Z\s*|M\s*)?\(\s*([-+]?\d*\.?\d+)\s+([-+]?\d*\.?\d+)(?:\s+[-+]?\d*\.?\d+)?\s*\)', wkt, re.IGNORECASE)
+        match = _WKT_RE.search(wkt) or _WKT_RE.search(wkt.upper())
         if match:
             return [float(match.group(1)), float(match.group(2))]
         return None
         
     def _extract_ewkt_components(self, ewkt):
         """Extract SRID and coordinates from EWKT string"""
-        import re
+        # Fast path: a single match, unless it spans a line break (the
+        # general path only looks at the rest of the SRID line)
+        match = _EWKT_POINT_RE.match(ewkt)
+        if match and ewkt.find('\n', 0, match.end()) < 0:
+            return int(match.group(1)), [float(match.group(2)), float(match.group(3))]
+        
         # Extract SRID
-        srid_match = re.match(r'SRID=(\d+);(.+)', ewkt)
+        srid_match = _EWKT_RE.match(ewkt)
         if srid_match:
             srid = int(srid_match.group(1))
             wkt_part = srid_match.group(2)
@@ -442,36 +576,5 @@ class TestCoordinateFlippingComprehensive(unittest.TestCase):
             return srid, coords
         return None, None
         
-def main():
-    """Run comprehensive coordinate flipping tests"""
-    print("🧪 COMPREHENSIVE COORDINATE FLIPPING TEST SUITE")
-    print("=" * 60)
-    
-    # Create test suite
-    test = TestCoordinateFlippingComprehensive()
-    test.setUp()
-    
-    # Run all test categories
-    results = []
-    results.append(test.test_decimal_coordinate_flipping_cases())
-    results.append(test.test_wkt_coordinate_flipping_cases())  
-    results.append(test.test_ewkt_coordinate_flipping_cases())
-    results.append(test.test_all_coordinate_formats_with_flipping())
-    results.append(test.test_edge_cases_and_error_handling())
-    
-    # Summary
-    passed_suites = sum(results)
-    total_suites = len(results)
-    
-    print("\n" + "=" * 60)
-    if passed_suites == total_suites:
-        print("🎉 ALL COMPREHENSIVE COORDINATE FLIPPING TESTS PASSED!")
-        print(f"Test suites passed: {passed_suites}/{total_suites}")
-        return 0
-    else:
-        print("❌ SOME COORDINATE FLIPPING TESTS FAILED")
-        print(f"Test suites passed: {passed_suites}/{total_suites}")
-        return 1
-
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    unittest.main()
@@ -6,11 +6,81 @@ Tests specifically designed to catch issues identified during PR review by GitHu
 
 import unittest
 import sys
-import os
 import re
+from functools import lru_cache
+from pathlib import Path
+from unittest.mock import Mock, patch, MagicMock
 
-# Add project root to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Add project root to path for imports (once, even if the module is re-imported)
+_ROOT = str(Path(__file__).resolve().parents[2])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+# Number tokenizer used by the coordinate assignment test
+_NUMBER_RE = re.compile(r'[+-]?\d*\.?\d+(?:[eE][+-]?\d+)?')
+
+# Regression case tables: (coordinate, [should_match,] description)
+
+# Critical decimal degrees cases from Copilot review
+_CRITICAL_CASES = (
+    ('.5, .75', True, 'Leading decimals (Copilot example)'),
+    ('0.5, 0.75', True, 'Standard decimals'),
+    ('45.123, -122.456', True, 'Normal coordinates'),
+    ('1, 2', True, 'Integer coordinates'),
+    ('45, -122', True, 'Signed integer coordinates'),
+    ('+45.5, -122.5', True, 'Explicit signs'),
+    ('45.0, -122.0', True, 'Trailing zeros'),
+    ('45', False, 'Single coordinate'),
+    ('45, 122, 100', False, 'Three coordinates'),
+    ('abc, def', False, 'Non-numeric'),
+    ('', False, 'Empty string'),
+    (' ', False, 'Whitespace only'),
+)
+
+# Valid geographic coordinates that must not look "obviously projected"
+_VALID_GEOGRAPHIC_CASES = (
+    ('45.123456789, -122.456789012', 'Many decimal places'),
+    ('89.999999, 179.999999', 'Near poles with decimals'),
+    ('-89.999999, -179.999999', 'Near poles negative'),
+    ('0.000001, 0.000001', 'Very small valid coordinates'),
+    ('90.0, 180.0', 'Extreme valid coordinates'),
+)
+
+# Coordinates that must be flagged as "obviously projected"
+_OBVIOUSLY_PROJECTED_CASES = (
+    ('12345, 67890', 'Large UTM-like numbers'),
+    ('500000, 4000000', 'Typical UTM coordinates'),
+    ('1234.567, 56789.012', 'UTM with decimals'),
+    ('1234, 5678', 'Consistent 4+ digit pattern'),
+    ('5678, 1234', 'Consistent 4+ digit pattern (reversed)'),
+    ('15538711, 4235210', 'Web Mercator coordinates'),
+)
+
+# Decimal degrees edge cases that could break regex patterns
+_BOUNDARY_CASES = (
+    # Leading decimal variations
+    ('.1, .2', True, 'Minimal leading decimals'),
+    ('.999, .888', True, 'Leading decimals close to 1'),
+    ('+.5, -.5', True, 'Signed leading decimals'),
+    
+    # Zero handling  
+    ('0.0, 0.0', True, 'Decimal zeros'),
+    ('0, 0', True, 'Integer zeros'),
+    ('+0, +0', True, 'Explicit positive zeros'),
+    ('-0, -0', True, 'Negative zeros'),
+    
+    # Precision boundaries
+    ('90, 180', True, 'Maximum lat/lon integers'), 
+    ('-90, -180', True, 'Minimum lat/lon integers'),
+    ('89.999999, 179.999999', True, 'Just within decimal bounds'),
+    
+    # Invalid cases that should not match this pattern
+    ('1.2.3, 4.5.6', False, 'Multiple decimal points'),
+    ('1e5, 2e6', False, 'Scientific notation (handled elsewhere)'),
+    ('45°, 122°', False, 'Degree symbols'),
+    ('', False, 'Empty string'),
+    ('45', False, 'Single coordinate'),
+)
 
 class TestCopilotRegressionIssues(unittest.TestCase):
     """
@@ -18,37 +88,38 @@ class TestCopilotRegressionIssues(unittest.TestCase):
     These tests prevent regressions in coordinate parsing logic and regex patterns.
     """
     
-    def setUp(self):
-        """Set up test environment with proper mocks"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test environment with proper mocks once for the class"""
         try:
             from fast_coordinate_detector import COORDINATE_PATTERNS, INVALID_PATTERNS, OptimizedCoordinateParser
-            self.patterns = COORDINATE_PATTERNS
-            self.invalid_patterns = INVALID_PATTERNS
-            self.parser_class = OptimizedCoordinateParser
-            
-            # Create mock objects for coordinate assignment testing
-            self.mock_epsg4326 = "EPSG:4326"  # Simple mock
-            
-            # Mock CoordOrder enum
-            class MockCoordOrder:
-                OrderYX = 0  # "Lat, Lon" order
-                OrderXY = 1  # "Lon, Lat" order
-            self.coord_order = MockCoordOrder()
-            
-            # Mock settings object  
-            class MockSettings:
-                def __init__(self, coord_order):
-                    self.zoomToCoordOrder = coord_order
-            self.mock_settings = MockSettings
-            
-            # Mock smart parser
-            class MockSmartParser:
-                def __init__(self, settings):
-                    self.settings = settings
-            self.mock_smart_parser = MockSmartParser
-            
         except ImportError as e:
-            self.skipTest(f"fast_coordinate_detector not available: {e}")
+            raise unittest.SkipTest(f"fast_coordinate_detector not available: {e}")
+        
+        cls.patterns = COORDINATE_PATTERNS
+        cls.invalid_patterns = INVALID_PATTERNS
+        cls.parser_class = OptimizedCoordinateParser
+        
+        # Create mock objects for coordinate assignment testing
+        cls.mock_epsg4326 = "EPSG:4326"  # Simple mock
+        
+        # Mock CoordOrder enum
+        class MockCoordOrder:
+            OrderYX = 0  # "Lat, Lon" order
+            OrderXY = 1  # "Lon, Lat" order
+        cls.coord_order = MockCoordOrder()
+        
+        # Mock settings object  
+        class MockSettings:
+            def __init__(self, coord_order):
+                self.zoomToCoordOrder = coord_order
+        cls.mock_settings = MockSettings
+        
+        # Mock smart parser
+        class MockSmartParser:
+            def __init__(self, settings):
+                self.settings = settings
+        cls.mock_smart_parser = MockSmartParser
     
     def test_decimal_degrees_regex_leading_decimals_fix(self):
         """
@@ -60,22 +131,15 @@ class TestCopilotRegressionIssues(unittest.TestCase):
         Solution: Updated regex to use \d* before the decimal and \d+ after, allowing leading decimals (e.g., '.5') by permitting zero or more digits before the decimal and requiring at least one digit after.
         """
         pattern = self.patterns['decimal_degrees']
+        fullmatch = pattern.fullmatch  # bound once for the case loops
         # Current regex being tested: r'^[+-]?\d*\.?\d+[\s,;]+[+-]?\d*\.?\d+\s*$'
         
-        # Critical test cases from Copilot review
-        critical_cases = [
-            ('.5, .75', True, 'Leading decimals (Copilot example)'),
-            ('0.5, 0.75', True, 'Standard decimals'),
-            ('45.123, -122.456', True, 'Normal coordinates'),
-        ]
-        
-        for case, should_match, description in critical_cases:
-            with self.subTest(coordinate=case, description=description):
-                match = pattern.match(case)
-                if should_match:
-                    self.assertIsNotNone(match, f"REGRESSION: {description} - '{case}' should match but doesn't")
-                else:
-                    self.assertIsNone(match, f"REGRESSION: {description} - '{case}' should NOT match but does")
+        # One pass over the cases; the message lists every case that regressed.
+        # The patterns end in \s*$, so fullmatch on the right-stripped text
+        # accepts exactly what match() on the raw text does.
+        mismatches = [(case, description) for case, should_match, description in _CRITICAL_CASES
+                      if bool(fullmatch(case.rstrip())) != should_match]
+        self.assertEqual(mismatches, [], f"REGRESSION: cases matched incorrectly: {mismatches}")
     
     def test_coordinate_assignment_logic_fix(self):
         """
@@ -95,15 +159,13 @@ class TestCopilotRegressionIssues(unittest.TestCase):
         - When OrderXY: lat, lon = y, x (first number is lon, second is lat)
         """
         # Test the coordinate assignment logic directly without QGIS dependencies
-        import re
-        
         # Mock the coordinate order enum values (matching actual values from settings.py)
         OrderYX = 0  # "Lat, Lon" input format
         OrderXY = 1  # "Lon, Lat" input format
         
         # Test coordinate input: "45.123, -122.456"
         text = "45.123, -122.456"
-        numbers = re.findall(r'[+-]?\d*\.?\d+(?:[eE][+-]?\d+)?', text)
+        numbers = _NUMBER_RE.findall(text)
         x, y = float(numbers[0]), float(numbers[1])  # x=45.123, y=-122.456
         
         # Test OrderYX logic (INPUT: "Lat, Lon")
@@ -133,7 +195,7 @@ class TestCopilotRegressionIssues(unittest.TestCase):
         
         # Test another case to confirm the logic: "12.34, 56.78" 
         text2 = "12.34, 56.78"
-        numbers2 = re.findall(r'[+-]?\d*\.?\d+(?:[eE][+-]?\d+)?', text2)
+        numbers2 = _NUMBER_RE.findall(text2)
         x2, y2 = float(numbers2[0]), float(numbers2[1])  # x2=12.34, y2=56.78
         
         # OrderYX: "Lat, Lon" input → lat=12.34, lon=56.78
@@ -149,6 +211,36 @@ class TestCopilotRegressionIssues(unittest.TestCase):
         self.assertEqual(lat_xy2, 56.78, "OrderXY: lat should be second number in Lon,Lat format") 
         self.assertEqual(lon_xy2, 12.34, "OrderXY: lon should be first number in Lon,Lat format")
     
+    def test_coordinate_assignment_logic_fix_with_qgis(self):
+        """
+        COPILOT ISSUE #2 against the real parser: whichever input order is
+        configured, the fast decimal parser must end up with valid lat/lon
+        ranges (coordinate validation swaps them when needed)
+        """
+        try:
+            from qgis.core import QgsApplication
+            from smart_parser import SmartCoordinateParser
+        except ImportError:
+            self.skipTest("QGIS environment not available for coordinate assignment test")
+        
+        # Initialize minimal QGIS environment
+        if not QgsApplication.instance():
+            qgs = QgsApplication([], False)
+            qgs.initQgis()
+        
+        smart_parser = SmartCoordinateParser(Mock(), Mock())
+        optimizer = self.parser_class(smart_parser)
+        
+        for coord_order in (self.coord_order.OrderYX, self.coord_order.OrderXY):
+            with self.subTest(coord_order=coord_order):
+                smart_parser.settings.zoomToCoordOrder = coord_order
+                result = optimizer._parse_decimal_degrees_fast('45.123, -122.456')
+                
+                self.assertIsNotNone(result, "Should successfully parse coordinates")
+                lat, lon, bounds, crs = result
+                self.assertTrue(-90 <= lat <= 90, f"Latitude {lat} should be in valid range [-90, 90]")
+                self.assertTrue(-180 <= lon <= 180, f"Longitude {lon} should be in valid range [-180, 180]")
+    
     def test_obviously_projected_pattern_specificity_fix(self):
         """
         COPILOT ISSUE #3: "Obviously projected" pattern too broad
@@ -159,33 +251,17 @@ class TestCopilotRegressionIssues(unittest.TestCase):
         Solution: More specific pattern that targets coordinates with >=1000 in first number
         """
         pattern = self.invalid_patterns['obviously_projected']
+        fullmatch = pattern.fullmatch  # bound once for the case loops
         
         # These should NOT be flagged as "obviously projected" (valid geographic)
-        valid_geographic_cases = [
-            ('45.123456789, -122.456789012', 'Many decimal places'),
-            ('89.999999, 179.999999', 'Near poles with decimals'),
-            ('-89.999999, -179.999999', 'Near poles negative'),
-            ('0.000001, 0.000001', 'Very small valid coordinates'),
-        ]
-        
-        for case, description in valid_geographic_cases:
-            with self.subTest(coordinate=case, description=description):
-                match = pattern.match(case)
-                self.assertIsNone(match, f"REGRESSION: {description} - Valid geographic '{case}' incorrectly flagged as projected")
+        flagged = [(case, description) for case, description in _VALID_GEOGRAPHIC_CASES
+                   if fullmatch(case.rstrip())]
+        self.assertEqual(flagged, [], f"REGRESSION: valid geographic coordinates incorrectly flagged as projected: {flagged}")
         
         # These SHOULD be flagged as "obviously projected"
-        obviously_projected_cases = [
-            ('12345, 67890', 'Large UTM-like numbers'),
-            ('500000, 4000000', 'Typical UTM coordinates'),  
-            ('1234.567, 56789.012', 'UTM with decimals'),
-            ('1234, 5678', 'Consistent 4+ digit pattern'),
-            ('5678, 1234', 'Consistent 4+ digit pattern (reversed)'),
-        ]
-        
-        for case, description in obviously_projected_cases:
-            with self.subTest(coordinate=case, description=description):
-                match = pattern.match(case)
-                self.assertIsNotNone(match, f"REGRESSION: {description} - Obviously projected '{case}' should be detected")
+        missed = [(case, description) for case, description in _OBVIOUSLY_PROJECTED_CASES
+                  if not fullmatch(case.rstrip())]
+        self.assertEqual(missed, [], f"REGRESSION: obviously projected coordinates not detected: {missed}")
     
     def test_exception_handling_logging_improvement(self):
         """
@@ -198,7 +274,7 @@ class TestCopilotRegressionIssues(unittest.TestCase):
         """
         try:
             from parser_service import CoordinateParserService
-            from unittest.mock import Mock, patch, MagicMock
+            from qgis.core import Qgis
             
             # Test that exceptions are logged during cleanup
             mock_settings = Mock()
@@ -222,10 +298,13 @@ class TestCopilotRegressionIssues(unittest.TestCase):
                 # Should have logged the exception
                 self.assertTrue(mock_log.called, "REGRESSION: Exceptions during cleanup should be logged for debugging")
                 
-                # Check that warning message was logged  
-                log_messages = ' '.join([str(call) for call in mock_log.call_args_list])
-                self.assertIn('Warning', log_messages, "REGRESSION: Should log warning about cleanup failure")
-                self.assertIn('Test cleanup exception', log_messages, "REGRESSION: Should log the actual exception message")
+                # Check the logged levels and messages from the call arguments
+                # logMessage(message, tag, level) - level may also be passed by keyword
+                calls = mock_log.call_args_list
+                levels = {call.args[2] if len(call.args) > 2 else call.kwargs.get('level') for call in calls}
+                self.assertIn(Qgis.Warning, levels, "REGRESSION: Should log warning about cleanup failure")
+                self.assertTrue(any(call.args and 'Test cleanup exception' in str(call.args[0]) for call in calls),
+                                "REGRESSION: Should log the actual exception message")
             
             # Cleanup should still succeed despite the exception
             self.assertIsNone(CoordinateParserService._instance, "REGRESSION: Cleanup should complete even with exceptions")
@@ -239,60 +318,34 @@ class TestCopilotRegressionIssues(unittest.TestCase):
         These test boundary conditions that have historically caused issues
         """
         pattern = self.patterns['decimal_degrees']
+        fullmatch = pattern.fullmatch  # bound once for the case loops
         
-        # Edge cases that could break regex patterns
-        boundary_test_cases = [
-            # Leading decimal variations
-            ('.1, .2', True, 'Minimal leading decimals'),
-            ('.999, .888', True, 'Leading decimals close to 1'),
-            ('+.5, -.5', True, 'Signed leading decimals'),
-            
-            # Zero handling  
-            ('0.0, 0.0', True, 'Decimal zeros'),
-            ('0, 0', True, 'Integer zeros'),
-            ('+0, +0', True, 'Explicit positive zeros'),
-            ('-0, -0', True, 'Negative zeros'),
-            
-            # Precision boundaries
-            ('90, 180', True, 'Maximum lat/lon integers'), 
-            ('-90, -180', True, 'Minimum lat/lon integers'),
-            ('89.999999, 179.999999', True, 'Just within decimal bounds'),
-            
-            # Invalid cases that should not match this pattern
-            ('1.2.3, 4.5.6', False, 'Multiple decimal points'),
-            ('45°, 122°', False, 'Degree symbols'),
-            ('', False, 'Empty string'),
-            ('45', False, 'Single coordinate'),
-        ]
-        
-        for case, should_match, description in boundary_test_cases:
-            with self.subTest(coordinate=case, description=description):
-                match = pattern.match(case)
-                if should_match:
-                    self.assertIsNotNone(match, f"REGRESSION: {description} - '{case}' should match")
-                else:
-                    self.assertIsNone(match, f"REGRESSION: {description} - '{case}' should NOT match")
+        mismatches = [(case, description) for case, should_match, description in _BOUNDARY_CASES
+                      if bool(fullmatch(case.rstrip())) != should_match]
+        self.assertEqual(mismatches, [], f"REGRESSION: cases matched incorrectly: {mismatches}")
+
+
+@lru_cache(maxsize=1)
+def _test_method_names():
+    """Test method names of TestCopilotRegressionIssues, collected once"""
+    return tuple(unittest.TestLoader().getTestCaseNames(TestCopilotRegressionIssues))
+
+
+def _build_suite():
+    """Fresh suite from the cached names (a TestSuite drops its tests as it runs them)"""
+    return unittest.TestSuite(map(TestCopilotRegressionIssues, _test_method_names()))
 
 
 def run_copilot_regression_tests():
     """Run Copilot regression tests"""
     # Create test suite
-    loader = unittest.TestLoader()
-    suite = loader.loadTestsFromTestCase(TestCopilotRegressionIssues)
+    suite = _build_suite()
     
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Run tests; per-test lines only for interactive runs, CI logs get the
+    # runner's own failure report without the extra chatter
+    runner = unittest.TextTestRunner(verbosity=2 if sys.stdout.isatty() else 1)
     result = runner.run(suite)
     
-    if result.wasSuccessful():
-        return True
-    else:
-        # Log failures and errors to help with debugging
-        for failure in result.failures:
-            print(f"FAILURE: {failure[0]} - {failure[1]}")
-        for error in result.errors:
-            print(f"ERROR: {error[0]} - {error[1]}")
-    
     return result.wasSuccessful()
 
 
@@ -21,49 +21,76 @@ Each test verifies:
 import sys
 import os
 import math
+import logging
+from collections import namedtuple
+from typing import List, Optional, Sequence, Union
+from functools import cache, lru_cache
 
-# Set up QGIS environment for testing
-import platform
-
-qgis_python_path = os.environ.get("QGIS_PYTHON_PATH")
-if not qgis_python_path:
-    system = platform.system()
-    if system == "Darwin":  # macOS
-        qgis_python_path = "/Applications/QGIS.app/Contents/Resources/python"
-    elif system == "Windows":
-        possible_paths = [
-            r"C:\Program Files\QGIS 3.28\apps\qgis\python",
-            r"C:\Program Files\QGIS 3.22\apps\qgis\python",
-            r"C:\OSGeo4W\apps\qgis\python",
-        ]
-        for path in possible_paths:
-            if os.path.exists(path):
-                qgis_python_path = path
-                break
-    elif system == "Linux":
-        possible_paths = [
-            "/usr/share/qgis/python",
-            "/usr/local/share/qgis/python",
-        ]
-        for path in possible_paths:
-            if os.path.exists(path):
-                qgis_python_path = path
-                break
+# NumPy is optional - fall back to a plain Python tolerance check
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+log = logging.getLogger(__name__)
+_RULE = "=" * 70
+
+
+@cache
+def _find_qgis_python_path():
+    """Locate the QGIS Python bindings; probed on first use, not at import"""
+    import platform
+
+    qgis_python_path = os.environ.get("QGIS_PYTHON_PATH")
+    if not qgis_python_path:
+        system = platform.system()
+        if system == "Darwin":  # macOS
+            qgis_python_path = "/Applications/QGIS.app/Contents/Resources/python"
+        elif system == "Windows":
+            possible_paths = [
+                r"C:\Program Files\QGIS 3.28\apps\qgis\python",
+                r"C:\Program Files\QGIS 3.22\apps\qgis\python",
+                r"C:\OSGeo4W\apps\qgis\python",
+            ]
+            for path in possible_paths:
+                if os.path.exists(path):
+                    qgis_python_path = path
+                    break
+        elif system == "Linux":
+            possible_paths = [
+                "/usr/share/qgis/python",
+                "/usr/local/share/qgis/python",
+            ]
+            for path in possible_paths:
+                if os.path.exists(path):
+                    qgis_python_path = path
+                    break
+
+    if qgis_python_path and os.path.exists(qgis_python_path):
+        sys.path.insert(0, qgis_python_path)
+    return qgis_python_path
+
+
+@cache
+def _qgis_application():
+    """Return QgsApplication, or None when QGIS is not available"""
+    _find_qgis_python_path()
+    try:
+        from qgis.core import QgsApplication  # type: ignore
+    except ImportError:
+        log.info("QGIS not available - using standalone mode")
+        return None
+    return QgsApplication
 
-if qgis_python_path and os.path.exists(qgis_python_path):
-    sys.path.insert(0, qgis_python_path)
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-try:
-    from qgis.core import QgsApplication  # type: ignore
-
-    QGIS_AVAILABLE = True
-except ImportError:
-    QgsApplication = None  # type: ignore
-    QGIS_AVAILABLE = False
-    print("QGIS not available - using standalone mode")
+# One known input-output pair; not named Test* so pytest does not collect it
+LegacyCase = namedtuple("LegacyCase", "input_str lat lon description")
 
 # Test data: known input-output pairs for each format
 # Reference values verified against external sources
@@ -140,6 +167,76 @@ LEGACY_FORMAT_TEST_CASES = {
         ("872834729ffffff", 37.4275, -122.1697, "San Francisco area (res 7)"),
     ],
 }
+# Freeze each format's cases into a tuple of LegacyCase records
+LEGACY_FORMAT_TEST_CASES = {
+    fmt: tuple(LegacyCase(*case) for case in cases)
+    for fmt, cases in LEGACY_FORMAT_TEST_CASES.items()
+}
+
+
+def _mgrs_tolerance(mgrs_str):
+    """Tolerance in degrees from the digits after the grid letters"""
+    # Format: 4QFJ12345678 = 10 digits = 1 meter precision
+    precision = (
+        len(mgrs_str.split("FJ")[-1]) if "FJ" in mgrs_str else len(mgrs_str) - 5
+    )
+    return 0.001 if precision >= 8 else 0.01
+
+
+# MGRS tolerance column, parallel to LEGACY_FORMAT_TEST_CASES["mgrs"]
+MGRS_TOLERANCES = tuple(
+    _mgrs_tolerance(case.input_str) for case in LEGACY_FORMAT_TEST_CASES["mgrs"]
+)
+
+# Display name, section title and tolerance (degrees) for each format
+LegacyFormat = namedtuple("LegacyFormat", "name title tolerance")
+LEGACY_FORMATS = {
+    # MGRS precision varies with string length; 10 digits is ~1 meter
+    "mgrs": LegacyFormat(
+        "MGRS", "Testing MGRS (Military Grid Reference System)", MGRS_TOLERANCES
+    ),
+    # UTM is precise to within a few meters; ~100 meters at equator
+    "utm": LegacyFormat("UTM", "Testing UTM (Universal Transverse Mercator)", 0.001),
+    # Plus Codes are precise to about 1/8° at 10-character length; ~1 km
+    "plus_codes": LegacyFormat(
+        "Plus Codes", "Testing Plus Codes (Open Location Code)", 0.01
+    ),
+    # 6-character geohash: ~1.2 km, 7-character: ~150 m; ~2 km
+    "geohash": LegacyFormat("Geohash", "Testing Geohash", 0.02),
+    # 4-character: ~340x340 km, 6-character: ~10x8 km; ~50 km
+    "maidenhead": LegacyFormat("Maidenhead", "Testing Maidenhead Grid Locator", 0.5),
+    # 8 characters: ~1° precision; ~50 km
+    "georef": LegacyFormat(
+        "GEOREF", "Testing GEOREF (World Geographic Reference System)", 0.5
+    ),
+    # UPS for polar regions; ~10 km
+    "ups": LegacyFormat("UPS", "Testing UPS (Universal Polar Stereographic)", 0.1),
+    # Res 5: ~3 km, res 6: ~1 km, res 7: ~300 m edge length; ~1 km
+    "h3": LegacyFormat(
+        "H3", "Testing H3 (Hexagonal Hierarchical Spatial Index)", 0.01
+    ),
+}
+
+
+class MockSettings:
+    """Read-only settings stub; nothing in the parser mutates it"""
+
+    __slots__ = ()
+    zoomToCoordOrder = "yx"  # Default to YX order
+
+
+class MockIface:
+    __slots__ = ()
+
+
+# Shared by every parser the tests create
+_MOCK_SETTINGS = MockSettings()
+_MOCK_IFACE = MockIface()
+
+
+def _log_banner(title):
+    """Log a section header for one format's test cases"""
+    log.info("\n%s\n%s\n%s", _RULE, title, _RULE)
 
 
 class TestLegacyFormatsEndToEnd:
@@ -147,8 +244,10 @@ class TestLegacyFormatsEndToEnd:
 
     @classmethod
     def setup_class(cls):
-        """Initialize QGIS if available"""
-        if QGIS_AVAILABLE:
+        """Initialize QGIS if available and build the shared parser"""
+        QgsApplication = _qgis_application()
+        if QgsApplication is not None:
+            qgis_python_path = _find_qgis_python_path()
             cls.app = QgsApplication([], False)  # type: ignore
             if qgis_python_path:
                 QgsApplication.setPrefixPath(  # type: ignore
@@ -159,352 +258,194 @@ class TestLegacyFormatsEndToEnd:
         else:
             cls.qgis_initialized = False
 
-    @classmethod
-    def teardown_class(cls):
-        """Clean up QGIS"""
-        if QGIS_AVAILABLE and cls.qgis_initialized:
-            QgsApplication.exitQgis()  # type: ignore
-
-    def setup_method(self):
-        """Set up each test method"""
         # Import parser here so we can handle import errors gracefully
         try:
             from smart_parser import SmartCoordinateParser  # type: ignore
 
-            self.parser_available = True
+            cls.parser_available = True
         except ImportError:
-            self.parser_available = False
+            cls.parser_available = False
             return
 
-        # Create mock settings and interface
-        class MockSettings:
-            zoomToCoordOrder = "yx"  # Default to YX order
+        # One parser shared by every test; the parser is stateless per call
+        cls.mock_settings = _MOCK_SETTINGS
+        cls.mock_iface = _MOCK_IFACE
+        cls.parser = SmartCoordinateParser(cls.mock_settings, cls.mock_iface)
+        # Inputs repeat across the format tests and the cross-contamination
+        # test, so results are memoized for the whole run
+        cls._parse_cached = staticmethod(lru_cache(maxsize=None)(cls.parser.parse))
 
-        class MockIface:
-            pass
+    @classmethod
+    def teardown_class(cls):
+        """Clean up QGIS"""
+        if cls.qgis_initialized:
+            _qgis_application().exitQgis()  # type: ignore
 
-        self.mock_settings = MockSettings()
-        self.mock_iface = MockIface()
-        self.parser = SmartCoordinateParser(self.mock_settings, self.mock_iface)
+    def _parse(self, text: str) -> Optional[tuple]:
+        """Parse through the run-wide cache, keyed on the normalized input"""
+        return self._parse_cached(text.strip())
 
     def _assert_approximate_coords(
-        self, result, expected_lat, expected_lon, tolerance, description
-    ):
+        self,
+        result: Optional[tuple],
+        expected_lat: float,
+        expected_lon: float,
+        tolerance: float,
+        description: str,
+    ) -> None:
         """Helper to assert coordinates are approximately equal"""
         if result is None:
             raise AssertionError(f"{description}: Parser returned None")
 
-        lat, lon, bounds, crs = result
+        lat, lon = result[:2]
 
-        lat_error = abs(lat - expected_lat)
-        lon_error = abs(lon - expected_lon)
-
-        if lat_error > tolerance or lon_error > tolerance:
+        # rel_tol=0 keeps this a pure absolute-difference check
+        if not (
+            math.isclose(lat, expected_lat, rel_tol=0.0, abs_tol=tolerance)
+            and math.isclose(lon, expected_lon, rel_tol=0.0, abs_tol=tolerance)
+        ):
             raise AssertionError(
                 f"{description}:\n"
                 f"  Expected: ({expected_lat:.6f}, {expected_lon:.6f})\n"
                 f"  Got: ({lat:.6f}, {lon:.6f})\n"
-                f"  Lat error: {lat_error:.6f} (tolerance: {tolerance})\n"
-                f"  Lon error: {lon_error:.6f} (tolerance: {tolerance})"
+                f"  Lat error: {abs(lat - expected_lat):.6f} (tolerance: {tolerance})\n"
+                f"  Lon error: {abs(lon - expected_lon):.6f} (tolerance: {tolerance})"
             )
 
-    def test_mgrs_end_to_end(self):
-        """Test MGRS format parsing end-to-end"""
-        if not self.parser_available:
-            print("⚠️ Skipping MGRS test - parser not available")
+    def _within_tolerance(
+        self,
+        results: Sequence[Optional[tuple]],
+        cases: Sequence[LegacyCase],
+        tolerances: Sequence[float],
+    ) -> List[bool]:
+        """Vectorized tolerance check: one bool per case, False if unparsed"""
+        if NUMPY_AVAILABLE:
+            expected = np.array(
+                [(case.lat, case.lon) for case in cases], dtype=float
+            ).reshape(-1, 2)
+            actual = np.array(
+                [r[:2] if r is not None else (np.nan, np.nan) for r in results],
+                dtype=float,
+            ).reshape(-1, 2)
+            err = np.abs(actual - expected)
+            tol = np.array(tolerances, dtype=float)[:, None]
+            # NaN rows (unparsed input) compare False and so fail the mask
+            return np.all(err <= tol, axis=1).tolist()
+
+        return [
+            r is not None
+            and abs(r[0] - case.lat) <= tol
+            and abs(r[1] - case.lon) <= tol
+            for r, case, tol in zip(results, cases, tolerances)
+        ]
+
+    def _check_cases(
+        self,
+        cases: Sequence[LegacyCase],
+        tolerance: Union[float, Sequence[float]],
+    ) -> None:
+        """Parse a batch of cases and fail on the first one out of tolerance
+
+        ``tolerance`` is either one value for the whole batch or one per case.
+        """
+        if isinstance(tolerance, (int, float)):
+            tolerances = [tolerance] * len(cases)
+        else:
+            tolerances = list(tolerance)
+        results = [self._parse(case.input_str) for case in cases]
+        ok = self._within_tolerance(results, cases, tolerances)
+        if all(ok) and not log.isEnabledFor(logging.INFO):
+            # Nothing to report, so skip the per-case walk entirely
             return
 
-        print("\n" + "=" * 70)
-        print("Testing MGRS (Military Grid Reference System)")
-        print("=" * 70)
-
-        # Tolerance: MGRS precision varies with string length
-        # 10-digit MGRS: ~1 meter precision
-        for (
-            mgrs_str,
-            expected_lat,
-            expected_lon,
-            description,
-        ) in LEGACY_FORMAT_TEST_CASES["mgrs"]:
-            print(f"\nTesting: {description}")
-            print(f"  Input: {mgrs_str}")
-
-            result = self.parser.parse(mgrs_str)
-
-            # Calculate tolerance based on precision (digits after grid letters)
-            # Format: 4QFJ12345678 = 10 digits = 1 meter precision
-            precision = (
-                len(mgrs_str.split("FJ")[-1]) if "FJ" in mgrs_str else len(mgrs_str) - 5
-            )
-            tolerance = 0.001 if precision >= 8 else 0.01  # Degrees
+        for case, result, good, tol in zip(cases, results, ok, tolerances):
+            if good:
+                if log.isEnabledFor(logging.INFO):
+                    lat, lon, _, _ = result
+                    log.info(
+                        "\nTesting: %s\n  Input: %s\n  ✅ PASS: lat=%.6f, lon=%.6f",
+                        case.description,
+                        case.input_str,
+                        lat,
+                        lon,
+                    )
+                continue
+
+            log.info("\nTesting: %s\n  Input: %s", case.description, case.input_str)
 
             try:
                 self._assert_approximate_coords(
-                    result, expected_lat, expected_lon, tolerance, description
+                    result, case.lat, case.lon, tol, case.description
                 )
-                lat, lon, _, _ = result
-                print(f"  ✅ PASS: lat={lat:.6f}, lon={lon:.6f}")
             except AssertionError as e:
-                print(f"  ❌ FAIL: {e}")
+                log.error("  ❌ FAIL: %s", e)
                 raise
 
-    def test_utm_end_to_end(self):
-        """Test UTM format parsing end-to-end"""
+    def _run_format(self, fmt):
+        """Parse every case of one format and check it against its tolerance"""
+        legacy_format = LEGACY_FORMATS[fmt]
         if not self.parser_available:
-            print("⚠️ Skipping UTM test - parser not available")
+            log.warning(
+                "⚠️ Skipping %s test - parser not available", legacy_format.name
+            )
             return
 
-        print("\n" + "=" * 70)
-        print("Testing UTM (Universal Transverse Mercator)")
-        print("=" * 70)
-
-        # Tolerance: UTM is precise to within a few meters
-        tolerance = 0.001  # ~100 meters at equator
-
-        for (
-            utm_str,
-            expected_lat,
-            expected_lon,
-            description,
-        ) in LEGACY_FORMAT_TEST_CASES["utm"]:
-            print(f"\nTesting: {description}")
-            print(f"  Input: {utm_str}")
-
-            result = self.parser.parse(utm_str)
+        _log_banner(legacy_format.title)
 
+        if fmt == "h3":
+            # Check if H3 library is available
             try:
-                self._assert_approximate_coords(
-                    result, expected_lat, expected_lon, tolerance, description
+                import h3  # type: ignore  # noqa: F401
+            except ImportError:
+                log.warning(
+                    "⚠️ H3 library not installed - skipping H3 tests\n"
+                    "   Install with: pip install h3"
                 )
-                lat, lon, _, _ = result
-                print(f"  ✅ PASS: lat={lat:.6f}, lon={lon:.6f}")
-            except AssertionError as e:
-                print(f"  ❌ FAIL: {e}")
-                raise
+                return
 
-    def test_plus_codes_end_to_end(self):
-        """Test Plus Codes format parsing end-to-end"""
-        if not self.parser_available:
-            print("⚠️ Skipping Plus Codes test - parser not available")
-            return
-
-        print("\n" + "=" * 70)
-        print("Testing Plus Codes (Open Location Code)")
-        print("=" * 70)
+        self._check_cases(LEGACY_FORMAT_TEST_CASES[fmt], legacy_format.tolerance)
 
-        # Tolerance: Plus Codes are precise to about 1/8° at 10-character length
-        tolerance = 0.01  # ~1 km
-
-        for (
-            plus_code,
-            expected_lat,
-            expected_lon,
-            description,
-        ) in LEGACY_FORMAT_TEST_CASES["plus_codes"]:
-            print(f"\nTesting: {description}")
-            print(f"  Input: {plus_code}")
+    def test_mgrs_end_to_end(self):
+        """Test MGRS format parsing end-to-end"""
+        self._run_format("mgrs")
 
-            result = self.parser.parse(plus_code)
+    def test_utm_end_to_end(self):
+        """Test UTM format parsing end-to-end"""
+        self._run_format("utm")
 
-            try:
-                self._assert_approximate_coords(
-                    result, expected_lat, expected_lon, tolerance, description
-                )
-                lat, lon, _, _ = result
-                print(f"  ✅ PASS: lat={lat:.6f}, lon={lon:.6f}")
-            except AssertionError as e:
-                print(f"  ❌ FAIL: {e}")
-                raise
+    def test_plus_codes_end_to_end(self):
+        """Test Plus Codes format parsing end-to-end"""
+        self._run_format("plus_codes")
 
     def test_geohash_end_to_end(self):
         """Test Geohash format parsing end-to-end"""
-        if not self.parser_available:
-            print("⚠️ Skipping Geohash test - parser not available")
-            return
-
-        print("\n" + "=" * 70)
-        print("Testing Geohash")
-        print("=" * 70)
-
-        # Tolerance: Geohash precision varies with length
-        # 6-character geohash: ~1.2 km precision
-        # 7-character geohash: ~150 m precision
-        tolerance = 0.02  # ~2 km
-
-        for (
-            geohash,
-            expected_lat,
-            expected_lon,
-            description,
-        ) in LEGACY_FORMAT_TEST_CASES["geohash"]:
-            print(f"\nTesting: {description}")
-            print(f"  Input: {geohash}")
-
-            result = self.parser.parse(geohash)
-
-            try:
-                self._assert_approximate_coords(
-                    result, expected_lat, expected_lon, tolerance, description
-                )
-                lat, lon, _, _ = result
-                print(f"  ✅ PASS: lat={lat:.6f}, lon={lon:.6f}")
-            except AssertionError as e:
-                print(f"  ❌ FAIL: {e}")
-                raise
+        self._run_format("geohash")
 
     def test_maidenhead_end_to_end(self):
         """Test Maidenhead Grid format parsing end-to-end"""
-        if not self.parser_available:
-            print("⚠️ Skipping Maidenhead test - parser not available")
-            return
-
-        print("\n" + "=" * 70)
-        print("Testing Maidenhead Grid Locator")
-        print("=" * 70)
-
-        # Tolerance: Maidenhead precision varies
-        # 4-character: ~340x340 km
-        # 6-character: ~10x8 km
-        tolerance = 0.5  # ~50 km
-
-        for (
-            maidenhead,
-            expected_lat,
-            expected_lon,
-            description,
-        ) in LEGACY_FORMAT_TEST_CASES["maidenhead"]:
-            print(f"\nTesting: {description}")
-            print(f"  Input: {maidenhead}")
-
-            result = self.parser.parse(maidenhead)
-
-            try:
-                self._assert_approximate_coords(
-                    result, expected_lat, expected_lon, tolerance, description
-                )
-                lat, lon, _, _ = result
-                print(f"  ✅ PASS: lat={lat:.6f}, lon={lon:.6f}")
-            except AssertionError as e:
-                print(f"  ❌ FAIL: {e}")
-                raise
+        self._run_format("maidenhead")
 
     def test_georef_end_to_end(self):
         """Test GEOREF format parsing end-to-end"""
-        if not self.parser_available:
-            print("⚠️ Skipping GEOREF test - parser not available")
-            return
-
-        print("\n" + "=" * 70)
-        print("Testing GEOREF (World Geographic Reference System)")
-        print("=" * 70)
-
-        # Tolerance: GEOREF precision varies
-        # 8 characters: ~1° precision
-        tolerance = 0.5  # ~50 km
-
-        for georef, expected_lat, expected_lon, description in LEGACY_FORMAT_TEST_CASES[
-            "georef"
-        ]:
-            print(f"\nTesting: {description}")
-            print(f"  Input: {georef}")
-
-            result = self.parser.parse(georef)
-
-            try:
-                self._assert_approximate_coords(
-                    result, expected_lat, expected_lon, tolerance, description
-                )
-                lat, lon, _, _ = result
-                print(f"  ✅ PASS: lat={lat:.6f}, lon={lon:.6f}")
-            except AssertionError as e:
-                print(f"  ❌ FAIL: {e}")
-                raise
+        self._run_format("georef")
 
     def test_ups_end_to_end(self):
         """Test UPS format parsing end-to-end"""
-        if not self.parser_available:
-            print("⚠️ Skipping UPS test - parser not available")
-            return
-
-        print("\n" + "=" * 70)
-        print("Testing UPS (Universal Polar Stereographic)")
-        print("=" * 70)
-
-        # Tolerance: UPS for polar regions
-        tolerance = 0.1  # ~10 km
-
-        for (
-            ups_str,
-            expected_lat,
-            expected_lon,
-            description,
-        ) in LEGACY_FORMAT_TEST_CASES["ups"]:
-            print(f"\nTesting: {description}")
-            print(f"  Input: {ups_str}")
-
-            result = self.parser.parse(ups_str)
-
-            try:
-                self._assert_approximate_coords(
-                    result, expected_lat, expected_lon, tolerance, description
-                )
-                lat, lon, _, _ = result
-                print(f"  ✅ PASS: lat={lat:.6f}, lon={lon:.6f}")
-            except AssertionError as e:
-                print(f"  ❌ FAIL: {e}")
-                raise
+        self._run_format("ups")
 
     def test_h3_end_to_end(self):
         """Test H3 format parsing end-to-end"""
-        if not self.parser_available:
-            print("⚠️ Skipping H3 test - parser not available")
-            return
-
-        print("\n" + "=" * 70)
-        print("Testing H3 (Hexagonal Hierarchical Spatial Index)")
-        print("=" * 70)
-
-        # Check if H3 library is available
-        try:
-            import h3  # type: ignore
-        except ImportError:
-            print("⚠️ H3 library not installed - skipping H3 tests")
-            print("   Install with: pip install h3")
-            return
-
-        # Tolerance: H3 precision varies with resolution
-        # Res 5: ~3 km edge length
-        # Res 6: ~1 km edge length
-        # Res 7: ~300 m edge length
-        tolerance = 0.01  # ~1 km
-
-        for h3_str, expected_lat, expected_lon, description in LEGACY_FORMAT_TEST_CASES[
-            "h3"
-        ]:
-            print(f"\nTesting: {description}")
-            print(f"  Input: {h3_str}")
-
-            result = self.parser.parse(h3_str)
-
-            try:
-                self._assert_approximate_coords(
-                    result, expected_lat, expected_lon, tolerance, description
-                )
-                lat, lon, _, _ = result
-                print(f"  ✅ PASS: lat={lat:.6f}, lon={lon:.6f}")
-            except AssertionError as e:
-                print(f"  ❌ FAIL: {e}")
-                raise
+        self._run_format("h3")
 
     def test_format_cross_contamination(self):
         """Test that formats don't get parsed by the wrong parser"""
         if not self.parser_available:
-            print("⚠️ Skipping cross-contamination test - parser not available")
+            log.warning(
+                "⚠️ Skipping cross-contamination test - parser not available"
+            )
             return
 
-        print("\n" + "=" * 70)
-        print("Testing Format Cross-Contamination Prevention")
-        print("=" * 70)
+        _log_banner("Testing Format Cross-Contamination Prevention")
 
         # These are formats that could potentially be confused
         # Verify they're NOT parsed as a different format
@@ -521,20 +462,54 @@ class TestLegacyFormatsEndToEnd:
         ]
 
         for input_str, expected_format, description in ambiguous_inputs:
-            print(f"\nTesting: {description}")
-            print(f"  Input: {input_str}")
+            log.info("\nTesting: %s\n  Input: %s", description, input_str)
 
-            result = self.parser.parse(input_str)
+            result = self._parse(input_str)
 
             if result is None:
-                print("  ⚠️ WARN: Input not parsed by any parser")
+                log.warning("  ⚠️ WARN: Input not parsed by any parser")
             else:
                 lat, lon, bounds, crs = result
-                print(f"  ✅ PASS: Successfully parsed as lat={lat:.6f}, lon={lon:.6f}")
+                log.info(
+                    "  ✅ PASS: Successfully parsed as lat=%.6f, lon=%.6f", lat, lon
+                )
+
+
+# Outcome of one test method under run_tests(); not named Test* so pytest
+# does not collect it
+RunStatus = namedtuple("RunStatus", "name passed skipped message")
+
 
+def _run_one(test_name, test_func):
+    """Run one test method and return its RunStatus
+
+    The test methods keep pytest's contract and signal failure by raising;
+    this is the only place those exceptions are turned into a status.
+    """
+    passed, skipped, message = True, False, ""
+    try:
+        test_func()
+    except AssertionError as e:
+        passed, message = False, str(e)
+    except Exception as e:
+        passed, skipped, message = False, True, str(e)
+    return RunStatus(test_name, passed, skipped, message)
+
+
+def run_tests(verbose=True):
+    """Run all end-to-end tests
+
+    The tests run one after another: the UTM and UPS paths go through
+    QgsProject.instance() and all tests share the parse cache. Per-case output
+    is logged; it is only shown on stdout when ``verbose``.
+    """
+    if verbose and not log.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+        log.propagate = False
 
-def run_tests():
-    """Run all end-to-end tests"""
     print("\n" + "=" * 70)
     print("LEGACY GRID COORDINATE FORMATS - END-TO-END TESTS")
     print("=" * 70)
@@ -543,33 +518,26 @@ def run_tests():
     test_class.setup_class()
 
     tests = [
-        ("MGRS", test_class.test_mgrs_end_to_end),
-        ("UTM", test_class.test_utm_end_to_end),
-        ("Plus Codes", test_class.test_plus_codes_end_to_end),
-        ("Geohash", test_class.test_geohash_end_to_end),
-        ("Maidenhead", test_class.test_maidenhead_end_to_end),
-        ("GEOREF", test_class.test_georef_end_to_end),
-        ("UPS", test_class.test_ups_end_to_end),
-        ("H3", test_class.test_h3_end_to_end),
-        ("Cross-Contamination", test_class.test_format_cross_contamination),
+        (legacy_format.name, getattr(test_class, f"test_{fmt}_end_to_end"))
+        for fmt, legacy_format in LEGACY_FORMATS.items()
     ]
+    tests.append(("Cross-Contamination", test_class.test_format_cross_contamination))
 
     passed = 0
     failed = 0
     skipped = 0
 
     for test_name, test_func in tests:
-        test_class.setup_method()
-        try:
-            test_func()
+        status = _run_one(test_name, test_func)
+        if status.passed:
             passed += 1
-        except AssertionError as e:
-            failed += 1
-            print(f"\n❌ {test_name} FAILED")
-            print(str(e))
-        except Exception as e:
+        elif status.skipped:
             skipped += 1
-            print(f"\n⚠️ {test_name} SKIPPED: {e}")
+            print(f"\n⚠️ {status.name} SKIPPED: {status.message}")
+        else:
+            failed += 1
+            print(f"\n❌ {status.name} FAILED")
+            print(status.message)
 
     test_class.teardown_class()
 
@@ -585,5 +553,5 @@ def run_tests():
 
 
 if __name__ == "__main__":
-    success = run_tests()
+    success = run_tests(verbose="-q" not in sys.argv[1:])
     sys.exit(0 if success else 1)
@@ -10,86 +10,223 @@ Focus areas:
 - International locations with different conventions
 - Scientific/surveying coordinate formats
 - Batch processing scenarios
+
+Set QGIS_LATLON_TEST_VERBOSE=1 to report every case, not just the totals.
 """
 
 import sys
 import os
+import math
+import re
 import unittest
-from unittest.mock import Mock
+from collections import namedtuple
+from functools import lru_cache
+
+# NumPy is optional - fall back to plain Python range checks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
+# Pre-compiled patterns for the analysis helpers
+# Every match is a valid float literal, so no per-match guards are needed
+_STRICT_NUM_RE = re.compile(r'[-+]?(?:\d+\.\d+|\.\d+|\d+\.?)')
+# In ASCII text every byte that cannot be part of a number only separates
+# numbers, so the translation blanks it
+_SEPARATOR_TABLE = bytes(
+    c if c in b'0123456789.+-' else ord(' ') for c in range(256)
+)
+# Format markers in priority order. A GeoJSON object always contains '"',
+# so the DMS marker shadows it.
+_FORMAT_MARKERS = (
+    ('EWKT', r'SRID='),
+    ('WKT', r'(?i:POINT)'),
+    ('DMS', r'[°′″\'\"]'),
+    ('DMS/Cardinals', r'[NSEW]'),
+    ('Decimal', r'[-+]?\d+\.?\d*[,\s]+[-+]?\d+\.?\d*'),
+)
+# _FORMAT_RES[rank] matches any marker that outranks rank, in one scan
+_FORMAT_RES = tuple(
+    re.compile('|'.join(f'({pattern})' for _, pattern in _FORMAT_MARKERS[:rank]))
+    for rank in range(len(_FORMAT_MARKERS) + 1)
+)
+# Reference form of _contains_coordinate_patterns, kept to check the prefilter
+_CONTAINS_PATTERNS = tuple(re.compile(p) for p in (
+    r'[-+]?\d+\.?\d*',  # Numbers
+    r'[°′″\'\"]',       # Degree symbols
+    r'[NSEW]',          # Cardinals
+    r'POINT',           # WKT
+    r'SRID',            # EWKT
+))
+# Single characters equivalent to the patterns above: any number needs a
+# digit, and 'POINT'/'SRID' always contain a cardinal letter (N, S)
+_COORD_CHARS = frozenset('0123456789°′″\'"NSEW')
+
+def _range_mask(firsts, seconds, first_limit, second_limit):
+    """Element-wise |first| <= first_limit and |second| <= second_limit"""
+    if NUMPY_AVAILABLE:
+        firsts = np.asarray(firsts, dtype=float)
+        seconds = np.asarray(seconds, dtype=float)
+        return ((-first_limit <= firsts) & (firsts <= first_limit) &
+                (-second_limit <= seconds) & (seconds <= second_limit)).tolist()
+    return [-first_limit <= a <= first_limit and -second_limit <= b <= second_limit
+            for a, b in zip(firsts, seconds)]
+
+
+def _coordinate_table(coord_lists):
+    """Stack the first two values of each extraction as rows, NaN-padded"""
+    rows = [(tuple(coords[:2]) + (math.nan, math.nan))[:2] for coords in coord_lists]
+    if NUMPY_AVAILABLE:
+        return np.array(rows, dtype=np.float64).reshape(-1, 2)
+    return rows
+
+
+def _extracted_rows(table):
+    """Number of _coordinate_table rows where anything was extracted"""
+    if NUMPY_AVAILABLE:
+        return int(np.count_nonzero(~np.isnan(table[:, 0])))
+    return sum(not math.isnan(first) for first, _ in table)
+
+
+# Per-case report lines are only built when this is set; the section
+# headers and pass counts are always reported
+_VERBOSE = bool(os.environ.get('QGIS_LATLON_TEST_VERBOSE'))
+
+
+def _write_lines(lines):
+    """Write a test's buffered report lines to stdout in one call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+# Real locations that commonly cause lat/lon confusion; shared, never mutated
+_REAL_WORLD_LOCATIONS = {
+    "Tokyo": {
+        "correct_lat_lon": (35.6762, 139.6503),
+        "correct_lon_lat": (139.6503, 35.6762),
+        "common_inputs": (
+            "35.6762, 139.6503",  # Lat, Lon
+            "139.6503, 35.6762",  # Lon, Lat  
+            "POINT(139.6503 35.6762)",  # WKT standard
+            "POINT(35.6762 139.6503)",  # WKT confused
+            "SRID=4326;POINT(139.6503 35.6762)",  # EWKT correct
+            "SRID=4326;POINT(35.6762 139.6503)",  # EWKT confused
+        )
+    },
+    "New_York": {
+        "correct_lat_lon": (40.7128, -74.0060),
+        "correct_lon_lat": (-74.0060, 40.7128),
+        "common_inputs": (
+            "40.7128, -74.0060",
+            "-74.0060, 40.7128", 
+            "POINT(-74.0060 40.7128)",
+            "POINT(40.7128 -74.0060)",
+            "40°42'46.1\"N 74°00'21.6\"W",  # DMS
+            "18TWN8540011518",  # MGRS
+        )
+    },
+    "London": {
+        "correct_lat_lon": (51.5074, -0.1278),
+        "correct_lon_lat": (-0.1278, 51.5074),
+        "common_inputs": (
+            "51.5074, -0.1278",
+            "-0.1278, 51.5074",
+            "POINT(-0.1278 51.5074)",
+            "POINT(51.5074 -0.1278)",
+        )
+    },
+    "Sydney": {
+        "correct_lat_lon": (-33.8688, 151.2093),
+        "correct_lon_lat": (151.2093, -33.8688),
+        "common_inputs": (
+            "-33.8688, 151.2093",
+            "151.2093, -33.8688",
+            "POINT(151.2093 -33.8688)",
+            "POINT(-33.8688 151.2093)",
+        )
+    },
+    "Null_Island": {
+        "correct_lat_lon": (0.0, 0.0),
+        "correct_lon_lat": (0.0, 0.0),
+        "common_inputs": (
+            "0, 0",
+            "0.0, 0.0", 
+            "POINT(0 0)",
+            "SRID=4326;POINT(0 0)",
+        )
+    }
+}
+# The same inputs as one flat (location, index, input) sequence
+_INTL_CASES = tuple(
+    (location, j, input_text)
+    for location, data in _REAL_WORLD_LOCATIONS.items()
+    for j, input_text in enumerate(data["common_inputs"], 1)
+)
+_INTL_LOCATION_COUNTS = {
+    location: len(data["common_inputs"])
+    for location, data in _REAL_WORLD_LOCATIONS.items()
+}
+
+_AMBIGUOUS_CASES = (
+    # Cases where both lat/lon and lon/lat are geographically valid
+    # (input, lat_lon_location, lon_lat_location, user_preference_matters)
+    ("45.0, 45.0", "Somewhere in Europe/Asia", "Same location", True),
+    ("30.0, 30.0", "Egypt/Algeria region", "Same location", True), 
+    ("45.5, -75.5", "Ottawa area, Canada", "Southern Ocean (also valid)", True),
+    ("-45.5, 75.5", "Southern Ocean", "Northern Antarctica region (also valid)", True),
+    ("10.0, 10.0", "West Africa", "Same location", True),
+    ("60.0, 60.0", "Russia/Northern Europe", "Same location", True),
+
+    # Edge cases near coordinate system boundaries
+    ("89.9, 179.9", "Near North Pole", "Invalid", False),
+    ("-89.9, -179.9", "Near South Pole", "Invalid", False), 
+    ("0.1, 0.1", "West Africa coast", "Same location", True),
+)
+
+
+def _parse_ambiguous_pair(input_coord):
+    """Split a "first, second" input; a failure is returned as its message"""
+    first, sep, second = input_coord.partition(", ")
+    if not sep:
+        return "Could not extract coordinate pair"
+    try:
+        return float(first), float(second)
+    except ValueError:
+        return "Could not parse coordinates"
+
+
+def _validity_table(pairs):
+    """Map each (first, second) pair to (valid as lat/lon, valid as lon/lat)"""
+    parsed = [pair for pair in pairs if not isinstance(pair, str)]
+    firsts = [pair[0] for pair in parsed]
+    seconds = [pair[1] for pair in parsed]
+    return dict(zip(parsed, zip(
+        _range_mask(firsts, seconds, 90, 180),
+        _range_mask(seconds, firsts, 90, 180),
+    )))
+
+
+# The ambiguous cases are fixed, so they are parsed and checked once
+_AMBIGUOUS_PAIRS = tuple(_parse_ambiguous_pair(case[0]) for case in _AMBIGUOUS_CASES)
+_AMBIGUOUS_TRUTH = _validity_table(_AMBIGUOUS_PAIRS)
+
+
 class TestRealWorldCoordinateScenarios(unittest.TestCase):
     """Real-world coordinate input scenarios"""
     
     def setUp(self):
         """Set up test environment"""
-        self.setup_test_data()
-        
-    def setup_test_data(self):
-        """Set up real-world test coordinate data"""
-        # Real locations that commonly cause lat/lon confusion
-        self.real_world_locations = {
-            "Tokyo": {
-                "correct_lat_lon": (35.6762, 139.6503),
-                "correct_lon_lat": (139.6503, 35.6762),
-                "common_inputs": [
-                    "35.6762, 139.6503",  # Lat, Lon
-                    "139.6503, 35.6762",  # Lon, Lat  
-                    "POINT(139.6503 35.6762)",  # WKT standard
-                    "POINT(35.6762 139.6503)",  # WKT confused
-                    "SRID=4326;POINT(139.6503 35.6762)",  # EWKT correct
-                    "SRID=4326;POINT(35.6762 139.6503)",  # EWKT confused
-                ]
-            },
-            "New_York": {
-                "correct_lat_lon": (40.7128, -74.0060),
-                "correct_lon_lat": (-74.0060, 40.7128),
-                "common_inputs": [
-                    "40.7128, -74.0060",
-                    "-74.0060, 40.7128", 
-                    "POINT(-74.0060 40.7128)",
-                    "POINT(40.7128 -74.0060)",
-                    "40°42'46.1\"N 74°00'21.6\"W",  # DMS
-                    "18TWN8540011518",  # MGRS
-                ]
-            },
-            "London": {
-                "correct_lat_lon": (51.5074, -0.1278),
-                "correct_lon_lat": (-0.1278, 51.5074),
-                "common_inputs": [
-                    "51.5074, -0.1278",
-                    "-0.1278, 51.5074",
-                    "POINT(-0.1278 51.5074)",
-                    "POINT(51.5074 -0.1278)",
-                ]
-            },
-            "Sydney": {
-                "correct_lat_lon": (-33.8688, 151.2093),
-                "correct_lon_lat": (151.2093, -33.8688),
-                "common_inputs": [
-                    "-33.8688, 151.2093",
-                    "151.2093, -33.8688",
-                    "POINT(151.2093 -33.8688)",
-                    "POINT(-33.8688 151.2093)",
-                ]
-            },
-            "Null_Island": {
-                "correct_lat_lon": (0.0, 0.0),
-                "correct_lon_lat": (0.0, 0.0),
-                "common_inputs": [
-                    "0, 0",
-                    "0.0, 0.0", 
-                    "POINT(0 0)",
-                    "SRID=4326;POINT(0 0)",
-                ]
-            }
-        }
+        self.real_world_locations = _REAL_WORLD_LOCATIONS
         
     def test_common_copy_paste_scenarios(self):
         """Test coordinates commonly copied from various sources"""
-        print("\n=== COMMON COPY-PASTE SCENARIOS ===")
+        out = []
+        emit = out.append
+        emit("\n=== COMMON COPY-PASTE SCENARIOS ===")
         
         copy_paste_cases = [
             # (source, input, expected_format, description)
@@ -107,123 +244,113 @@ class TestRealWorldCoordinateScenarios(unittest.TestCase):
         total = len(copy_paste_cases)
         
         for i, (source, input_text, expected_format, description) in enumerate(copy_paste_cases, 1):
-            print(f"\nTest {i}: {description}")
-            print(f"  Source: {source}")
-            print(f"  Input: '{input_text}'")
-            print(f"  Expected Format: {expected_format}")
-            
             # Test if input contains expected patterns
             has_coordinates = self._contains_coordinate_patterns(input_text)
-            format_detected = self._detect_likely_format(input_text)
+            if has_coordinates:
+                passed += 1
+            if not _VERBOSE:
+                continue
             
-            print(f"  Detected Format: {format_detected}")
+            emit(f"\nTest {i}: {description}")
+            emit(f"  Source: {source}")
+            emit(f"  Input: '{input_text}'")
+            emit(f"  Expected Format: {expected_format}")
+            emit(f"  Detected Format: {self._detect_likely_format(input_text)}")
             
             if has_coordinates:
-                print(f"  ✅ PASS: Coordinate patterns detected")
-                passed += 1
+                emit(f"  ✅ PASS: Coordinate patterns detected")
             else:
-                print(f"  ❌ FAIL: No coordinate patterns detected")
+                emit(f"  ❌ FAIL: No coordinate patterns detected")
         
-        print(f"\nCopy-Paste Scenarios: {passed}/{total} passed ({passed/total*100:.1f}%)")
+        emit(f"\nCopy-Paste Scenarios: {passed}/{total} passed ({passed/total*100:.1f}%)")
+        _write_lines(out)
         return passed == total
         
     def test_international_location_scenarios(self):
         """Test coordinates from various international locations"""
-        print("\n=== INTERNATIONAL LOCATION SCENARIOS ===")
+        out = []
+        emit = out.append
+        emit("\n=== INTERNATIONAL LOCATION SCENARIOS ===")
         
         passed = 0
         total = 0
         
-        for location, data in self.real_world_locations.items():
-            print(f"\n--- {location.replace('_', ' ')} ---")
-            correct_lat, correct_lon = data["correct_lat_lon"]
+        location_passed = 0
+        for location, j, input_text in _INTL_CASES:
+            if j == 1:
+                location_passed = 0
+            
+            # Analyze what coordinate order this represents
+            format_info = self._analyze_coordinate_input(input_text)
             
-            location_passed = 0
-            location_total = len(data["common_inputs"])
+            # For this test, we're validating the analysis logic
+            recognized = format_info.format != "Unknown"
+            if recognized:
+                location_passed += 1
+            total += 1
             
-            for j, input_text in enumerate(data["common_inputs"], 1):
-                print(f"Test {j}: {input_text}")
-                
-                # Analyze what coordinate order this represents
-                format_info = self._analyze_coordinate_input(input_text)
-                expected_needs_flip = format_info.get("needs_flip", False)
-                
-                print(f"  Format: {format_info['format']}")
-                print(f"  Expected flip needed: {expected_needs_flip}")
-                
-                # For this test, we're validating the analysis logic
-                if format_info["format"] != "Unknown":
-                    print(f"  ✅ PASS: Format recognized")
-                    location_passed += 1
+            if _VERBOSE:
+                if j == 1:
+                    emit(f"\n--- {location.replace('_', ' ')} ---")
+                emit(f"Test {j}: {input_text}")
+                emit(f"  Format: {format_info.format}")
+                emit(f"  Expected flip needed: {format_info.needs_flip}")
+                if recognized:
+                    emit(f"  ✅ PASS: Format recognized")
                 else:
-                    print(f"  ❌ FAIL: Format not recognized")
-                    
-                total += 1
-                
-            print(f"{location}: {location_passed}/{location_total} passed")
-            passed += location_passed
+                    emit(f"  ❌ FAIL: Format not recognized")
             
-        print(f"\nInternational Locations: {passed}/{total} passed ({passed/total*100:.1f}%)")
+            location_total = _INTL_LOCATION_COUNTS[location]
+            if j == location_total:
+                if _VERBOSE:
+                    emit(f"{location}: {location_passed}/{location_total} passed")
+                passed += location_passed
+            
+        emit(f"\nInternational Locations: {passed}/{total} passed ({passed/total*100:.1f}%)")
+        _write_lines(out)
         return passed == total
         
     def test_ambiguous_coordinate_scenarios(self):
         """Test scenarios where coordinate order is genuinely ambiguous"""
-        print("\n=== AMBIGUOUS COORDINATE SCENARIOS ===")
-        
-        ambiguous_cases = [
-            # Cases where both lat/lon and lon/lat are geographically valid
-            # (input, lat_lon_location, lon_lat_location, user_preference_matters)
-            ("45.0, 45.0", "Somewhere in Europe/Asia", "Same location", True),
-            ("30.0, 30.0", "Egypt/Algeria region", "Same location", True), 
-            ("45.5, -75.5", "Ottawa area, Canada", "Southern Ocean (also valid)", True),
-            ("-45.5, 75.5", "Southern Ocean", "Northern Antarctica region (also valid)", True),
-            ("10.0, 10.0", "West Africa", "Same location", True),
-            ("60.0, 60.0", "Russia/Northern Europe", "Same location", True),
-            
-            # Edge cases near coordinate system boundaries
-            ("89.9, 179.9", "Near North Pole", "Invalid", False),
-            ("-89.9, -179.9", "Near South Pole", "Invalid", False), 
-            ("0.1, 0.1", "West Africa coast", "Same location", True),
-        ]
+        out = []
+        emit = out.append
+        emit("\n=== AMBIGUOUS COORDINATE SCENARIOS ===")
         
         passed = 0
-        total = len(ambiguous_cases)
-        
-        for i, (input_coord, lat_lon_desc, lon_lat_desc, preference_matters) in enumerate(ambiguous_cases, 1):
-            print(f"\nTest {i}: {input_coord}")
-            print(f"  As Lat/Lon: {lat_lon_desc}")
-            print(f"  As Lon/Lat: {lon_lat_desc}")
-            print(f"  User preference matters: {preference_matters}")
+        total = len(_AMBIGUOUS_CASES)
+        
+        for i, (case, pair) in enumerate(zip(_AMBIGUOUS_CASES, _AMBIGUOUS_PAIRS), 1):
+            input_coord, lat_lon_desc, lon_lat_desc, preference_matters = case
+            if _VERBOSE:
+                emit(f"\nTest {i}: {input_coord}")
+                emit(f"  As Lat/Lon: {lat_lon_desc}")
+                emit(f"  As Lon/Lat: {lon_lat_desc}")
+                emit(f"  User preference matters: {preference_matters}")
             
-            # Extract coordinates
-            coords = input_coord.split(", ")
-            if len(coords) == 2:
-                try:
-                    coord1, coord2 = float(coords[0]), float(coords[1])
-                    
-                    # Check validity in both orders
-                    lat_lon_valid = self._is_valid_geographic(coord1, coord2)
-                    lon_lat_valid = self._is_valid_geographic(coord2, coord1)
-                    
-                    is_ambiguous = lat_lon_valid and lon_lat_valid
-                    
-                    if is_ambiguous == preference_matters:
-                        print(f"  ✅ PASS: Ambiguity correctly identified")
-                        passed += 1
-                    else:
-                        print(f"  ❌ FAIL: Ambiguity detection mismatch")
-                        
-                except ValueError:
-                    print(f"  ❌ FAIL: Could not parse coordinates")
-            else:
-                print(f"  ❌ FAIL: Could not extract coordinate pair")
+            if isinstance(pair, str):
+                if _VERBOSE:
+                    emit(f"  ❌ FAIL: {pair}")
+                continue
+            
+            lat_lon_valid, lon_lat_valid = _AMBIGUOUS_TRUTH[pair]
+            is_ambiguous = lat_lon_valid and lon_lat_valid
+            
+            if is_ambiguous == preference_matters:
+                passed += 1
+                if _VERBOSE:
+                    emit(f"  ✅ PASS: Ambiguity correctly identified")
+            elif _VERBOSE:
+                emit(f"  ❌ FAIL: Ambiguity detection mismatch")
         
-        print(f"\nAmbiguous Scenarios: {passed}/{total} passed ({passed/total*100:.1f}%)")
+        emit(f"\nAmbiguous Scenarios: {passed}/{total} passed ({passed/total*100:.1f}%)")
+        _write_lines(out)
         return passed == total
         
     def test_batch_processing_scenarios(self):
         """Test scenarios involving multiple coordinate inputs"""
-        print("\n=== BATCH PROCESSING SCENARIOS ===")
+        out = []
+        emit = out.append
+        emit("\n=== BATCH PROCESSING SCENARIOS ===")
         
         batch_scenarios = [
             {
@@ -261,39 +388,40 @@ class TestRealWorldCoordinateScenarios(unittest.TestCase):
         total = len(batch_scenarios)
         
         for i, scenario in enumerate(batch_scenarios, 1):
-            print(f"\nTest {i}: {scenario['name']}")
-            print(f"  Expected: {scenario['expected_consistency']}")
+            infos = [self._analyze_coordinate_input(input_text)
+                     for input_text in scenario['inputs']]
+            formats_detected = [info.format for info in infos]
             
-            formats_detected = []
-            coordinate_pairs = []
-            
-            for input_text in scenario['inputs']:
-                format_info = self._analyze_coordinate_input(input_text)
-                formats_detected.append(format_info['format'])
-                
-                # Try to extract coordinates for consistency check
-                coords = self._extract_any_coordinates(input_text)
-                if coords:
-                    coordinate_pairs.append(coords)
-            
-            print(f"  Formats detected: {', '.join(set(formats_detected))}")
-            print(f"  Coordinate pairs extracted: {len(coordinate_pairs)}")
+            # Reuse the coordinates extracted during the analysis
+            coordinate_pairs = _coordinate_table(info.coords for info in infos)
+            pairs_extracted = _extracted_rows(coordinate_pairs)
             
             # Check for consistency (basic validation)
-            consistency_ok = len(coordinate_pairs) == len(scenario['inputs'])
-            
+            consistency_ok = pairs_extracted == len(scenario['inputs'])
             if consistency_ok:
-                print(f"  ✅ PASS: Consistent batch processing")
                 passed += 1
+            if not _VERBOSE:
+                continue
+            
+            emit(f"\nTest {i}: {scenario['name']}")
+            emit(f"  Expected: {scenario['expected_consistency']}")
+            emit(f"  Formats detected: {', '.join(dict.fromkeys(formats_detected))}")
+            emit(f"  Coordinate pairs extracted: {pairs_extracted}")
+            
+            if consistency_ok:
+                emit(f"  ✅ PASS: Consistent batch processing")
             else:
-                print(f"  ❌ FAIL: Inconsistent batch processing")
+                emit(f"  ❌ FAIL: Inconsistent batch processing")
         
-        print(f"\nBatch Processing: {passed}/{total} passed ({passed/total*100:.1f}%)")
+        emit(f"\nBatch Processing: {passed}/{total} passed ({passed/total*100:.1f}%)")
+        _write_lines(out)
         return passed == total
         
     def test_error_recovery_scenarios(self):
         """Test recovery from common coordinate input errors"""
-        print("\n=== ERROR RECOVERY SCENARIOS ===")
+        out = []
+        emit = out.append
+        emit("\n=== ERROR RECOVERY SCENARIOS ===")
         
         error_cases = [
             # (input, error_type, expected_recovery)
@@ -312,81 +440,67 @@ class TestRealWorldCoordinateScenarios(unittest.TestCase):
         passed = 0
         total = len(error_cases)
         
-        for i, (input_text, error_type, expected_recovery) in enumerate(error_cases, 1):
-            print(f"\nTest {i}: {error_type}")
-            print(f"  Input: '{input_text}'")
-            print(f"  Expected: {expected_recovery}")
+        # Test coordinate extraction with error recovery
+        extracted = [self._extract_any_coordinates(input_text)
+                     for input_text, _, _ in error_cases]
+        # Check if coordinates are in reasonable range, for all cases at once
+        usable = [coords for coords in extracted if len(coords) >= 2]
+        reasonable_mask = iter(_range_mask(
+            [coords[0] for coords in usable], [coords[1] for coords in usable],
+            180, 180,
+        ))
+        
+        for i, (case, coords) in enumerate(zip(error_cases, extracted), 1):
+            input_text, error_type, expected_recovery = case
+            usable_coords = coords and len(coords) >= 2
+            reasonable = usable_coords and next(reasonable_mask)
+            if reasonable:
+                passed += 1
+            if not _VERBOSE:
+                continue
             
-            # Test coordinate extraction with error recovery
-            coords = self._extract_any_coordinates(input_text)
+            emit(f"\nTest {i}: {error_type}")
+            emit(f"  Input: '{input_text}'")
+            emit(f"  Expected: {expected_recovery}")
             
-            if coords and len(coords) >= 2:
-                coord1, coord2 = coords[0], coords[1]
-                # Check if coordinates are in reasonable range
-                reasonable = (-180 <= coord1 <= 180 and -180 <= coord2 <= 180)
-                
-                if reasonable:
-                    print(f"  ✅ PASS: Extracted ({coord1:.6f}, {coord2:.6f})")
-                    passed += 1
-                else:
-                    print(f"  ❌ FAIL: Extracted unreasonable coordinates")
+            if reasonable:
+                emit(f"  ✅ PASS: Extracted ({coords[0]:.6f}, {coords[1]:.6f})")
+            elif usable_coords:
+                emit(f"  ❌ FAIL: Extracted unreasonable coordinates")
             else:
-                print(f"  ❌ FAIL: Could not extract coordinates")
+                emit(f"  ❌ FAIL: Could not extract coordinates")
         
-        print(f"\nError Recovery: {passed}/{total} passed ({passed/total*100:.1f}%)")
+        emit(f"\nError Recovery: {passed}/{total} passed ({passed/total*100:.1f}%)")
+        _write_lines(out)
         return passed == total
         
+    def test_contains_prefilter_matches_regex(self):
+        """The character prefilter agrees with the reference regex patterns"""
+        inputs = [text for data in _REAL_WORLD_LOCATIONS.values()
+                  for text in data["common_inputs"]]
+        inputs += ["", "abc", "POINT", "SRID", "point", "٣٤", "lat: x"]
+        for text in inputs:
+            with self.subTest(text=text):
+                self.assertEqual(
+                    self._contains_coordinate_patterns(text),
+                    any(pattern.search(text) for pattern in _CONTAINS_PATTERNS),
+                )
+
     # Helper methods
     def _contains_coordinate_patterns(self, text):
         """Check if text contains coordinate-like patterns"""
-        import re
-        patterns = [
-            r'[-+]?\d+\.?\d*',  # Numbers
-            r'[°′″\'\"]',       # Degree symbols
-            r'[NSEW]',          # Cardinals
-            r'POINT',           # WKT
-            r'SRID',            # EWKT
-        ]
-        return any(re.search(pattern, text) for pattern in patterns)
+        if not _COORD_CHARS.isdisjoint(text):
+            return True
+        # re's \d also matches non-ASCII decimal digits
+        return not text.isascii() and any(c.isdecimal() for c in text)
         
     def _detect_likely_format(self, text):
         """Detect the likely coordinate format"""
-        import re
-        if re.search(r'SRID=', text):
-            return "EWKT"
-        elif re.search(r'POINT', text, re.IGNORECASE):
-            return "WKT"
-        elif re.search(r'[°′″\'\"]', text):
-            return "DMS"
-        elif re.search(r'[NSEW]', text):
-            return "DMS/Cardinals"
-        elif re.search(r'\{.*"coordinates"', text):
-            return "GeoJSON"
-        elif re.search(r'[-+]?\d+\.?\d*[,\s]+[-+]?\d+\.?\d*', text):
-            return "Decimal"
-        else:
-            return "Unknown"
+        return _detect_likely_format(text)
             
     def _analyze_coordinate_input(self, input_text):
         """Analyze coordinate input for format and potential issues"""
-        format_detected = self._detect_likely_format(input_text)
-        
-        # Simple analysis - in real implementation would be more sophisticated
-        needs_flip = False
-        if format_detected in ["WKT", "EWKT"]:
-            # Check if coordinates might be flipped in WKT
-            coords = self._extract_any_coordinates(input_text)
-            if coords and len(coords) >= 2:
-                x, y = coords[0], coords[1]
-                # If X is in lat range and Y is in lon range, might be flipped
-                if -90 <= x <= 90 and -180 <= y <= 180 and not (-90 <= y <= 90):
-                    needs_flip = True
-        
-        return {
-            "format": format_detected,
-            "needs_flip": needs_flip,
-            "input": input_text
-        }
+        return _analyze_coordinate_input(input_text)
         
     def _is_valid_geographic(self, lat, lon):
         """Check if coordinates are valid geographic coordinates"""
@@ -394,21 +508,65 @@ class TestRealWorldCoordinateScenarios(unittest.TestCase):
         
     def _extract_any_coordinates(self, text):
         """Extract numeric coordinates from any text format"""
-        import re
-        # Find all numbers (including negative)
-        pattern = r'[-+]?\d*\.?\d+'
-        matches = re.findall(pattern, text)
-        
-        coordinates = []
-        for match in matches:
-            if match and match not in ['.', '-', '+', '']:
-                try:
-                    coordinates.append(float(match))
-                except ValueError:
-                    continue
-        
-        return coordinates
+        return _extract_any_coordinates(text)
         
+
+# Analysis helpers are module-level so they can be memoized on the input
+# string; the real-world inputs repeat across scenarios
+FormatInfo = namedtuple('FormatInfo', 'format needs_flip input coords')
+
+
+@lru_cache(maxsize=2048)
+def _detect_likely_format(text):
+    """Detect the likely coordinate format"""
+    # The leftmost marker is found first; later text can only hold a
+    # higher-priority marker, so rescan for those until none is left
+    rank = len(_FORMAT_MARKERS)
+    pos = 0
+    while rank:
+        match = _FORMAT_RES[rank].search(text, pos)
+        if match is None:
+            break
+        rank = match.lastindex - 1
+        pos = match.end()
+    return _FORMAT_MARKERS[rank][0] if rank < len(_FORMAT_MARKERS) else "Unknown"
+
+
+@lru_cache(maxsize=2048)
+def _analyze_coordinate_input(input_text):
+    """Analyze coordinate input for format and potential issues"""
+    format_detected = _detect_likely_format(input_text)
+    
+    # Simple analysis - in real implementation would be more sophisticated
+    coords = _extract_any_coordinates(input_text)
+    needs_flip = False
+    if format_detected in ["WKT", "EWKT"]:
+        # Check if coordinates might be flipped in WKT
+        if coords and len(coords) >= 2:
+            x, y = coords[0], coords[1]
+            # If X is in lat range and Y is in lon range, might be flipped
+            if -90 <= x <= 90 and -180 <= y <= 180 and not (-90 <= y <= 90):
+                needs_flip = True
+    
+    return FormatInfo(format_detected, needs_flip, input_text, coords)
+
+
+@lru_cache(maxsize=2048)
+def _extract_any_coordinates(text):
+    """Extract numeric coordinates from any text format"""
+    # Results are cached and shared, so they are returned as tuples
+    # Fast path: once separators are blanked, ASCII inputs whose tokens are
+    # all plain numbers split directly; tokens float() rejects (stray signs,
+    # repeated dots) and non-ASCII text fall through to the regex
+    if text.isascii():
+        try:
+            return tuple(map(float, text.encode().translate(_SEPARATOR_TABLE).split()))
+        except ValueError:
+            pass
+    # Find all numbers (including negative)
+    return tuple(map(float, _STRICT_NUM_RE.findall(text)))
+
+
 def main():
     """Run real-world coordinate scenario tests"""
     print("🌍 REAL-WORLD COORDINATE SCENARIOS TEST SUITE")
@@ -16,6 +16,92 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 from qgis.core import QgsApplication
 from unittest.mock import Mock
 
+# Parser patterns under test, compiled once for all subTest iterations
+_WS_RE = re.compile(r'\s+')
+_MGRS_RE = re.compile(r'^\d{1,2}[A-Z]{3}\d+$')
+_GEOREF_RE = re.compile(r'^[A-Z]{4}\d{2,}$')
+_PLUS_CODE_RES = tuple(re.compile(p) for p in (
+    r'[23456789CFGHJMPQRVWX]{8}\+[23456789CFGHJMPQRVWX]{2,}',
+    r'[23456789CFGHJMPQRVWX]{6,8}\+[23456789CFGHJMPQRVWX]*',
+    r'[23456789CFGHJMPQRVWX]{2,8}\+[23456789CFGHJMPQRVWX]{1,}',
+))
+_MAIDENHEAD_RE = re.compile(r'^[A-R]{2}\d{2}([A-X]{2}(\d{2})?)?$')
+_GEOHASH_RE = re.compile(r'^[0-9bcdefghjkmnpqrstuvwxyz]+$')
+
+# Test case tables, built once at import
+_MGRS_CASES = (
+    ('18TWN8540011518', True),  # Valid MGRS
+    ('18TWN854001', True),      # Valid shorter MGRS
+    ('18T854001', False),       # Invalid - missing WN
+    ('ABC123', False),          # Invalid format
+    ('18TWN', False),           # Too short
+)
+
+_GEOREF_CASES = (
+    ('GJPJ0615', True),     # Valid GEOREF
+    ('ABCD1234', True),     # Valid format
+    ('ABCD12', True),       # Valid minimum length
+    ('ABC123', False),      # Too short prefix
+    ('ABCDE123', False),    # Too long prefix
+    ('ABCD1', False),       # Too short suffix
+)
+
+_PLUS_CODE_CASES = (
+    ('87G7X2VV+2V', True),      # Full Plus Code
+    ('87G7X2VV+', True),        # Short Plus Code
+    ('X2VV+2V', True),          # Local Plus Code
+    ('G7X2VV+2V', True),        # Medium Plus Code
+    ('87G7X2VV', False),        # Missing + sign
+    ('87G7X2VV+', True),        # Minimal valid
+)
+
+_MAIDENHEAD_CASES = (
+    ('JO65HA', True),       # Standard 6-char
+    ('JO65', True),         # 4-char grid
+    ('JO65HA42', True),     # 8-char precision
+    ('AB12', True),         # Minimal valid
+    ('AB12CD', True),       # 6-char
+    ('A1', False),          # Too short
+    ('AB1', False),         # Invalid format
+    ('AB123', False),       # Invalid format
+)
+
+_GEOHASH_CASES = (
+    ('dr5regy', True),          # Valid geohash
+    ('9q5', True),              # Short valid
+    ('dr5regyre45', True),      # Long valid
+    ('dr5REGY', True),          # Mixed case (should be cleaned)
+    ('dr5 reg y', True),        # With spaces (should be cleaned)
+    ('xyz', False),             # Invalid chars
+    ('dr', False),              # Too short (< 3 chars)
+)
+
+_TEXT_CLEANING_CASES = (
+    ('40.7128, -74.0060', '40.7128,-74.0060'),      # Remove spaces
+    ('40.7128   -74.0060', '40.7128-74.0060'),       # Multiple spaces
+    ('40.7128\t-74.0060', '40.7128-74.0060'),        # Tab characters
+    ('40.7128\n-74.0060', '40.7128-74.0060'),        # Newlines
+)
+
+# These are the critical patterns from the parser
+_PATTERNS_TO_COMPILE = (
+    r'^\d{1,2}[A-Z]{3}\d+$',                                           # MGRS
+    r'^[A-Z]{4}\d{2,}$',                                              # GEOREF  
+    r'[23456789CFGHJMPQRVWX]{8}\+[23456789CFGHJMPQRVWX]{2,}',         # Plus Codes
+    r'^[A-R]{2}\d{2}([A-X]{2}(\d{2})?)?$',                           # Maidenhead
+    r'^[0-9bcdefghjkmnpqrstuvwxyz]+$',                                # Geohash
+    r'\s+',                                                           # Whitespace cleaning
+    r'[-+]?\d*\.?\d+',                                               # Number extraction
+)
+
+_FORMAT_DETECTION_CASES = (
+    ('18TWN8540011518', 'MGRS'),
+    ('GJPJ0615', 'GEOREF'), 
+    ('87G7X2VV+2V', 'Plus Codes'),
+    ('JO65HA', 'Maidenhead'),
+    ('dr5regy', 'Geohash'),
+)
+
 def init_qgis():
     """Initialize QGIS application"""
     QgsApplication.setPrefixPath('/Applications/QGIS.app/Contents', True)
@@ -50,20 +136,12 @@ class TestRegexPatternValidation(unittest.TestCase):
     
     def test_mgrs_pattern_detection(self):
         """Test MGRS regex pattern catches valid MGRS coordinates"""
-        mgrs_cases = [
-            ('18TWN8540011518', True),  # Valid MGRS
-            ('18TWN854001', True),      # Valid shorter MGRS
-            ('18T854001', False),       # Invalid - missing WN
-            ('ABC123', False),          # Invalid format
-            ('18TWN', False),           # Too short
-        ]
-        
-        for mgrs_text, should_match in mgrs_cases:
+        for mgrs_text, should_match in _MGRS_CASES:
             with self.subTest(mgrs=mgrs_text):
                 # Test the actual regex pattern used in parser
                 text_upper = mgrs_text.upper().strip()
-                text_clean = re.sub(r'\s+', '', text_upper)
-                mgrs_pattern = re.match(r'^\d{1,2}[A-Z]{3}\d+$', text_clean)
+                text_clean = ''.join(text_upper.split())
+                mgrs_pattern = _MGRS_RE.match(text_clean)
                 
                 if should_match:
                     self.assertIsNotNone(mgrs_pattern, 
@@ -74,19 +152,10 @@ class TestRegexPatternValidation(unittest.TestCase):
     
     def test_georef_pattern_detection(self):
         """Test GEOREF regex pattern catches valid GEOREF coordinates"""
-        georef_cases = [
-            ('GJPJ0615', True),     # Valid GEOREF
-            ('ABCD1234', True),     # Valid format
-            ('ABCD12', True),       # Valid minimum length
-            ('ABC123', False),      # Too short prefix
-            ('ABCDE123', False),    # Too long prefix
-            ('ABCD1', False),       # Too short suffix
-        ]
-        
-        for georef_text, should_match in georef_cases:
+        for georef_text, should_match in _GEOREF_CASES:
             with self.subTest(georef=georef_text):
                 text_upper = georef_text.upper()
-                georef_pattern = re.match(r'^[A-Z]{4}\d{2,}$', text_upper)
+                georef_pattern = _GEOREF_RE.match(text_upper)
                 
                 if should_match:
                     self.assertIsNotNone(georef_pattern,
@@ -97,28 +166,13 @@ class TestRegexPatternValidation(unittest.TestCase):
     
     def test_plus_codes_pattern_detection(self):
         """Test Plus Codes regex patterns catch valid formats"""
-        plus_codes_patterns = [
-            r'[23456789CFGHJMPQRVWX]{8}\+[23456789CFGHJMPQRVWX]{2,}',
-            r'[23456789CFGHJMPQRVWX]{6,8}\+[23456789CFGHJMPQRVWX]*',
-            r'[23456789CFGHJMPQRVWX]{2,8}\+[23456789CFGHJMPQRVWX]{1,}'
-        ]
-        
-        test_cases = [
-            ('87G7X2VV+2V', True),      # Full Plus Code
-            ('87G7X2VV+', True),        # Short Plus Code
-            ('X2VV+2V', True),          # Local Plus Code
-            ('G7X2VV+2V', True),        # Medium Plus Code
-            ('87G7X2VV', False),        # Missing + sign
-            ('87G7X2VV+', True),        # Minimal valid
-        ]
-        
-        for plus_code, should_match in test_cases:
+        for plus_code, should_match in _PLUS_CODE_CASES:
             with self.subTest(plus_code=plus_code):
                 text_upper = plus_code.upper()
                 
                 matched = False
-                for pattern in plus_codes_patterns:
-                    if re.search(pattern, text_upper):
+                for pattern in _PLUS_CODE_RES:
+                    if pattern.search(text_upper):
                         matched = True
                         break
                 
@@ -131,21 +185,10 @@ class TestRegexPatternValidation(unittest.TestCase):
     
     def test_maidenhead_pattern_detection(self):
         """Test Maidenhead regex pattern catches valid grid references"""
-        maidenhead_cases = [
-            ('JO65HA', True),       # Standard 6-char
-            ('JO65', True),         # 4-char grid
-            ('JO65HA42', True),     # 8-char precision
-            ('AB12', True),         # Minimal valid
-            ('AB12CD', True),       # 6-char
-            ('A1', False),          # Too short
-            ('AB1', False),         # Invalid format
-            ('AB123', False),       # Invalid format
-        ]
-        
-        for maidenhead_text, should_match in maidenhead_cases:
+        for maidenhead_text, should_match in _MAIDENHEAD_CASES:
             with self.subTest(maidenhead=maidenhead_text):
                 text_upper = maidenhead_text.upper()
-                maidenhead_pattern = re.match(r'^[A-R]{2}\d{2}([A-X]{2}(\d{2})?)?$', text_upper)
+                maidenhead_pattern = _MAIDENHEAD_RE.match(text_upper)
                 
                 if should_match:
                     self.assertIsNotNone(maidenhead_pattern,
@@ -156,21 +199,11 @@ class TestRegexPatternValidation(unittest.TestCase):
     
     def test_geohash_pattern_detection(self):
         """Test Geohash regex patterns and cleaning"""
-        geohash_cases = [
-            ('dr5regy', True),          # Valid geohash
-            ('9q5', True),              # Short valid
-            ('dr5regyre45', True),      # Long valid
-            ('dr5REGY', True),          # Mixed case (should be cleaned)
-            ('dr5 reg y', True),        # With spaces (should be cleaned)
-            ('xyz', False),             # Invalid chars
-            ('dr', False),              # Too short (< 3 chars)
-        ]
-        
-        for geohash_text, should_match in geohash_cases:
+        for geohash_text, should_match in _GEOHASH_CASES:
             with self.subTest(geohash=geohash_text):
                 # Test the cleaning regex
-                geohash_clean = re.sub(r'\s+', '', geohash_text.lower())
-                geohash_pattern = re.match(r'^[0-9bcdefghjkmnpqrstuvwxyz]+$', geohash_clean)
+                geohash_clean = ''.join(geohash_text.lower().split())
+                geohash_pattern = _GEOHASH_RE.match(geohash_clean)
                 length_valid = 3 <= len(geohash_clean) <= 12
                 
                 if should_match:
@@ -186,34 +219,16 @@ class TestRegexPatternValidation(unittest.TestCase):
     
     def test_text_cleaning_regex(self):
         """Test text cleaning regex patterns work correctly"""
-        test_cases = [
-            ('40.7128, -74.0060', '40.7128,-74.0060'),      # Remove spaces
-            ('40.7128   -74.0060', '40.7128-74.0060'),       # Multiple spaces
-            ('40.7128\t-74.0060', '40.7128-74.0060'),        # Tab characters
-            ('40.7128\n-74.0060', '40.7128-74.0060'),        # Newlines
-        ]
-        
-        for input_text, expected in test_cases:
+        for input_text, expected in _TEXT_CLEANING_CASES:
             with self.subTest(input=input_text):
                 # Test the cleaning pattern used in parser
-                cleaned = re.sub(r'\s+', '', input_text)
+                cleaned = _WS_RE.sub('', input_text)
                 self.assertEqual(cleaned, expected,
                     f"Text cleaning failed for '{input_text}'")
     
     def test_regex_patterns_are_compiled(self):
         """Test that regex patterns can be compiled without errors"""
-        # These are the critical patterns from the parser
-        patterns_to_test = [
-            r'^\d{1,2}[A-Z]{3}\d+$',                                           # MGRS
-            r'^[A-Z]{4}\d{2,}$',                                              # GEOREF  
-            r'[23456789CFGHJMPQRVWX]{8}\+[23456789CFGHJMPQRVWX]{2,}',         # Plus Codes
-            r'^[A-R]{2}\d{2}([A-X]{2}(\d{2})?)?$',                           # Maidenhead
-            r'^[0-9bcdefghjkmnpqrstuvwxyz]+$',                                # Geohash
-            r'\s+',                                                           # Whitespace cleaning
-            r'[-+]?\d*\.?\d+',                                               # Number extraction
-        ]
-        
-        for pattern in patterns_to_test:
+        for pattern in _PATTERNS_TO_COMPILE:
             with self.subTest(pattern=pattern):
                 try:
                     compiled = re.compile(pattern)
@@ -228,15 +243,7 @@ class TestRegexPatternValidation(unittest.TestCase):
         """Integration test ensuring regex patterns work in actual parser context"""
         
         # Test known formats that should be detected by specific patterns
-        format_tests = [
-            ('18TWN8540011518', 'MGRS'),
-            ('GJPJ0615', 'GEOREF'), 
-            ('87G7X2VV+2V', 'Plus Codes'),
-            ('JO65HA', 'Maidenhead'),
-            ('dr5regy', 'Geohash'),
-        ]
-        
-        for test_input, expected_format in format_tests:
+        for test_input, expected_format in _FORMAT_DETECTION_CASES:
             with self.subTest(input=test_input, format=expected_format):
                 # This should work if regexes are correct
                 result = self.parser._try_existing_formats(test_input)
@@ -7,216 +7,248 @@ Tests all the critical fixes we implemented
 import re
 import math
 
-def test_final_refinements():
-    """Test all the refined edge cases that were previously failing"""
-    
-    print("=" * 80)
-    print("FINAL SMART PARSER REFINEMENT VALIDATION")
-    print("=" * 80)
+# Patterns used by detect_format_refined, compiled once at import.
+# Where any of several patterns decides a branch, they are joined into one
+# alternation so a single scan checks them all
+
+
+def _any_of(patterns, flags=0):
+    """Compile patterns into one regex that matches wherever any of them does"""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), flags)
+
+
+# Strong patterns that clearly indicate DMS format
+_STRONG_DMS_RE = _any_of((
+    r'\d+\s*[°]\s*\d+\s*[′\']\s*[\d.]+\s*[″"]',  # Full DMS: 40°42'46.1"
+    r'\d+\s*[°]\s*[\d.]+\s*[′\']',               # Degree-minute: 40°42.5'
+    r'\d+\s*[°]\s*[\d.]+\s*[″"]',                # Degree-second: 40°42.5"
+    r'[NSEW]\s*\d+[°′″\'"]',                     # Cardinal with degree symbols: N40°
+    r'\d+[°′″\'"]\s*[NSEW]',                     # Degree symbols with cardinal: 40°N
+    r'[NSEW]\d+\s*[°′″\'"]',                     # Cardinal adjacent: N40°
+    r'\d+\s*[°′″\'"]\s*\d+\s*[°′″\'"]',         # Multiple degree symbols: 40°42'
+    r'[\d.]+\s*[°]\s*[\d.-]+\s*[°]',            # Decimal with degree symbols: 40.7128° -74.0060°
+), re.IGNORECASE)
+# Every strong DMS pattern needs one of these; under IGNORECASE [NSEW] also
+# matches the lowercase letters and U+017F (long s)
+_DMS_MARK_CHARS = frozenset('°′″\'"NSEWnsew\u017f')
+_CARDINAL_RE = re.compile(r'[NSEW]')
+_DIGIT_RE = re.compile(r'\d')
+_CARDINAL_STRUCTURE_RE = _any_of((
+    r'[NSEW]\s*\d',          # N40
+    r'\d\s*[NSEW]',          # 40N
+    r'[NSEW]\d+\.\d+',       # N40.5
+    r'\d+\.\d+\s*[NSEW]',    # 40.5N
+))
+_FALSE_POSITIVE_RE = _any_of((
+    r'^[a-z0-9]+$',           # Simple alphanumeric (like geohash)
+    r'^[A-Z]{2}\d{2}[A-Z]*', # Maidenhead pattern
+    r'POINT\s*\(',            # WKT
+    r'SRID=',                 # EWKT
+), re.IGNORECASE)
+_SRID_RE = re.compile(r'SRID=\d+;', re.IGNORECASE)
+_EWKT_POINT_RE = re.compile(r'POINT\s*[ZM]*\s*\(\s*[-+]?\d*\.?\d+\s+[-+]?\d*\.?\d+', re.IGNORECASE)
+# Enhanced WKT validation; every branch is built from the same number and
+# coordinate pair subpatterns
+_FLOAT = r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?'
+_PAIR = rf'{_FLOAT}\s+{_FLOAT}'
+_WKT_RE = _any_of((
+    rf'POINT\s*Z?\s*M?\s*\(\s*{_PAIR}(?:\s+{_FLOAT})*\s*\)',
+    rf'MULTIPOINT\s*\(\s*\(\s*{_PAIR}(?:\s+{_FLOAT})*\s*\)\s*\)',
+    rf'POLYGON\s*\(\s*\(\s*{_PAIR}(?:\s*,\s*{_PAIR})*\s*\)\s*\)',
+), re.IGNORECASE)
+_INCOMPLETE_WKT_RE = re.compile(r'POINT\s*\(', re.IGNORECASE)
+_HEX_CHARS = frozenset('0123456789ABCDEFabcdef')
+_MGRS_RE = re.compile(r'^\d{1,2}[A-Z]{3}\d+$')
+_GEOREF_RE = re.compile(r'^[A-Z]{4}\d{2,}$')
+# Enhanced Plus Codes patterns
+_PLUS_CODE_RE = _any_of((
+    r'[23456789CFGHJMPQRVWX]{8}\+[23456789CFGHJMPQRVWX]{2,}',  # Full code
+    r'[23456789CFGHJMPQRVWX]{6,8}\+[23456789CFGHJMPQRVWX]*',   # Short code
+    r'[23456789CFGHJMPQRVWX]{2,8}\+[23456789CFGHJMPQRVWX]{1,}' # Local code
+))
+_MAIDENHEAD_RE = re.compile(r'^[A-R]{2}\d{2}([A-X]{2}(\d{2})?)?$')
+_GEOHASH_CHARS = frozenset('0123456789bcdefghjkmnpqrstuvwxyz')
+_UTM_RE = re.compile(r'\d{1,2}[A-Z]\s+\d+\s+\d+')
+_UTM_ZONE_RE = re.compile(r'ZONE\s*\d{1,2}')
+_H3_RE = re.compile(r'^[0-9a-fA-F]{15}$')
+_NUM_RE = re.compile(_FLOAT)
+
+def detect_format_refined(text):
+    """Refined format detection with all improvements"""
     
-    def detect_format_refined(text):
-        """Refined format detection with all improvements"""
+    if not text or not isinstance(text, str):
+        return "Invalid"
         
-        if not text or not isinstance(text, str):
-            return "Invalid"
-            
-        text = text.strip()
-        if not text:
-            return "Empty"
-            
-        # DMS Detection (Enhanced with false positive prevention)
-        # Strong patterns that clearly indicate DMS format
-        strong_dms_patterns = [
-            r'\d+\s*[°]\s*\d+\s*[′\']\s*[\d.]+\s*[″"]',  # Full DMS: 40°42'46.1"
-            r'\d+\s*[°]\s*[\d.]+\s*[′\']',               # Degree-minute: 40°42.5'
-            r'\d+\s*[°]\s*[\d.]+\s*[″"]',                # Degree-second: 40°42.5"
-            r'[NSEW]\s*\d+[°′″\'"]',                     # Cardinal with degree symbols: N40°
-            r'\d+[°′″\'"]\s*[NSEW]',                     # Degree symbols with cardinal: 40°N
-            r'[NSEW]\d+\s*[°′″\'"]',                     # Cardinal adjacent: N40°
-            r'\d+\s*[°′″\'"]\s*\d+\s*[°′″\'"]',         # Multiple degree symbols: 40°42'
-            r'[\d.]+\s*[°]\s*[\d.-]+\s*[°]',            # Decimal with degree symbols: 40.7128° -74.0060°
-        ]
+    text = text.strip()
+    if not text:
+        return "Empty"
         
-        # Check for strong DMS patterns first
-        for pattern in strong_dms_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "DMS"
-        
-        # Only check for cardinal directions if they appear in coordinate-like context
-        cardinal_pattern = r'[NSEW]'
-        if re.search(cardinal_pattern, text):
-            # Must have numbers and be in coordinate-like format
-            has_numbers = re.search(r'\d', text)
-            has_coordinate_structure = (
-                re.search(r'[NSEW]\s*\d', text) or          # N40
-                re.search(r'\d\s*[NSEW]', text) or          # 40N  
-                re.search(r'[NSEW]\d+\.\d+', text) or       # N40.5
-                re.search(r'\d+\.\d+\s*[NSEW]', text)       # 40.5N
-            )
+    # DMS Detection (Enhanced with false positive prevention)
+    # Check for strong DMS patterns first, if any DMS mark is present
+    if not _DMS_MARK_CHARS.isdisjoint(text) and _STRONG_DMS_RE.search(text):
+        return "DMS"
+    
+    # Only check for cardinal directions if they appear in coordinate-like context
+    if _CARDINAL_RE.search(text):
+        # Must have numbers and be in coordinate-like format
+        has_numbers = _DIGIT_RE.search(text)
+        has_coordinate_structure = _CARDINAL_STRUCTURE_RE.search(text)
+        
+        if has_numbers and has_coordinate_structure:
+            # Additional check: avoid false positives with other formats
+            if _FALSE_POSITIVE_RE.search(text):
+                return "Unknown"  # Skip DMS detection for these formats
             
-            if has_numbers and has_coordinate_structure:
-                # Additional check: avoid false positives with other formats
-                false_positive_patterns = [
-                    r'^[a-z0-9]+$',           # Simple alphanumeric (like geohash)
-                    r'^[A-Z]{2}\d{2}[A-Z]*', # Maidenhead pattern
-                    r'POINT\s*\(',            # WKT
-                    r'SRID=',                 # EWKT
-                ]
-                
-                for false_pattern in false_positive_patterns:
-                    if re.search(false_pattern, text, re.IGNORECASE):
-                        return "Unknown"  # Skip DMS detection for these formats
-                
-                return "DMS"
-        
-        # Phase 1: Explicit formats with validation
-        if re.search(r'SRID=\d+;', text, re.IGNORECASE):
-            # Check if complete EWKT
-            if re.search(r'POINT\s*[ZM]*\s*\(\s*[-+]?\d*\.?\d+\s+[-+]?\d*\.?\d+', text, re.IGNORECASE):
-                return "EWKT"
-            else:
-                return "Incomplete EWKT"
-        
-        # Enhanced WKT validation
-        wkt_patterns = [
-            r'POINT\s*Z?\s*M?\s*\(\s*[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?\s+[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?(?:\s+[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)*\s*\)',
-            r'MULTIPOINT\s*\(\s*\(\s*[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?\s+[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?(?:\s+[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)*\s*\)\s*\)',
-            r'POLYGON\s*\(\s*\(\s*[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?\s+[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?(?:\s*,\s*[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?\s+[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)*\s*\)\s*\)'
-        ]
-        
-        for pattern in wkt_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return "WKT"
+            return "DMS"
+    
+    # Phase 1: Explicit formats with validation
+    if '=' in text and _SRID_RE.search(text):
+        # Check if complete EWKT
+        if _EWKT_POINT_RE.search(text):
+            return "EWKT"
+        else:
+            return "Incomplete EWKT"
+    
+    # Complete and incomplete WKT both need an opening parenthesis
+    if '(' in text:
+        if _WKT_RE.search(text):
+            return "WKT"
         
         # Check for incomplete WKT
-        if re.search(r'POINT\s*\(', text, re.IGNORECASE):
+        if _INCOMPLETE_WKT_RE.search(text):
             return "Incomplete WKT"
-            
-        # WKB validation
-        hex_clean = re.sub(r'\s+', '', text)
-        if re.match(r'^[0-9A-Fa-f]+$', hex_clean) and len(hex_clean) >= 20:
-            return "WKB"
-        
-        # Phase 2: Existing formats with enhanced precedence
-        text_upper = text.upper().strip()
-        text_clean = re.sub(r'\s+', '', text_upper)
-        
-        # MGRS (most specific first)
-        mgrs_pattern = re.match(r'^\d{1,2}[A-Z]{3}\d+$', text_clean)
-        if mgrs_pattern:
-            return "MGRS"
-        
-        # GEOREF (before geohash)
-        georef_pattern = re.match(r'^[A-Z]{4}\d{2,}$', text_upper)
-        if georef_pattern:
-            return "GEOREF"
-        
-        # Enhanced Plus Codes patterns
-        plus_codes_patterns = [
-            r'[23456789CFGHJMPQRVWX]{8}\+[23456789CFGHJMPQRVWX]{2,}',  # Full code
-            r'[23456789CFGHJMPQRVWX]{6,8}\+[23456789CFGHJMPQRVWX]*',   # Short code
-            r'[23456789CFGHJMPQRVWX]{2,8}\+[23456789CFGHJMPQRVWX]{1,}' # Local code
-        ]
-        
-        for pattern in plus_codes_patterns:
-            if re.search(pattern, text_upper):
-                return "Plus Codes"
-        
-        # Maidenhead (case insensitive, corrected pattern for 2-8 chars)
-        maidenhead_pattern = re.match(r'^[A-R]{2}\d{2}([A-X]{2}(\d{2})?)?$', text_upper)
-        if maidenhead_pattern:
-            return "Maidenhead"
-        
-        # Geohash (conflict avoidance, relaxed length)
-        geohash_clean = re.sub(r'\s+', '', text.lower())
-        geohash_pattern = re.match(r'^[0-9bcdefghjkmnpqrstuvwxyz]+$', geohash_clean)
-        if (geohash_pattern and 
-            3 <= len(geohash_clean) <= 12 and  # Relaxed minimum
-            not mgrs_pattern and
-            not georef_pattern and
-            not maidenhead_pattern):
-            return "Geohash"
-        
-        # UTM patterns
-        if ('UTM' in text_upper or 
-            re.search(r'\d{1,2}[A-Z]\s+\d+\s+\d+', text) or
-            re.search(r'ZONE\s*\d{1,2}', text_upper)):
-            return "UTM"
-        
-        # UPS pattern
-        if 'UPS' in text_upper:
-            return "UPS"
-        
-        # Enhanced GeoJSON validation
-        if (text.strip().startswith('{') and 
-            ('"type"' in text and '"coordinates"' in text) or '"Point"' in text):
-            return "GeoJSON"
-        
-        # H3 pattern
-        if re.match(r'^[0-9a-fA-F]{15}$', text_clean):
-            return "H3"
-        
-        # Phase 3: Basic coordinates
-        numbers = re.findall(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?', text)
-        if len(numbers) >= 2:
-            try:
-                coord1, coord2 = float(numbers[0]), float(numbers[1])
-                if (abs(coord1) <= 90 and abs(coord2) <= 180) or (abs(coord2) <= 90 and abs(coord1) <= 180):
-                    return "Decimal"
-                elif abs(coord1) <= 90000000 and abs(coord2) <= 90000000:
-                    return "Projected"
-            except (ValueError, OverflowError):
-                pass
-        
-        return "Unknown"
-    
-    # Test cases focusing on previously failing edge cases
-    edge_cases = [
-        # Previously failing pattern conflicts (now fixed)
-        ("GJPJ0615", "GEOREF", "GEOREF should have precedence over Geohash"),
-        ("dr5regy", "Geohash", "Geohash should still work"),
-        ("dr5", "Geohash", "Short geohash should now work (relaxed length)"),
-        
-        # Maidenhead case sensitivity (now fixed - using valid 8-char format)
-        ("AB12cd34", "Maidenhead", "Mixed case Maidenhead should work"),
-        ("ab12CD34", "Maidenhead", "Another mixed case Maidenhead"),
-        ("JO65HA", "Maidenhead", "Standard Maidenhead case insensitive"),
-        
-        # Plus Codes enhancements (now fixed)
-        ("87G7X2VV+2V", "Plus Codes", "Full Plus Code"),
-        ("87G7X2VV+", "Plus Codes", "Short Plus Code should now work"),
-        ("X2VV+2V", "Plus Codes", "Local Plus Code"),
         
-        # DMS vs Decimal detection (now enhanced)
-        ("40.7128° -74.0060°", "DMS", "Degree symbols should trigger DMS"),
-        ("40°42'46.1\"N 74°00'21.6\"W", "DMS", "Full DMS notation"),
-        ("N40.7128 W74.0060", "DMS", "Cardinal directions trigger DMS"),
-        ("40.7128, -74.0060", "Decimal", "Plain decimals without symbols"),
-        
-        # Incomplete format validation (now enhanced)
-        ("POINT(", "Incomplete WKT", "Incomplete WKT should be detected"),
-        ("SRID=4326;", "Incomplete EWKT", "Incomplete EWKT should be detected"),
-        ("SRID=4326;POINT(-74.0 40.7)", "EWKT", "Complete EWKT should work"),
-        ("POINT(-74.0 40.7)", "WKT", "Complete WKT should work"),
-        
-        # Geohash length refinements (now relaxed)
-        ("dr5", "Geohash", "3-char geohash should now work"),
-        ("dr5regy", "Geohash", "7-char geohash should work"),
-        ("dr5regydr5regy", "Decimal", "Too long should fall to decimal"),
-        
-        # Edge case coordinates
-        ("90, 180", "Decimal", "Boundary coordinates"),
-        ("-90, -180", "Decimal", "Negative boundary coordinates"),
-        ("0, 0", "Decimal", "Origin coordinates"),
-    ]
+    # Whitespace-free copy (split() drops exactly the characters \s matches).
+    # Case mapping never creates or removes whitespace, so the upper- and
+    # lower-case variants below are derived from the stripped text and
+    # this copy instead of being recomputed
+    compact = ''.join(text.split())
+    
+    # WKB validation
+    if len(compact) >= 20 and _HEX_CHARS.issuperset(compact):
+        return "WKB"
+    
+    # Phase 2: Existing formats with enhanced precedence
+    text_upper = text.upper()
+    text_clean = compact.upper()
+    
+    # MGRS (most specific first)
+    mgrs_pattern = _MGRS_RE.match(text_clean)
+    if mgrs_pattern:
+        return "MGRS"
+    
+    # GEOREF (before geohash)
+    georef_pattern = _GEOREF_RE.match(text_upper)
+    if georef_pattern:
+        return "GEOREF"
+    
+    if _PLUS_CODE_RE.search(text_upper):
+        return "Plus Codes"
+    
+    # Maidenhead (case insensitive, corrected pattern for 2-8 chars)
+    maidenhead_pattern = _MAIDENHEAD_RE.match(text_upper)
+    if maidenhead_pattern:
+        return "Maidenhead"
+    
+    # Geohash (conflict avoidance, relaxed length)
+    geohash_clean = compact.lower()
+    if (3 <= len(geohash_clean) <= 12 and  # Relaxed minimum
+        _GEOHASH_CHARS.issuperset(geohash_clean) and
+        not mgrs_pattern and
+        not georef_pattern and
+        not maidenhead_pattern):
+        return "Geohash"
+    
+    # UTM patterns
+    if ('UTM' in text_upper or 
+        _UTM_RE.search(text) or
+        _UTM_ZONE_RE.search(text_upper)):
+        return "UTM"
+    
+    # UPS pattern
+    if 'UPS' in text_upper:
+        return "UPS"
+    
+    # Enhanced GeoJSON validation
+    if (text.startswith('{') and 
+        ('"type"' in text and '"coordinates"' in text) or '"Point"' in text):
+        return "GeoJSON"
+    
+    # H3 pattern
+    if _H3_RE.match(text_clean):
+        return "H3"
+    
+    # Phase 3: Basic coordinates
+    # Only the first two numbers matter, so stop scanning after them; a text
+    # without any digit fails the first search straight away
+    first = _NUM_RE.search(text)
+    second = first and _NUM_RE.search(text, first.end())
+    if second:
+        try:
+            coord1, coord2 = float(first.group()), float(second.group())
+            if (abs(coord1) <= 90 and abs(coord2) <= 180) or (abs(coord2) <= 90 and abs(coord1) <= 180):
+                return "Decimal"
+            elif abs(coord1) <= 90000000 and abs(coord2) <= 90000000:
+                return "Projected"
+        except (ValueError, OverflowError):
+            pass
+    
+    return "Unknown"
+
+# Test cases focusing on previously failing edge cases
+_EDGE_CASES = (
+    # Previously failing pattern conflicts (now fixed)
+    ("GJPJ0615", "GEOREF", "GEOREF should have precedence over Geohash"),
+    ("dr5regy", "Geohash", "Geohash should still work"),
+    ("dr5", "Geohash", "Short geohash should now work (relaxed length)"),
+
+    # Maidenhead case sensitivity (now fixed - using valid 8-char format)
+    ("AB12cd34", "Maidenhead", "Mixed case Maidenhead should work"),
+    ("ab12CD34", "Maidenhead", "Another mixed case Maidenhead"),
+    ("JO65HA", "Maidenhead", "Standard Maidenhead case insensitive"),
+
+    # Plus Codes enhancements (now fixed)
+    ("87G7X2VV+2V", "Plus Codes", "Full Plus Code"),
+    ("87G7X2VV+", "Plus Codes", "Short Plus Code should now work"),
+    ("X2VV+2V", "Plus Codes", "Local Plus Code"),
+
+    # DMS vs Decimal detection (now enhanced)
+    ("40.7128° -74.0060°", "DMS", "Degree symbols should trigger DMS"),
+    ("40°42'46.1\"N 74°00'21.6\"W", "DMS", "Full DMS notation"),
+    ("N40.7128 W74.0060", "DMS", "Cardinal directions trigger DMS"),
+    ("40.7128, -74.0060", "Decimal", "Plain decimals without symbols"),
+
+    # Incomplete format validation (now enhanced)
+    ("POINT(", "Incomplete WKT", "Incomplete WKT should be detected"),
+    ("SRID=4326;", "Incomplete EWKT", "Incomplete EWKT should be detected"),
+    ("SRID=4326;POINT(-74.0 40.7)", "EWKT", "Complete EWKT should work"),
+    ("POINT(-74.0 40.7)", "WKT", "Complete WKT should work"),
+
+    # Geohash length refinements (now relaxed)
+    ("dr5", "Geohash", "3-char geohash should now work"),
+    ("dr5regy", "Geohash", "7-char geohash should work"),
+    ("dr5regydr5regy", "Decimal", "Too long should fall to decimal"),
+
+    # Edge case coordinates
+    ("90, 180", "Decimal", "Boundary coordinates"),
+    ("-90, -180", "Decimal", "Negative boundary coordinates"),
+    ("0, 0", "Decimal", "Origin coordinates"),
+)
+
+def test_final_refinements():
+    """Test all the refined edge cases that were previously failing"""
+    
+    print("=" * 80)
+    print("FINAL SMART PARSER REFINEMENT VALIDATION")
+    print("=" * 80)
     
     print("Testing Critical Edge Cases (Previously Failing)")
     print("-" * 60)
     
     success_count = 0
-    total_count = len(edge_cases)
+    total_count = len(_EDGE_CASES)
     
-    for i, (input_text, expected, description) in enumerate(edge_cases, 1):
+    for i, (input_text, expected, description) in enumerate(_EDGE_CASES, 1):
         detected = detect_format_refined(input_text)
         
         print(f"\n{i:2d}. {description}")
@@ -251,6 +283,30 @@ def test_final_refinements():
     
     return success_count, total_count
 
+# Test edge cases with enhanced validation
+_VALIDATION_TESTS = (
+    # Boundary cases
+    (90.0, 180.0, "lat_lon", "Maximum valid coordinates"),
+    (-90.0, -180.0, "lat_lon", "Minimum valid coordinates"),
+    (0.0, 0.0, "lat_lon", "Origin coordinates"),
+
+    # Just over boundaries
+    (90.0000001, 180.0, "lat_lon", "Slightly over latitude boundary"),
+    (90.0, 180.0000001, "lat_lon", "Slightly over longitude boundary"),
+
+    # Special numeric values
+    (float('nan'), 40.0, "lat_lon", "NaN coordinate"),
+    (float('inf'), 40.0, "lat_lon", "Infinite coordinate"),
+    (None, 40.0, "lat_lon", "None coordinate"),
+    ("40.0", "-74.0", "lat_lon", "String coordinates"),
+
+    # Ambiguous cases
+    (45.0, 45.0, "lat_lon", "Equal coordinates"),
+    (45.0, -45.0, "lat_lon", "Symmetric coordinates"),
+    (40.7128, -74.0060, "lat_lon", "NYC coordinates - Lat/Lon preference"),
+    (40.7128, -74.0060, "lon_lat", "NYC coordinates - Lon/Lat preference"),
+)
+
 def test_coordinate_validation_refinements():
     """Test coordinate validation improvements"""
     
@@ -309,36 +365,12 @@ def test_coordinate_validation_refinements():
             
             return None, None, f"Invalid: {'; '.join(reasons)}"
     
-    # Test edge cases with enhanced validation
-    validation_tests = [
-        # Boundary cases
-        (90.0, 180.0, "lat_lon", "Maximum valid coordinates"),
-        (-90.0, -180.0, "lat_lon", "Minimum valid coordinates"),
-        (0.0, 0.0, "lat_lon", "Origin coordinates"),
-        
-        # Just over boundaries
-        (90.0000001, 180.0, "lat_lon", "Slightly over latitude boundary"),
-        (90.0, 180.0000001, "lat_lon", "Slightly over longitude boundary"),
-        
-        # Special numeric values
-        (float('nan'), 40.0, "lat_lon", "NaN coordinate"),
-        (float('inf'), 40.0, "lat_lon", "Infinite coordinate"),
-        (None, 40.0, "lat_lon", "None coordinate"),
-        ("40.0", "-74.0", "lat_lon", "String coordinates"),
-        
-        # Ambiguous cases
-        (45.0, 45.0, "lat_lon", "Equal coordinates"),
-        (45.0, -45.0, "lat_lon", "Symmetric coordinates"),
-        (40.7128, -74.0060, "lat_lon", "NYC coordinates - Lat/Lon preference"),
-        (40.7128, -74.0060, "lon_lat", "NYC coordinates - Lon/Lat preference"),
-    ]
-    
     print("Testing Enhanced Coordinate Validation")
     print("-" * 50)
     
     success_count = 0
     
-    for coord1, coord2, preference, description in validation_tests:
+    for coord1, coord2, preference, description in _VALIDATION_TESTS:
         print(f"\nTest: {description}")
         print(f"Input: ({coord1}, {coord2}) with {preference} preference")
         